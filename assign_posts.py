@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Incremental Cluster Assignment
+==============================
+
+Assigns newly published posts to the existing K-means clusters without re-running
+Phase 2. Only posts missing from cluster_labels.csv are embedded; they are mapped
+through the saved preprocessing (scaler / L2 normalization and any pre-reduction),
+assigned to the nearest saved centroid and appended to cluster_labels.csv with
+their distance to that centroid. A full recluster is recommended once too many
+assigned posts fall outside their cluster or the corpus has grown too much.
+
+Usage:
+    python assign_posts.py [--posts-file] [--embeddings-file] [--chunk-long-posts]
+"""
+
+import sys
+import argparse
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import joblib
+import numpy as np
+import pandas as pd
+
+# Load configuration
+import config
+from spherical_kmeans import l2_normalize
+
+# Configure logging
+logging.basicConfig(
+    level=getattr(logging, config.LOG_LEVEL),
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler(Path(config.OUTPUT_DIR) / 'assignment.log'),
+        logging.StreamHandler() if config.LOG_TO_CONSOLE else logging.NullHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+ASSIGNED_EMBEDDINGS_FILENAME = "assigned_embeddings.npz"
+
+
+def load_models(data_dir: Path) -> Tuple[Any, Dict[str, Any]]:
+    """Saved K-means model and the preprocessing it was fitted on"""
+    models_dir = data_dir / "models"
+    model_file = models_dir / "kmeans_model.pkl"
+    preprocessing_file = models_dir / "preprocessing.pkl"
+
+    for path in (model_file, preprocessing_file):
+        if not path.exists():
+            raise FileNotFoundError(f"{path} not found - run clustering_analysis.py with kmeans first")
+
+    return joblib.load(model_file), joblib.load(preprocessing_file)
+
+
+def apply_preprocessing(preprocessing: Dict[str, Any], embeddings: np.ndarray) -> np.ndarray:
+    """Map raw embeddings into the space the centroids live in"""
+    if preprocessing.get('engine') == 'spherical':
+        data = l2_normalize(embeddings)
+        if preprocessing['reducer'] is not None:
+            data = l2_normalize(preprocessing['reducer'].transform(data))
+        return data
+
+    data = preprocessing['scaler'].transform(embeddings)
+    if preprocessing['reducer'] is not None:
+        data = preprocessing['reducer'].transform(data)
+    return data
+
+
+def find_new_posts(posts: pd.DataFrame, cluster_labels: pd.DataFrame) -> pd.DataFrame:
+    """Successfully extracted posts that have no cluster assignment yet"""
+    posts = posts[posts['extraction_success'] == True]
+    known = set(cluster_labels['post_id'].astype(str))
+    return posts[~posts['post_id'].astype(str).isin(known)].copy()
+
+
+def load_assigned_embeddings(data_dir: Path) -> Dict[str, np.ndarray]:
+    """Embeddings of previously assigned posts, keyed by post_id"""
+    path = data_dir / ASSIGNED_EMBEDDINGS_FILENAME
+    if not path.exists():
+        return {}
+    with np.load(path, allow_pickle=False) as stored:
+        return dict(zip(stored['post_ids'].astype(str), stored['embeddings']))
+
+
+def save_assigned_embeddings(data_dir: Path, assigned: Dict[str, np.ndarray]) -> None:
+    np.savez(
+        data_dir / ASSIGNED_EMBEDDINGS_FILENAME,
+        post_ids=np.array(list(assigned), dtype=str),
+        embeddings=np.vstack(list(assigned.values()))
+    )
+
+
+def embed_posts(texts: List[str], chunk_long_posts: bool = False) -> np.ndarray:
+    """Embed only the given posts with the Phase 2 embedder"""
+    from generate_embeddings import BlogPostEmbedder
+
+    embedder = BlogPostEmbedder()
+    return np.vstack([embedder.embed_post(text, chunk_long_posts)[0] for text in texts])
+
+
+def assign_to_centroids(model, data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Nearest centroid and the distance to it for every row"""
+    distances = model.transform(data)
+    labels = distances.argmin(axis=1)
+    return labels, distances[np.arange(len(labels)), labels]
+
+
+def check_drift(cluster_labels: pd.DataFrame) -> Dict[str, Any]:
+    """Compare all incrementally assigned posts against the fitted posts' distance profile"""
+    assigned_mask = cluster_labels['assigned_at'].notna()
+    fitted = cluster_labels[~assigned_mask]
+    assigned = cluster_labels[assigned_mask]
+
+    thresholds = fitted.groupby('kmeans_cluster')['kmeans_distance'].quantile(config.ASSIGN_OUTLIER_QUANTILE)
+    outliers = assigned['kmeans_distance'].to_numpy() > thresholds.reindex(assigned['kmeans_cluster']).to_numpy()
+
+    new_fraction = len(assigned) / max(len(fitted), 1)
+    outlier_fraction = float(outliers.mean()) if len(assigned) else 0.0
+
+    reasons = []
+    if new_fraction > config.ASSIGN_MAX_NEW_FRACTION:
+        reasons.append(f"{len(assigned)} assigned posts are {new_fraction:.0%} of the fitted corpus "
+                       f"(limit {config.ASSIGN_MAX_NEW_FRACTION:.0%})")
+    if outlier_fraction > config.ASSIGN_MAX_OUTLIER_FRACTION:
+        reasons.append(f"{outlier_fraction:.0%} of assigned posts lie beyond their cluster's "
+                       f"{config.ASSIGN_OUTLIER_QUANTILE:.0%} distance quantile "
+                       f"(limit {config.ASSIGN_MAX_OUTLIER_FRACTION:.0%})")
+
+    return {
+        'n_fitted': len(fitted),
+        'n_assigned': len(assigned),
+        'new_fraction': new_fraction,
+        'outlier_fraction': outlier_fraction,
+        'recluster_recommended': bool(reasons),
+        'reasons': reasons
+    }
+
+
+def assign_new_posts(data_dir: str = None, posts_file: str = None, embeddings_file: str = None,
+                     chunk_long_posts: bool = False) -> Dict[str, Any]:
+    """Assign unseen posts to the saved clusters and append them to cluster_labels.csv"""
+    data_dir = Path(data_dir or config.OUTPUT_DIR)
+    labels_file = data_dir / "cluster_labels.csv"
+    if not labels_file.exists():
+        raise FileNotFoundError(f"{labels_file} not found - run clustering_analysis.py first")
+
+    cluster_labels = pd.read_csv(labels_file)
+    if 'kmeans_distance' not in cluster_labels.columns:
+        raise ValueError("cluster_labels.csv has no kmeans_distance column - re-run clustering_analysis.py")
+    if 'assigned_at' not in cluster_labels.columns:
+        cluster_labels['assigned_at'] = np.nan
+
+    posts = pd.read_csv(posts_file or data_dir / "extracted_posts.csv")
+    new_posts = find_new_posts(posts, cluster_labels)
+    if new_posts.empty:
+        logger.info("No new posts to assign")
+        return {'n_new': 0, 'drift': check_drift(cluster_labels)}
+
+    # Embeddings: precomputed file (rows in new-post order), previously stored, or the API
+    post_ids = new_posts['post_id'].astype(str).tolist()
+    assigned_embeddings = load_assigned_embeddings(data_dir)
+    if embeddings_file:
+        embeddings = np.load(embeddings_file)
+        if len(embeddings) != len(new_posts):
+            raise ValueError(f"{embeddings_file} has {len(embeddings)} rows for {len(new_posts)} new posts")
+    else:
+        missing = [i for i, post_id in enumerate(post_ids) if post_id not in assigned_embeddings]
+        if missing:
+            logger.info(f"Embedding {len(missing)} new posts...")
+            embedded = embed_posts(new_posts['extracted_text'].fillna('').iloc[missing].tolist(), chunk_long_posts)
+            assigned_embeddings.update(zip((post_ids[i] for i in missing), embedded))
+        embeddings = np.vstack([assigned_embeddings[post_id] for post_id in post_ids])
+
+    assigned_embeddings.update(zip(post_ids, embeddings))
+    save_assigned_embeddings(data_dir, assigned_embeddings)
+
+    model, preprocessing = load_models(data_dir)
+    labels, distances = assign_to_centroids(model, apply_preprocessing(preprocessing, embeddings))
+
+    new_rows = new_posts[['post_id', 'title']].copy()
+    new_rows['kmeans_cluster'] = labels
+    new_rows['kmeans_distance'] = distances
+    new_rows['assigned_at'] = datetime.now().isoformat(timespec='seconds')
+
+    cluster_labels = pd.concat([cluster_labels, new_rows], ignore_index=True)
+
+    # Only K-means assigns new posts; other algorithms' labels get the noise sentinel and stay integer
+    label_columns = [column for column in cluster_labels.columns if column.endswith('_cluster')]
+    cluster_labels[label_columns] = cluster_labels[label_columns].fillna(-1).astype(int)
+    cluster_labels.to_csv(labels_file, index=False)
+    logger.info(f"Assigned {len(new_rows)} posts and appended them to {labels_file}")
+
+    drift = check_drift(cluster_labels)
+    if drift['recluster_recommended']:
+        logger.warning("Full recluster recommended: " + "; ".join(drift['reasons']))
+
+    return {'n_new': len(new_rows), 'assignments': new_rows, 'drift': drift}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Assign new blog posts to the existing K-means clusters")
+    parser.add_argument('--data-dir', default=config.OUTPUT_DIR, help="Directory containing clustering outputs")
+    parser.add_argument('--posts-file', help="CSV of posts to consider (default: extracted_posts.csv)")
+    parser.add_argument('--embeddings-file', help="Precomputed embeddings for the new posts, in file order")
+    parser.add_argument('--chunk-long-posts', action='store_true', help="Chunk long posts when embedding")
+    parser.add_argument('--update-maps', action='store_true',
+                        help="Also project the new posts into the existing 2-D maps and interactive plots")
+    args = parser.parse_args()
+
+    try:
+        result = assign_new_posts(args.data_dir, args.posts_file, args.embeddings_file, args.chunk_long_posts)
+    except Exception as e:
+        logger.error(f"Assignment failed: {e}")
+        sys.exit(1)
+
+    print("\n" + "=" * 60)
+    print("INCREMENTAL ASSIGNMENT SUMMARY")
+    print("=" * 60)
+    print(f"New posts assigned: {result['n_new']}")
+    if result['n_new']:
+        for _, row in result['assignments'].iterrows():
+            print(f"  {row['post_id']}: cluster {row['kmeans_cluster']} "
+                  f"(distance {row['kmeans_distance']:.3f}) - {row['title']}")
+
+    if args.update_maps and result['n_new']:
+        # Imported lazily: plotting libraries are only needed for the map update
+        from visualize_clusters import update_maps_with_new_posts
+        update = update_maps_with_new_posts(args.data_dir)
+        print(f"Projected into the {', '.join(update['methods'])} maps "
+              f"in {update['projection_seconds'] * 1000:.0f} ms")
+
+    drift = result['drift']
+    print(f"\nAssigned since last fit: {drift['n_assigned']} "
+          f"({drift['new_fraction']:.1%} of corpus, {drift['outlier_fraction']:.1%} outliers)")
+    if drift['recluster_recommended']:
+        print("Full recluster recommended (python run_phase2.py):")
+        for reason in drift['reasons']:
+            print(f"  - {reason}")
+
+
+if __name__ == "__main__":
+    main()
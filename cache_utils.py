@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Cache Utilities
+===============
+
+Small helpers shared by the clustering and visualization scripts for building
+stable cache keys from embedding matrices and parameter settings.
+"""
+
+import hashlib
+import json
+from typing import Any
+
+import numpy as np
+
+
+def array_fingerprint(array: np.ndarray) -> str:
+    """Return a stable hash of an array's shape, dtype and contents"""
+    array = np.ascontiguousarray(array)
+    digest = hashlib.sha256()
+    digest.update(str(array.shape).encode())
+    digest.update(str(array.dtype).encode())
+    digest.update(array.data)
+    return digest.hexdigest()[:16]
+
+
+def params_fingerprint(**params: Any) -> str:
+    """Return a stable hash of a set of keyword parameters"""
+    payload = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def texts_fingerprint(texts) -> str:
+    """Return a stable hash of a sequence of strings"""
+    digest = hashlib.sha256()
+    for text in texts:
+        digest.update(str(text).encode('utf-8', errors='replace'))
+        digest.update(b'\0')
+    return digest.hexdigest()[:16]
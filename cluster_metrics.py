@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Cluster Quality Metrics
+=======================
+
+Silhouette, Calinski-Harabasz and Davies-Bouldin scores from one evaluation
+engine. A first pass over the rows accumulates per-cluster sums, so centroids
+and the Calinski-Harabasz dispersions come for free; a second chunked pass
+computes each row's distances to every other row (silhouette) and to its own
+centroid (Davies-Bouldin scatter) at the same time. Memory is bounded by the
+chunk of pairwise distances (config.METRICS_WORKING_MEMORY_MB), never N x N.
+
+For very large N the silhouette is estimated from a random subset of rows
+(each still compared against all rows) and reported with a 95% confidence
+interval. Scores match sklearn.metrics for the same inputs.
+"""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.metrics import pairwise_distances
+
+# Load configuration
+import config
+
+
+def _chunk_rows(n_rows: int, itemsize: int, working_memory_mb: float = None) -> int:
+    """Rows per chunk so that a chunk of distances to n_rows points fits the memory budget"""
+    working_memory_mb = working_memory_mb or config.METRICS_WORKING_MEMORY_MB
+    return max(1, int(working_memory_mb * 1024 * 1024 // (max(n_rows, 1) * itemsize)))
+
+
+def _default_sample_size(n_rows: int) -> Optional[int]:
+    """Silhouette sample size for n_rows under the config thresholds (None = exact)"""
+    if n_rows > config.METRICS_EXACT_SILHOUETTE_MAX_ROWS:
+        return config.METRICS_SILHOUETTE_SAMPLE_SIZE
+    return None
+
+
+def evaluate_clustering(data: np.ndarray, labels: np.ndarray, metric: str = 'euclidean',
+                        sample_size: Optional[int] = -1, random_state: int = 42,
+                        working_memory_mb: float = None) -> Dict[str, Any]:
+    """All three quality scores for one labeling (noise rows must already be removed)
+
+    The silhouette uses `metric`; Calinski-Harabasz and Davies-Bouldin are euclidean,
+    as in scikit-learn. sample_size=-1 applies the config thresholds, None forces an
+    exact silhouette, and an integer estimates it from that many rows.
+    """
+    data = np.asarray(data)
+    if data.dtype not in (np.float32, np.float64):
+        data = data.astype(np.float64)
+    cluster_ids, labels = np.unique(np.asarray(labels), return_inverse=True)
+    n_rows, n_clusters = len(labels), len(cluster_ids)
+    if not 1 < n_clusters < n_rows:
+        raise ValueError(f"Number of labels is {n_clusters}. Valid values are 2 to n_samples - 1 (inclusive)")
+
+    # Pass 1: per-cluster sums -> centroids and the between-cluster dispersion
+    counts = np.bincount(labels, minlength=n_clusters).astype(np.float64)
+    indicator = csr_matrix((np.ones(n_rows), (labels, np.arange(n_rows))), shape=(n_clusters, n_rows))
+    sums = np.asarray(indicator @ data.astype(np.float64, copy=False))
+    centroids = sums / counts[:, None]
+    mean = sums.sum(axis=0) / n_rows
+    extra_disp = float(np.sum(counts * np.sum((centroids - mean) ** 2, axis=1)))
+
+    # Rows whose silhouette is evaluated
+    if sample_size == -1:
+        sample_size = _default_sample_size(n_rows)
+    if sample_size is not None and sample_size < n_rows:
+        rows = np.sort(np.random.RandomState(random_state).choice(n_rows, sample_size, replace=False))
+    else:
+        rows = None
+    silhouette_rows = np.arange(n_rows) if rows is None else rows
+
+    # Pass 2 (chunked): distances to all rows, summed per cluster, plus distance to own centroid
+    member_matrix = indicator.T.tocsr().astype(data.dtype)
+    cluster_distance_sums = np.empty((len(silhouette_rows), n_clusters))
+    chunk = _chunk_rows(n_rows, data.dtype.itemsize, working_memory_mb)
+    for start in range(0, len(silhouette_rows), chunk):
+        batch = silhouette_rows[start:start + chunk]
+        distances = pairwise_distances(data[batch], data, metric=metric)
+        cluster_distance_sums[start:start + len(batch)] = np.asarray((member_matrix.T @ distances.T).T)
+
+    centroid_distances = np.empty(n_rows)
+    chunk = max(1, _chunk_rows(n_clusters, 8, working_memory_mb))
+    for start in range(0, n_rows, chunk):
+        batch = slice(start, start + chunk)
+        centroid_distances[batch] = np.linalg.norm(data[batch] - centroids[labels[batch]], axis=1)
+
+    # Silhouette per evaluated row (singletons score 0, as in scikit-learn)
+    own = labels[silhouette_rows]
+    own_counts = counts[own]
+    intra = cluster_distance_sums[np.arange(len(silhouette_rows)), own] / np.maximum(own_counts - 1, 1)
+    mean_to_clusters = cluster_distance_sums / counts
+    mean_to_clusters[np.arange(len(silhouette_rows)), own] = np.inf
+    nearest = mean_to_clusters.min(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        row_scores = np.nan_to_num((nearest - intra) / np.maximum(intra, nearest))
+    row_scores[own_counts == 1] = 0.0
+
+    # Calinski-Harabasz and Davies-Bouldin from the shared centroids
+    intra_disp = float(np.sum(centroid_distances ** 2))
+    calinski_harabasz = (
+        1.0 if intra_disp == 0 else extra_disp * (n_rows - n_clusters) / (intra_disp * (n_clusters - 1))
+    )
+
+    scatter = np.bincount(labels, weights=centroid_distances, minlength=n_clusters) / counts
+    centroid_gaps = pairwise_distances(centroids)
+    if np.allclose(scatter, 0) or np.allclose(centroid_gaps, 0):
+        davies_bouldin = 0.0
+    else:
+        centroid_gaps[centroid_gaps == 0] = np.inf
+        ratios = (scatter[:, None] + scatter[None, :]) / centroid_gaps
+        davies_bouldin = float(np.mean(np.max(ratios, axis=1)))
+
+    metrics = {
+        'silhouette_score': float(row_scores.mean()),
+        'calinski_harabasz_score': float(calinski_harabasz),
+        'davies_bouldin_score': davies_bouldin
+    }
+    if rows is not None:
+        half_width = 1.96 * row_scores.std(ddof=1) / np.sqrt(len(row_scores))
+        metrics['silhouette_ci'] = [
+            float(metrics['silhouette_score'] - half_width), float(metrics['silhouette_score'] + half_width)
+        ]
+        metrics['silhouette_sample_size'] = len(row_scores)
+    return metrics
+
+
+def silhouette(data: np.ndarray, labels: np.ndarray, metric: str = 'euclidean',
+               sample_size: Optional[int] = -1, random_state: int = 42) -> float:
+    """Mean silhouette from the chunked engine"""
+    return evaluate_clustering(data, labels, metric, sample_size, random_state)['silhouette_score']
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Bootstrap Cluster Stability
+===========================
+
+Measures how reproducible the K-means clusters are. The model is refitted on many
+random subsamples of the (already preprocessed / reduced) embeddings, each run
+warm-started from the reference centroids, in parallel across cores. For every
+reference cluster the mean best-match Jaccard similarity over resamples is reported
+(computed on the rows each resample actually saw; >= 0.75 is conventionally
+"stable", < 0.5 "dissolved"), and for every post the fraction of its reference
+cluster-mates it stays co-assigned with across resamples.
+
+Warm starts make 100 resamples cheap, but they also pull every refit towards the
+reference solution, so the scores are an optimistic bound on stability.
+"""
+
+import logging
+from typing import Any, Dict, Tuple
+
+import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
+from sklearn.cluster import KMeans
+from threadpoolctl import threadpool_limits
+import joblib
+
+# Load configuration
+import config
+from spherical_kmeans import SphericalKMeans
+
+logger = logging.getLogger(__name__)
+
+
+def _refit_on_subsample(data: np.ndarray, centroids: np.ndarray, sample_idx: np.ndarray,
+                        spherical: bool, blas_threads: int) -> np.ndarray:
+    """Refit K-means on one subsample from the reference centroids and label every row"""
+    with threadpool_limits(limits=blas_threads):
+        if spherical:
+            model = SphericalKMeans(n_clusters=len(centroids), init=centroids)
+        else:
+            model = KMeans(n_clusters=len(centroids), init=centroids, n_init=1)
+        model.fit(data[sample_idx])
+        return model.predict(data).astype(np.int32)
+
+
+def bootstrap_labels(data: np.ndarray, centroids: np.ndarray, n_resamples: int = None,
+                     sample_fraction: float = None, spherical: bool = False, n_jobs: int = None,
+                     random_state: int = 42) -> Tuple[np.ndarray, np.ndarray]:
+    """Labels of every row under each resample, plus a mask of the rows each resample was fitted on"""
+    n_resamples = n_resamples or config.STABILITY_RESAMPLES
+    sample_fraction = sample_fraction or config.STABILITY_SAMPLE_FRACTION
+    n_jobs = n_jobs if n_jobs is not None else config.CLUSTERING_N_JOBS
+
+    n_rows = len(data)
+    sample_size = max(len(centroids), int(round(n_rows * sample_fraction)))
+    rng = np.random.RandomState(random_state)
+    samples = [np.sort(rng.choice(n_rows, sample_size, replace=False)) for _ in range(n_resamples)]
+
+    blas_threads = max(1, joblib.cpu_count() // max(1, effective_n_jobs(n_jobs)))
+    logger.info(f"Refitting {len(centroids)} clusters on {n_resamples} subsamples of {sample_size} rows "
+                f"({effective_n_jobs(n_jobs)} workers)...")
+    labels = Parallel(n_jobs=n_jobs)(
+        delayed(_refit_on_subsample)(data, centroids, sample_idx, spherical, blas_threads)
+        for sample_idx in samples
+    )
+
+    in_sample = np.zeros((n_resamples, n_rows), dtype=bool)
+    for run, sample_idx in enumerate(samples):
+        in_sample[run, sample_idx] = True
+    return np.vstack(labels), in_sample
+
+
+def _contingency(reference: np.ndarray, labels: np.ndarray, n_reference: int, n_labels: int) -> np.ndarray:
+    """n_reference x n_labels counts of (reference cluster, other cluster) pairs"""
+    return np.bincount(reference * n_labels + labels, minlength=n_reference * n_labels).reshape(n_reference, n_labels)
+
+
+def cluster_jaccard(reference: np.ndarray, resample_labels: np.ndarray, in_sample: np.ndarray) -> np.ndarray:
+    """Mean over resamples of each reference cluster's best Jaccard match (on in-sample rows)"""
+    n_clusters = int(max(reference.max(), resample_labels.max())) + 1
+    jaccard = np.full((len(resample_labels), n_clusters), np.nan)
+
+    for run, (labels, mask) in enumerate(zip(resample_labels, in_sample)):
+        counts = _contingency(reference[mask], labels[mask], n_clusters, n_clusters)
+        union = counts.sum(axis=1)[:, None] + counts.sum(axis=0)[None, :] - counts
+        with np.errstate(invalid='ignore', divide='ignore'):
+            best = np.max(np.where(union > 0, counts / union, 0.0), axis=1)
+        present = counts.sum(axis=1) > 0
+        jaccard[run, present] = best[present]
+
+    with np.errstate(invalid='ignore'):
+        return np.nanmean(jaccard, axis=0)
+
+
+def coassignment_confidence(reference: np.ndarray, label_sets: np.ndarray, weights: np.ndarray = None) -> np.ndarray:
+    """Per post: (weighted) mean share of its reference cluster-mates that share its cluster in each label set
+
+    A post labelled as noise (-1) in a label set shares a cluster with nobody there.
+    """
+    n_reference = int(reference.max()) + 1
+    cluster_sizes = np.bincount(reference, minlength=n_reference)
+    mates = np.maximum(cluster_sizes[reference] - 1, 1)
+    weights = np.ones(len(label_sets)) if weights is None else np.asarray(weights, dtype=np.float64)
+
+    confidence = np.zeros(len(reference))
+    for labels, weight in zip(label_sets, weights):
+        clustered = labels >= 0
+        counts = _contingency(reference[clustered], labels[clustered], n_reference, int(labels.max()) + 1)
+        shared = np.zeros(len(reference))
+        shared[clustered] = counts[reference[clustered], labels[clustered]] - 1
+        confidence += weight * shared / mates
+    confidence /= weights.sum()
+
+    # Singleton clusters are trivially co-assigned with themselves
+    confidence[cluster_sizes[reference] == 1] = 1.0
+    return confidence
+
+
+def bootstrap_stability(data: np.ndarray, reference: np.ndarray, centroids: np.ndarray,
+                        n_resamples: int = None, sample_fraction: float = None,
+                        spherical: bool = False, n_jobs: int = None, random_state: int = 42) -> Dict[str, Any]:
+    """Per-cluster Jaccard stability and per-post confidence for one K-means solution"""
+    n_resamples = n_resamples or config.STABILITY_RESAMPLES
+    sample_fraction = sample_fraction or config.STABILITY_SAMPLE_FRACTION
+    reference = np.asarray(reference, dtype=np.int32)
+
+    resample_labels, in_sample = bootstrap_labels(
+        data, centroids, n_resamples, sample_fraction, spherical, n_jobs, random_state
+    )
+    jaccard = cluster_jaccard(reference, resample_labels, in_sample)
+    confidence = coassignment_confidence(reference, resample_labels)
+
+    cluster_ids = np.unique(reference)
+    cluster_jaccard_scores = {int(c): float(jaccard[c]) for c in cluster_ids}
+    stable = [c for c, score in cluster_jaccard_scores.items() if score >= config.STABILITY_STABLE_JACCARD]
+
+    logger.info(f"Stability: mean Jaccard {np.nanmean(jaccard[cluster_ids]):.3f}, "
+                f"{len(stable)}/{len(cluster_ids)} clusters stable")
+    return {
+        'n_resamples': n_resamples,
+        'sample_fraction': sample_fraction,
+        'cluster_jaccard': cluster_jaccard_scores,
+        'mean_jaccard': float(np.nanmean(jaccard[cluster_ids])),
+        'stable_clusters': stable,
+        'mean_confidence': float(confidence.mean()),
+        'confidence': confidence,
+        'bootstrap_labels': resample_labels
+    }
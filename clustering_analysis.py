@@ -17,18 +17,24 @@ import argparse
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any
-import json
+from typing import List, Dict, Tuple, Optional, Any, Callable, Union
+import functools
+import math
+import time
 import logging
 from datetime import datetime
 from collections import Counter
 import joblib
+from joblib import Parallel, delayed, effective_n_jobs
+from threadpoolctl import threadpool_limits
 
 # Machine learning imports
-from sklearn.cluster import KMeans, AgglomerativeClustering, DBSCAN
-from sklearn.metrics import silhouette_score, calinski_harabasz_score, davies_bouldin_score
+from sklearn.cluster import KMeans, MiniBatchKMeans, DBSCAN
 from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
+from sklearn.decomposition import PCA, TruncatedSVD
+from sklearn.random_projection import GaussianRandomProjection
+from sklearn.neighbors import NearestNeighbors, sort_graph_by_row_values
+from scipy.sparse import csr_matrix
 from scipy.cluster.hierarchy import dendrogram, linkage
 from scipy.spatial.distance import pdist, squareform
 
@@ -36,19 +42,19 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from tqdm import tqdm
 
-# Text analysis imports
-try:
-    import nltk
-    from nltk.corpus import stopwords
-    from nltk.tokenize import word_tokenize
-    from collections import Counter
-    import re
-except ImportError:
-    print("Warning: NLTK not available, text analysis features will be limited")
-    nltk = None
-
 # Load configuration
 import config
+from cache_utils import array_fingerprint, params_fingerprint
+from fit_cache import FitCache
+from results_store import save_results
+from term_matrix import CorpusTermMatrix, tokenize
+from spherical_kmeans import SphericalKMeans, l2_normalize
+from cluster_metrics import evaluate_clustering, silhouette
+from cluster_stability import bootstrap_stability
+from consensus_clustering import collect_label_sets, consensus_clustering
+from graph_clustering import backend_version, build_knn_graph, find_communities, modularity, resolve_backend
+from profiling import profiler, timed_call
+from linkage_trees import load_or_compute_linkage, compute_linkage_matrix, cut_tree_labels, build_cluster_tree
 
 # Configure logging
 logging.basicConfig(
@@ -62,33 +68,343 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _blas_threads_per_worker(n_jobs: int) -> int:
+    """Split the available cores between sweep workers so BLAS doesn't oversubscribe"""
+    return max(1, joblib.cpu_count() // max(1, effective_n_jobs(n_jobs)))
+
+
+def _evaluate_kmeans_k(data: np.ndarray, n_clusters: int, blas_threads: int) -> Tuple[float, float, float, float]:
+    """Fit K-means for one k and return (inertia, silhouette, calinski_harabasz, davies_bouldin)"""
+    with threadpool_limits(limits=blas_threads):
+        kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
+        cluster_labels = kmeans.fit_predict(data)
+        
+        if n_clusters > 1:
+            metrics = evaluate_clustering(data, cluster_labels)
+            return (
+                kmeans.inertia_,
+                metrics['silhouette_score'],
+                metrics['calinski_harabasz_score'],
+                metrics['davies_bouldin_score']
+            )
+        return kmeans.inertia_, 0, 0, float('inf')
+
+
+def _evaluate_spherical_k(data: np.ndarray, n_clusters: int, blas_threads: int) -> Tuple[float, float, float, float]:
+    """Spherical counterpart of _evaluate_kmeans_k (silhouette under cosine distance)"""
+    with threadpool_limits(limits=blas_threads):
+        kmeans = SphericalKMeans(n_clusters=n_clusters, random_state=42, n_init=10)
+        cluster_labels = kmeans.fit_predict(data)
+        
+        if n_clusters > 1:
+            metrics = evaluate_clustering(data, cluster_labels, metric='cosine')
+            return (
+                kmeans.inertia_,
+                metrics['silhouette_score'],
+                metrics['calinski_harabasz_score'],
+                metrics['davies_bouldin_score']
+            )
+        return kmeans.inertia_, 0, 0, float('inf')
+
+
+def _iter_scaled_batches(embeddings: np.ndarray, scaler: StandardScaler, reducer=None,
+                         batch_size: int = None, batch_starts=None):
+    """Yield preprocessed row batches, reading only one batch of a memmap at a time"""
+    batch_size = batch_size or config.MINIBATCH_SIZE
+    if batch_starts is None:
+        batch_starts = range(0, len(embeddings), batch_size)
+    
+    for start in batch_starts:
+        batch = scaler.transform(np.asarray(embeddings[start:start + batch_size]))
+        yield reducer.transform(batch) if reducer is not None else batch
+
+
+def _fit_streaming_kmeans(embeddings: np.ndarray, n_clusters: int, scaler: StandardScaler,
+                          reducer=None) -> Tuple[MiniBatchKMeans, np.ndarray, float]:
+    """Fit MiniBatchKMeans over streamed batches and return (model, labels, inertia)"""
+    batch_size = config.MINIBATCH_SIZE
+    kmeans = MiniBatchKMeans(n_clusters=n_clusters, random_state=42, batch_size=batch_size, n_init=3)
+    
+    # Visit batches in a shuffled order each epoch so date-ordered posts don't bias the centroids
+    rng = np.random.RandomState(42)
+    batch_starts = np.arange(0, len(embeddings), batch_size)
+    for _ in range(config.MINIBATCH_EPOCHS):
+        for batch in _iter_scaled_batches(embeddings, scaler, reducer, batch_size, rng.permutation(batch_starts)):
+            if len(batch) >= n_clusters:
+                kmeans.partial_fit(batch)
+    
+    # Final pass: assign every row and accumulate inertia
+    labels = []
+    inertia = 0.0
+    for batch in _iter_scaled_batches(embeddings, scaler, reducer, batch_size):
+        labels.append(kmeans.predict(batch))
+        inertia -= kmeans.score(batch)
+    
+    return kmeans, np.concatenate(labels), inertia
+
+
+def _sampled_metrics(embeddings: np.ndarray, labels: np.ndarray, scaler: StandardScaler,
+                     reducer, sample_idx: np.ndarray) -> Dict[str, float]:
+    """Silhouette, Calinski-Harabasz and Davies-Bouldin on a fixed row sample"""
+    sample = scaler.transform(np.asarray(embeddings[sample_idx]))
+    if reducer is not None:
+        sample = reducer.transform(sample)
+    sample_labels = labels[sample_idx]
+    
+    if len(np.unique(sample_labels)) < 2:
+        return {'silhouette_score': 0, 'calinski_harabasz_score': 0, 'davies_bouldin_score': float('inf')}
+    return evaluate_clustering(sample, sample_labels, sample_size=None)
+
+
+def _evaluate_minibatch_k(embeddings: np.ndarray, n_clusters: int, scaler: StandardScaler, reducer,
+                          sample_idx: np.ndarray, blas_threads: int) -> Tuple[float, float, float, float]:
+    """Streaming counterpart of _evaluate_kmeans_k for the minibatch engine"""
+    with threadpool_limits(limits=blas_threads):
+        _, labels, inertia = _fit_streaming_kmeans(embeddings, n_clusters, scaler, reducer)
+        metrics = _sampled_metrics(embeddings, labels, scaler, reducer, sample_idx)
+        return (
+            inertia,
+            metrics['silhouette_score'],
+            metrics['calinski_harabasz_score'],
+            metrics['davies_bouldin_score']
+        )
+
+
+def _filter_radius_graph(graph: csr_matrix, eps: float) -> csr_matrix:
+    """Keep only edges with distance <= eps (explicit zero distances are preserved)"""
+    keep = graph.data <= eps
+    row_ids = np.repeat(np.arange(graph.shape[0]), np.diff(graph.indptr))
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(row_ids[keep], minlength=graph.shape[0]))])
+    return csr_matrix((graph.data[keep], graph.indices[keep], indptr), shape=graph.shape)
+
+
+def _stratified_sample(strata: np.ndarray, size: int, rng: np.random.RandomState) -> np.ndarray:
+    """Row indices allocated proportionally to stratum sizes (at least one row per stratum)"""
+    if size >= len(strata):
+        return np.arange(len(strata))
+    
+    values, counts = np.unique(strata, return_counts=True)
+    allocation = np.maximum(1, np.round(counts / counts.sum() * size).astype(int))
+    sample = [
+        rng.choice(np.flatnonzero(strata == value), min(n_rows, count), replace=False)
+        for value, count, n_rows in zip(values, counts, allocation)
+    ]
+    return np.sort(np.concatenate(sample))
+
+
+def _build_kmeans(engine: str, n_clusters: int, n_init: int = 10):
+    """Unfitted K-means model of the given engine for in-memory data"""
+    if engine == 'spherical':
+        return SphericalKMeans(n_clusters=n_clusters, random_state=42, n_init=n_init)
+    if engine == 'minibatch':
+        return MiniBatchKMeans(n_clusters=n_clusters, random_state=42, batch_size=config.MINIBATCH_SIZE, n_init=n_init)
+    return KMeans(n_clusters=n_clusters, random_state=42, n_init=n_init)
+
+
+def _kmeans_selection_score(data: np.ndarray, n_clusters: int, n_init: int, blas_threads: int,
+                            engine: str = 'kmeans') -> float:
+    """Fit K-means of the given engine for one candidate k and return only its silhouette"""
+    with threadpool_limits(limits=blas_threads):
+        labels = _build_kmeans(engine, n_clusters, n_init).fit_predict(data)
+        return _selection_score(data, labels, metric='cosine' if engine == 'spherical' else 'euclidean')
+
+
+def _selection_score(data: np.ndarray, labels: np.ndarray, metric: str = 'euclidean') -> float:
+    """Silhouette used to rank candidates; -1 when it is undefined"""
+    n_labels = len(np.unique(labels))
+    if n_labels < 2 or n_labels >= len(labels):
+        return -1.0
+    return float(silhouette(data, labels, metric=metric))
+
+
+def _dbscan_selection_score(data: np.ndarray, labels: np.ndarray, metric: str = 'euclidean') -> float:
+    """Silhouette over non-noise points, with the same noise rule as optimize_dbscan_parameters"""
+    non_noise_mask = labels != -1
+    if np.sum(~non_noise_mask) >= len(labels) * 0.5:
+        return -1.0
+    return _selection_score(data[non_noise_mask], labels[non_noise_mask], metric)
+
+
+KMEANS_ENGINES = ['kmeans', 'minibatch', 'spherical']
+TUNERS = ['grid', 'halving']
+PRE_REDUCTION_METHODS = ['pca', 'svd', 'random_projection']
+
+
+def build_pre_reducer(method: str, n_components: int):
+    """Create the (unfitted) reducer used ahead of clustering"""
+    if method == 'pca':
+        return PCA(n_components=n_components, svd_solver='randomized', random_state=42)
+    if method == 'svd':
+        return TruncatedSVD(n_components=n_components, algorithm='randomized', random_state=42)
+    if method == 'random_projection':
+        return GaussianRandomProjection(n_components=n_components, random_state=42)
+    raise ValueError(f"Unknown pre-reduction method: {method} (choose from {PRE_REDUCTION_METHODS})")
+
+
 class ClusteringAnalyzer:
     """Comprehensive clustering analysis for blog post embeddings"""
     
-    def __init__(self, embeddings: np.ndarray, post_data: pd.DataFrame):
-        """Initialize analyzer with embeddings and post metadata"""
+    def __init__(self, embeddings: np.ndarray, post_data: pd.DataFrame, n_jobs: int = None,
+                 reduction: str = None, reduction_dims: int = None, engine: str = None,
+                 use_cache: bool = None, output_dir: str = None):
+        """Initialize analyzer with embeddings and post metadata
+        
+        If a pre-reduction method is given (or set in config.PRE_REDUCTION_METHOD),
+        the scaled embeddings are projected to reduction_dims before any clustering.
+        
+        With engine='minibatch' the embeddings may be a read-only memmap: the scaler
+        and reducer are fitted by streaming, and K-means never loads the full matrix.
+        
+        With engine='spherical' the embeddings are L2-normalized (float32) instead of
+        standardized, K-means runs under cosine similarity and silhouette scores of
+        every algorithm use cosine distance.
+        
+        Fits are memoized on disk (config.FIT_CACHE_*) unless use_cache is False.
+        Linkage trees and pre-reduction fits are persisted in output_dir/models
+        (default config.OUTPUT_DIR).
+        """
         self.embeddings = embeddings
         self.post_data = post_data
-        self.scaler = StandardScaler()
-        
-        # Normalize embeddings
-        self.embeddings_normalized = self.scaler.fit_transform(embeddings)
-        
-        # Initialize NLTK if available
-        if nltk:
-            try:
-                nltk.download('punkt', quiet=True)
-                nltk.download('stopwords', quiet=True)
-                self.stop_words = set(stopwords.words('english'))
-            except:
-                self.stop_words = set()
+        self.output_dir = Path(output_dir or config.OUTPUT_DIR)
+        self.n_jobs = n_jobs if n_jobs is not None else config.CLUSTERING_N_JOBS
+        self.engine = engine or config.CLUSTERING_ENGINE
+        self.scaler = None if self.engine == 'spherical' else StandardScaler()
+        self.silhouette_metric = 'cosine' if self.engine == 'spherical' else 'euclidean'
+        
+        self.reduction_method = reduction if reduction is not None else config.PRE_REDUCTION_METHOD
+        self.reduction_dims = reduction_dims or config.PRE_REDUCTION_DIMENSIONS
+        self.reducer = None
+        self._embeddings_normalized = None
+        self._dbscan_metrics_cache = {}
+        self._linkage_matrices = {}
+        self._knn_graph = None
+        
+        use_cache = config.FIT_CACHE_ENABLED if use_cache is None else use_cache
+        self.fit_cache = FitCache() if use_cache else None
+        self._data_fingerprint = None
+        
+        if self.engine == 'minibatch':
+            self._fit_streaming_preprocessing()
+        elif self.engine == 'spherical':
+            # Unit-length rows; re-normalized after any pre-reduction
+            self.embeddings_normalized = l2_normalize(embeddings)
+            if self.reduction_method:
+                self.embeddings_normalized = l2_normalize(self._apply_pre_reduction(self.embeddings_normalized))
         else:
-            self.stop_words = set()
+            # Normalize embeddings
+            self.embeddings_normalized = self.scaler.fit_transform(embeddings)
+            
+            # Optional dimensionality pre-reduction (all algorithms then run on the reduced matrix)
+            if self.reduction_method:
+                self.embeddings_normalized = self._apply_pre_reduction(self.embeddings_normalized)
+        
+        # Sparse document-term matrix, built on first content analysis
+        self._term_matrix = None
         
         logger.info(f"Initialized analyzer with {len(embeddings)} embeddings")
     
-    def find_optimal_clusters_kmeans(self, max_clusters: int = 50) -> Dict[str, Any]:
-        """Find optimal number of clusters using elbow method and silhouette analysis"""
+    @property
+    def embeddings_normalized(self) -> np.ndarray:
+        """Preprocessed embeddings; materialized on first use in minibatch mode"""
+        if self._embeddings_normalized is None:
+            logger.info("Materializing preprocessed embeddings in memory...")
+            self._embeddings_normalized = np.vstack(
+                list(_iter_scaled_batches(self.embeddings, self.scaler, self.reducer))
+            )
+        return self._embeddings_normalized
+    
+    @embeddings_normalized.setter
+    def embeddings_normalized(self, value: np.ndarray) -> None:
+        self._embeddings_normalized = value
+    
+    def _fit_streaming_preprocessing(self) -> None:
+        """Fit the scaler batch by batch and the reducer on a row sample"""
+        n_rows = len(self.embeddings)
+        for start in range(0, n_rows, config.MINIBATCH_SIZE):
+            self.scaler.partial_fit(np.asarray(self.embeddings[start:start + config.MINIBATCH_SIZE]))
+        
+        # Fixed sample used for metrics (and for fitting the reducer)
+        rng = np.random.RandomState(42)
+        sample_size = min(n_rows, config.MINIBATCH_METRIC_SAMPLE_SIZE)
+        self.metric_sample_idx = np.sort(rng.choice(n_rows, sample_size, replace=False))
+        
+        if self.reduction_method:
+            sample = self.scaler.transform(np.asarray(self.embeddings[self.metric_sample_idx]))
+            n_components = min(self.reduction_dims, sample.shape[0], sample.shape[1])
+            logger.info(f"Fitting {self.reduction_method} pre-reduction on {sample_size} sampled rows")
+            self.reducer = build_pre_reducer(self.reduction_method, n_components).fit(sample)
+    
+    def _apply_pre_reduction(self, data: np.ndarray) -> np.ndarray:
+        """Fit the configured reducer once, reusing the cached fit for identical embeddings"""
+        n_components = min(self.reduction_dims, data.shape[0], data.shape[1])
+        cache_file = self.output_dir / "models" / f"pre_reduction_{self.reduction_method}_{n_components}.pkl"
+        fingerprint = params_fingerprint(
+            data=array_fingerprint(self.embeddings), scaler='l2' if self.engine == 'spherical' else 'standard'
+        )
+        
+        if cache_file.exists():
+            cached = joblib.load(cache_file)
+            if cached.get('fingerprint') == fingerprint:
+                logger.info(f"Loaded cached {self.reduction_method} pre-reduction ({n_components} dims)")
+                self.reducer = cached['reducer']
+                return cached['reduced']
+        
+        logger.info(f"Fitting {self.reduction_method} pre-reduction: {data.shape[1]} -> {n_components} dims")
+        self.reducer = build_pre_reducer(self.reduction_method, n_components)
+        reduced = self.reducer.fit_transform(data)
+        
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump({'fingerprint': fingerprint, 'reducer': self.reducer, 'reduced': reduced}, cache_file)
+        return reduced
+    
+    def _fit_cache_key(self, algorithm: str, params: Dict[str, Any]) -> str:
+        """Key covering the input data, preprocessing settings and algorithm parameters"""
+        if self._data_fingerprint is None:
+            self._data_fingerprint = array_fingerprint(self.embeddings)
+        
+        preprocessing = {
+            'scaler': 'l2' if self.engine == 'spherical' else 'standard',
+            'reduction': self.reduction_method or None,
+            'reduction_dims': self.reduction_dims if self.reduction_method else None,
+            'engine': self.engine
+        }
+        if self.engine == 'minibatch':
+            preprocessing.update(
+                batch_size=config.MINIBATCH_SIZE,
+                epochs=config.MINIBATCH_EPOCHS,
+                metric_sample_size=config.MINIBATCH_METRIC_SAMPLE_SIZE
+            )
+        
+        return params_fingerprint(
+            data=self._data_fingerprint, preprocessing=preprocessing, algorithm=algorithm, params=params
+        )
+    
+    def _cached_fit(self, algorithm: str, params: Dict[str, Any], fit) -> Any:
+        """Return a memoized fit result, running fit() only on a cache miss"""
+        with profiler.span(f'fit_{algorithm}', cat='fit', **params) as span:
+            if self.fit_cache is None:
+                return fit()
+            
+            key = self._fit_cache_key(algorithm, params)
+            cached = self.fit_cache.get(key)
+            if cached is not None:
+                span['args']['cache'] = 'hit'
+                logger.info(f"Loaded cached {algorithm} fit {params}")
+                return cached
+            
+            span['args']['cache'] = 'miss'
+            result = fit()
+            self.fit_cache.put(key, result)
+            return result
+    
+    @profiler.profiled('kmeans_sweep')
+    def find_optimal_clusters_kmeans(self, max_clusters: int = 50, n_jobs: int = None) -> Dict[str, Any]:
+        """Find optimal number of clusters using elbow method and silhouette analysis
+        
+        Each k is fitted independently (fixed random_state), so the sweep runs in a
+        joblib worker pool and gives the same results as a serial loop. BLAS threads
+        are capped per worker so that n_jobs * threads does not exceed the core count.
+        """
         logger.info("Finding optimal number of clusters for K-means...")
         
         cluster_range = range(
@@ -97,25 +413,60 @@ class ClusteringAnalyzer:
             config.CLUSTERING_ALGORITHMS['kmeans']['step']
         )
         
-        inertias = []
-        silhouette_scores = []
-        calinski_scores = []
-        davies_bouldin_scores = []
+        n_jobs = n_jobs if n_jobs is not None else self.n_jobs
+        blas_threads = _blas_threads_per_worker(n_jobs)
+        logger.info(f"K-means sweep using {effective_n_jobs(n_jobs)} workers x {blas_threads} BLAS threads")
         
-        for n_clusters in tqdm(cluster_range, desc="Testing K-means clusters"):
-            kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
-            cluster_labels = kmeans.fit_predict(self.embeddings_normalized)
-            
-            inertias.append(kmeans.inertia_)
-            
-            if n_clusters > 1:
-                silhouette_scores.append(silhouette_score(self.embeddings_normalized, cluster_labels))
-                calinski_scores.append(calinski_harabasz_score(self.embeddings_normalized, cluster_labels))
-                davies_bouldin_scores.append(davies_bouldin_score(self.embeddings_normalized, cluster_labels))
-            else:
-                silhouette_scores.append(0)
-                calinski_scores.append(0)
-                davies_bouldin_scores.append(float('inf'))
+        # Reuse memoized sweep points; only the missing k values go to the pool
+        sweep_cache = {}
+        if self.fit_cache is not None:
+            for n_clusters in cluster_range:
+                cached = self.fit_cache.get(self._fit_cache_key('kmeans_sweep', {'n_clusters': n_clusters}))
+                if cached is not None:
+                    sweep_cache[n_clusters] = cached
+        missing = [n_clusters for n_clusters in cluster_range if n_clusters not in sweep_cache]
+        
+        if self.engine == 'spherical':
+            tasks = (
+                delayed(timed_call)(
+                    _evaluate_spherical_k, self.embeddings_normalized, n_clusters, blas_threads,
+                    name='kmeans_sweep_k', k=n_clusters
+                )
+                for n_clusters in missing
+            )
+        elif self.engine == 'minibatch':
+            tasks = (
+                delayed(timed_call)(
+                    _evaluate_minibatch_k, self.embeddings, n_clusters, self.scaler, self.reducer,
+                    self.metric_sample_idx, blas_threads, name='kmeans_sweep_k', k=n_clusters
+                )
+                for n_clusters in missing
+            )
+        else:
+            tasks = (
+                delayed(timed_call)(
+                    _evaluate_kmeans_k, self.embeddings_normalized, n_clusters, blas_threads,
+                    name='kmeans_sweep_k', k=n_clusters
+                )
+                for n_clusters in missing
+            )
+        
+        if missing:
+            sweep = Parallel(n_jobs=n_jobs, return_as='generator')(tasks)
+            for n_clusters, (metrics, span) in zip(missing, tqdm(sweep, total=len(missing), desc="Testing K-means clusters")):
+                profiler.add_span(span)
+                sweep_cache[n_clusters] = metrics
+                if self.fit_cache is not None:
+                    self.fit_cache.put(self._fit_cache_key('kmeans_sweep', {'n_clusters': n_clusters}), metrics)
+        else:
+            logger.info("All K-means sweep points loaded from the fit cache")
+        
+        sweep_results = [sweep_cache[n_clusters] for n_clusters in cluster_range]
+        
+        inertias = [r[0] for r in sweep_results]
+        silhouette_scores = [r[1] for r in sweep_results]
+        calinski_scores = [r[2] for r in sweep_results]
+        davies_bouldin_scores = [r[3] for r in sweep_results]
         
         # Find optimal clusters
         optimal_clusters = {}
@@ -172,50 +523,117 @@ class ClusteringAnalyzer:
     
     def perform_kmeans_clustering(self, n_clusters: int) -> Dict[str, Any]:
         """Perform K-means clustering with specified number of clusters"""
-        logger.info(f"Performing K-means clustering with {n_clusters} clusters...")
-        
-        kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
-        cluster_labels = kmeans.fit_predict(self.embeddings_normalized)
+        return self._cached_fit('kmeans', {'n_clusters': n_clusters}, lambda: self._fit_kmeans(n_clusters))
+    
+    def _fit_kmeans(self, n_clusters: int) -> Dict[str, Any]:
+        logger.info(f"Performing K-means clustering with {n_clusters} clusters (engine: {self.engine})...")
         
-        # Calculate metrics
-        silhouette_avg = silhouette_score(self.embeddings_normalized, cluster_labels)
-        calinski_harabasz = calinski_harabasz_score(self.embeddings_normalized, cluster_labels)
-        davies_bouldin = davies_bouldin_score(self.embeddings_normalized, cluster_labels)
+        if self.engine == 'minibatch':
+            kmeans, cluster_labels, inertia = _fit_streaming_kmeans(
+                self.embeddings, n_clusters, self.scaler, self.reducer
+            )
+            
+            # Metrics on the fixed row sample
+            metrics = _sampled_metrics(
+                self.embeddings, cluster_labels, self.scaler, self.reducer, self.metric_sample_idx
+            )
+        else:
+            kmeans = _build_kmeans(self.engine, n_clusters)
+            cluster_labels = kmeans.fit_predict(self.embeddings_normalized)
+            inertia = kmeans.inertia_
+            
+            # Calculate metrics
+            metrics = self.evaluate_labels(self.embeddings_normalized, cluster_labels)
         
         # Analyze cluster sizes
         cluster_sizes = Counter(cluster_labels)
         
         results = {
             'algorithm': 'kmeans',
+            'engine': self.engine,
             'n_clusters': n_clusters,
             'labels': cluster_labels,
             'centroids': kmeans.cluster_centers_,
-            'inertia': kmeans.inertia_,
-            'silhouette_score': silhouette_avg,
-            'calinski_harabasz_score': calinski_harabasz,
-            'davies_bouldin_score': davies_bouldin,
+            'inertia': inertia,
+            **metrics,
             'cluster_sizes': dict(cluster_sizes),
             'model': kmeans
         }
         
-        logger.info(f"K-means completed - Silhouette: {silhouette_avg:.3f}")
+        logger.info(f"K-means completed - Silhouette: {metrics['silhouette_score']:.3f}")
         return results
     
+    @profiler.profiled('metrics', cat='metric')
+    def evaluate_labels(self, data: np.ndarray, labels: np.ndarray) -> Dict[str, Any]:
+        """Silhouette, Calinski-Harabasz and Davies-Bouldin from one chunked evaluation pass
+        
+        Above config.METRICS_EXACT_SILHOUETTE_MAX_ROWS rows the silhouette is sampled and
+        reported with a 95% confidence interval (silhouette_ci).
+        """
+        return evaluate_clustering(data, labels, metric=self.silhouette_metric)
+    
+    def centroid_distances(self, model) -> np.ndarray:
+        """Distance from every post to its nearest centroid (cosine for the spherical engine)"""
+        if self.engine == 'minibatch':
+            return np.concatenate([
+                model.transform(batch).min(axis=1)
+                for batch in _iter_scaled_batches(self.embeddings, self.scaler, self.reducer)
+            ])
+        return model.transform(self.embeddings_normalized).min(axis=1)
+    
+    def bootstrap_stability(self, kmeans_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Per-cluster Jaccard stability and per-post confidence of a K-means solution
+        
+        The model is refitted on config.STABILITY_RESAMPLES subsamples of the preprocessed
+        embeddings in parallel, each warm-started from the reference centroids.
+        """
+        random_state = 42
+        params = {
+            'n_clusters': kmeans_result['n_clusters'],
+            'labels': array_fingerprint(kmeans_result['labels']),
+            'centroids': array_fingerprint(kmeans_result['centroids']),
+            'n_resamples': config.STABILITY_RESAMPLES,
+            'sample_fraction': config.STABILITY_SAMPLE_FRACTION,
+            'random_state': random_state
+        }
+        return self._cached_fit('stability', params, lambda: bootstrap_stability(
+            self.embeddings_normalized, kmeans_result['labels'], kmeans_result['centroids'],
+            spherical=self.engine == 'spherical', n_jobs=self.n_jobs, random_state=random_state
+        ))
+    
+    def get_linkage_matrix(self, linkage_method: str = 'ward') -> np.ndarray:
+        """Full linkage tree for a method, computed once and persisted in models/"""
+        if linkage_method not in self._linkage_matrices:
+            with profiler.span('linkage_tree', method=linkage_method):
+                self._linkage_matrices[linkage_method] = load_or_compute_linkage(
+                    self.embeddings_normalized, linkage_method, self.output_dir / "models"
+                )
+        return self._linkage_matrices[linkage_method]
+    
+    def build_cluster_tree(self, linkage_method: str = 'ward', levels: List[int] = None) -> Dict[int, np.ndarray]:
+        """Multi-resolution labels (one per k in levels) cut from the same stored tree"""
+        levels = levels or config.CLUSTERING_ALGORITHMS['hierarchical']['tree_levels']
+        return build_cluster_tree(self.get_linkage_matrix(linkage_method), levels)
+    
     def perform_hierarchical_clustering(self, n_clusters: int, linkage_method: str = 'ward') -> Dict[str, Any]:
-        """Perform hierarchical clustering"""
+        """Perform hierarchical clustering by cutting the stored linkage tree at n_clusters"""
+        return self._cached_fit(
+            'hierarchical', {'n_clusters': n_clusters, 'linkage_method': linkage_method},
+            lambda: self._fit_hierarchical(n_clusters, linkage_method)
+        )
+    
+    def _fit_hierarchical(self, n_clusters: int, linkage_method: str) -> Dict[str, Any]:
         logger.info(f"Performing hierarchical clustering with {n_clusters} clusters (linkage: {linkage_method})...")
         
-        clustering = AgglomerativeClustering(
-            n_clusters=n_clusters,
-            linkage=linkage_method,
-            metric='euclidean' if linkage_method == 'ward' else 'cosine'
-        )
-        cluster_labels = clustering.fit_predict(self.embeddings_normalized)
+        cluster_labels = cut_tree_labels(self.get_linkage_matrix(linkage_method), n_clusters)
+        
+        # Tied merge heights can leave fewer clusters than requested
+        n_found = len(np.unique(cluster_labels))
+        if n_found != n_clusters:
+            logger.warning(f"{linkage_method} tree cut produced {n_found} clusters instead of {n_clusters} (tied merge heights)")
         
         # Calculate metrics
-        silhouette_avg = silhouette_score(self.embeddings_normalized, cluster_labels)
-        calinski_harabasz = calinski_harabasz_score(self.embeddings_normalized, cluster_labels)
-        davies_bouldin = davies_bouldin_score(self.embeddings_normalized, cluster_labels)
+        metrics = self.evaluate_labels(self.embeddings_normalized, cluster_labels)
         
         # Analyze cluster sizes
         cluster_sizes = Counter(cluster_labels)
@@ -223,51 +641,71 @@ class ClusteringAnalyzer:
         results = {
             'algorithm': 'hierarchical',
             'linkage_method': linkage_method,
-            'n_clusters': n_clusters,
+            'n_clusters': n_found,
             'labels': cluster_labels,
-            'silhouette_score': silhouette_avg,
-            'calinski_harabasz_score': calinski_harabasz,
-            'davies_bouldin_score': davies_bouldin,
-            'cluster_sizes': dict(cluster_sizes),
-            'model': clustering
+            **metrics,
+            'cluster_sizes': dict(cluster_sizes)
         }
         
-        logger.info(f"Hierarchical clustering completed - Silhouette: {silhouette_avg:.3f}")
+        logger.info(f"Hierarchical clustering completed - Silhouette: {metrics['silhouette_score']:.3f}")
         return results
     
-    def perform_dbscan_clustering(self, eps: float = 0.3, min_samples: int = 5) -> Dict[str, Any]:
-        """Perform DBSCAN clustering"""
+    @profiler.profiled('dbscan_neighbors_graph')
+    def build_dbscan_neighbors_graph(self, max_eps: float, data: np.ndarray = None) -> csr_matrix:
+        """Cosine radius-neighbours graph at the largest eps, shared by every DBSCAN grid cell"""
+        logger.info(f"Building cosine radius-neighbours graph (radius={max_eps})...")
+        neighbors = NearestNeighbors(radius=max_eps, metric='cosine', n_jobs=self.n_jobs)
+        neighbors.fit(self.embeddings_normalized if data is None else data)
+        graph = neighbors.radius_neighbors_graph(mode='distance')
+        return sort_graph_by_row_values(graph, warn_when_not_sorted=False)
+    
+    def perform_dbscan_clustering(self, eps: float = 0.3, min_samples: int = 5,
+                                  neighbors_graph: Union[csr_matrix, Callable[[], csr_matrix]] = None) -> Dict[str, Any]:
+        """Perform DBSCAN clustering
+        
+        If a precomputed radius-neighbours graph (radius >= eps) is given, DBSCAN runs on
+        its edges with distance <= eps instead of recomputing pairwise cosine distances.
+        The graph may also be passed as a zero-argument callable, so it is only built
+        when the fit is not already cached.
+        """
+        return self._cached_fit(
+            'dbscan', {'eps': eps, 'min_samples': min_samples, 'precomputed': neighbors_graph is not None},
+            lambda: self._fit_dbscan(eps, min_samples, neighbors_graph)
+        )
+    
+    def _fit_dbscan(self, eps: float, min_samples: int,
+                    neighbors_graph: Union[csr_matrix, Callable[[], csr_matrix]] = None) -> Dict[str, Any]:
         logger.info(f"Performing DBSCAN clustering (eps={eps}, min_samples={min_samples})...")
         
-        clustering = DBSCAN(eps=eps, min_samples=min_samples, metric='cosine')
-        cluster_labels = clustering.fit_predict(self.embeddings_normalized)
+        if callable(neighbors_graph):
+            neighbors_graph = neighbors_graph()
+        
+        if neighbors_graph is not None:
+            clustering = DBSCAN(eps=eps, min_samples=min_samples, metric='precomputed')
+            cluster_labels = clustering.fit_predict(_filter_radius_graph(neighbors_graph, eps))
+        else:
+            clustering = DBSCAN(eps=eps, min_samples=min_samples, metric='cosine')
+            cluster_labels = clustering.fit_predict(self.embeddings_normalized)
         
         # Count clusters (-1 is noise)
         unique_labels = set(cluster_labels)
         n_clusters = len(unique_labels) - (1 if -1 in unique_labels else 0)
         n_noise = list(cluster_labels).count(-1)
         
-        # Calculate metrics (excluding noise points)
-        if n_clusters > 1:
-            # Remove noise points for metric calculation
-            non_noise_mask = cluster_labels != -1
-            if np.sum(non_noise_mask) > 1:
-                silhouette_avg = silhouette_score(
-                    self.embeddings_normalized[non_noise_mask], 
-                    cluster_labels[non_noise_mask]
-                )
-                calinski_harabasz = calinski_harabasz_score(
-                    self.embeddings_normalized[non_noise_mask], 
-                    cluster_labels[non_noise_mask]
-                )
-                davies_bouldin = davies_bouldin_score(
-                    self.embeddings_normalized[non_noise_mask], 
-                    cluster_labels[non_noise_mask]
-                )
-            else:
-                silhouette_avg = calinski_harabasz = davies_bouldin = 0
-        else:
-            silhouette_avg = calinski_harabasz = davies_bouldin = 0
+        # Calculate metrics (excluding noise points); grid cells with identical labels share them
+        metrics_key = cluster_labels.tobytes()
+        if metrics_key not in self._dbscan_metrics_cache:
+            metrics = {'silhouette_score': 0, 'calinski_harabasz_score': 0, 'davies_bouldin_score': 0}
+            if n_clusters > 1:
+                # Remove noise points for metric calculation
+                non_noise_mask = cluster_labels != -1
+                if np.sum(non_noise_mask) > 1:
+                    metrics = self.evaluate_labels(
+                        self.embeddings_normalized[non_noise_mask],
+                        cluster_labels[non_noise_mask]
+                    )
+            self._dbscan_metrics_cache[metrics_key] = metrics
+        metrics = self._dbscan_metrics_cache[metrics_key]
         
         # Analyze cluster sizes
         cluster_sizes = Counter(cluster_labels)
@@ -279,9 +717,7 @@ class ClusteringAnalyzer:
             'n_clusters': n_clusters,
             'n_noise': n_noise,
             'labels': cluster_labels,
-            'silhouette_score': silhouette_avg,
-            'calinski_harabasz_score': calinski_harabasz,
-            'davies_bouldin_score': davies_bouldin,
+            **metrics,
             'cluster_sizes': dict(cluster_sizes),
             'model': clustering
         }
@@ -289,8 +725,9 @@ class ClusteringAnalyzer:
         logger.info(f"DBSCAN completed - {n_clusters} clusters, {n_noise} noise points")
         return results
     
+    @profiler.profiled('dbscan_grid')
     def optimize_dbscan_parameters(self) -> Dict[str, Any]:
-        """Find optimal DBSCAN parameters"""
+        """Find optimal DBSCAN parameters over the config eps/min_samples grid"""
         logger.info("Optimizing DBSCAN parameters...")
         
         eps_range = config.CLUSTERING_ALGORITHMS['dbscan']['eps_range']
@@ -300,10 +737,16 @@ class ClusteringAnalyzer:
         best_params = None
         all_results = []
         
+        # One neighbourhood computation for the whole grid (built on the first uncached cell);
+        # each cell only filters edges
+        neighbors_graph = functools.lru_cache(maxsize=None)(
+            lambda: self.build_dbscan_neighbors_graph(max(eps_range))
+        )
+        
         for eps in tqdm(eps_range, desc="Testing DBSCAN parameters"):
             for min_samples in min_samples_range:
                 try:
-                    result = self.perform_dbscan_clustering(eps, min_samples)
+                    result = self.perform_dbscan_clustering(eps, min_samples, neighbors_graph=neighbors_graph)
                     all_results.append(result)
                     
                     # Check if this is the best result so far
@@ -323,6 +766,260 @@ class ClusteringAnalyzer:
             'all_results': all_results
         }
     
+    @profiler.profiled('knn_graph')
+    def get_knn_graph(self) -> csr_matrix:
+        """Symmetric kNN similarity graph over the preprocessed embeddings, built once"""
+        if self._knn_graph is None:
+            self._knn_graph = build_knn_graph(
+                self.embeddings_normalized, config.CLUSTERING_ALGORITHMS['graph']['n_neighbors'], n_jobs=self.n_jobs
+            )
+        return self._knn_graph
+    
+    def perform_graph_clustering(self, resolution: float = 1.0) -> Dict[str, Any]:
+        """Community detection (Leiden/Louvain) on the kNN graph at one resolution"""
+        graph_config = config.CLUSTERING_ALGORITHMS['graph']
+        backend = resolve_backend(graph_config['backend'])
+        return self._cached_fit(
+            'graph', {'resolution': resolution, 'n_neighbors': graph_config['n_neighbors'], 'backend': backend,
+                      'backend_version': backend_version(backend)},
+            lambda: self._fit_graph(resolution, backend)
+        )
+    
+    def _fit_graph(self, resolution: float, backend: str) -> Dict[str, Any]:
+        logger.info(f"Performing {backend} graph clustering (resolution: {resolution})...")
+        
+        graph = self.get_knn_graph()
+        cluster_labels = find_communities(graph, resolution, backend)
+        n_clusters = len(np.unique(cluster_labels))
+        
+        if n_clusters > 1:
+            metrics = self.evaluate_labels(self.embeddings_normalized, cluster_labels)
+        else:
+            metrics = {'silhouette_score': 0, 'calinski_harabasz_score': 0, 'davies_bouldin_score': float('inf')}
+        
+        # Analyze cluster sizes
+        cluster_sizes = Counter(cluster_labels)
+        
+        results = {
+            'algorithm': 'graph',
+            'backend': backend,
+            'resolution': resolution,
+            'n_neighbors': config.CLUSTERING_ALGORITHMS['graph']['n_neighbors'],
+            'n_clusters': n_clusters,
+            'labels': cluster_labels,
+            'modularity': modularity(graph, cluster_labels),
+            **metrics,
+            'cluster_sizes': dict(cluster_sizes)
+        }
+        
+        logger.info(f"Graph clustering completed - {n_clusters} communities, "
+                    f"modularity: {results['modularity']:.3f}, silhouette: {metrics['silhouette_score']:.3f}")
+        return results
+    
+    @profiler.profiled('graph_resolutions')
+    def optimize_graph_resolution(self) -> Dict[str, Any]:
+        """Cluster the shared kNN graph at every configured resolution and keep the best silhouette"""
+        logger.info("Optimizing graph clustering resolution...")
+        
+        best_silhouette = -1
+        best_resolution = None
+        all_results = []
+        
+        for resolution in tqdm(config.CLUSTERING_ALGORITHMS['graph']['resolutions'], desc="Testing resolutions"):
+            result = self.perform_graph_clustering(resolution)
+            all_results.append(result)
+            
+            if result['n_clusters'] > 1 and result['silhouette_score'] > best_silhouette:
+                best_silhouette = result['silhouette_score']
+                best_resolution = resolution
+        
+        return {
+            'best_resolution': best_resolution,
+            'best_silhouette': best_silhouette,
+            'all_results': all_results
+        }
+    
+    def perform_consensus_clustering(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Consensus partition of every label set in results (plus bootstrap runs) with per-post confidence
+        
+        Co-association is evaluated only on the edges of the shared kNN graph, never as an N x N matrix.
+        """
+        collected = collect_label_sets(results)
+        if len(collected['label_sets']) < 2:
+            raise ValueError("Consensus clustering needs at least two label sets")
+        logger.info(f"Performing consensus clustering over {', '.join(collected['names'])}...")
+        
+        backend = resolve_backend(config.CLUSTERING_ALGORITHMS['graph']['backend'])
+        consensus = consensus_clustering(
+            collected['label_sets'], collected['weights'], self.get_knn_graph(), backend=backend
+        )
+        cluster_labels = consensus['labels']
+        
+        if 1 < consensus['n_clusters'] < len(cluster_labels):
+            metrics = self.evaluate_labels(self.embeddings_normalized, cluster_labels)
+        else:
+            metrics = {'silhouette_score': 0, 'calinski_harabasz_score': 0, 'davies_bouldin_score': float('inf')}
+        
+        results = {
+            'algorithm': 'consensus',
+            'backend': backend,
+            'label_sets': collected['names'],
+            **consensus,
+            **metrics,
+            'cluster_sizes': dict(Counter(cluster_labels))
+        }
+        
+        logger.info(f"Consensus clustering completed - {consensus['n_clusters']} clusters, "
+                    f"mean confidence: {consensus['mean_confidence']:.3f}")
+        return results
+    
+    def halving_candidates(self, algorithms: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Fine-grained candidate pools for the successive-halving search, one pool per algorithm"""
+        search = config.HALVING_SEARCH
+        pools = {}
+        
+        if 'kmeans' in algorithms:
+            kmeans_config = config.CLUSTERING_ALGORITHMS['kmeans']
+            pools['kmeans'] = [
+                {'n_clusters': k}
+                for k in range(kmeans_config['min_clusters'], kmeans_config['max_clusters'] + 1, search['k_step'])
+            ]
+        
+        if 'hierarchical' in algorithms:
+            hier_config = config.CLUSTERING_ALGORITHMS['hierarchical']
+            for linkage_method in hier_config['linkage_methods']:
+                pools[f'hierarchical_{linkage_method}'] = [
+                    {'n_clusters': k}
+                    for k in range(hier_config['min_clusters'], hier_config['max_clusters'] + 1, search['k_step'])
+                ]
+        
+        if 'dbscan' in algorithms:
+            dbscan_config = config.CLUSTERING_ALGORITHMS['dbscan']
+            eps_values = np.linspace(min(dbscan_config['eps_range']), max(dbscan_config['eps_range']), search['eps_steps'])
+            pools['dbscan'] = [
+                {'eps': round(float(eps), 4), 'min_samples': min_samples}
+                for eps in eps_values
+                for min_samples in dbscan_config['min_samples_range']
+            ]
+        
+        return pools
+    
+    def _score_halving_candidates(self, pool: str, candidates: List[Dict[str, Any]],
+                                  sample_idx: np.ndarray) -> List[float]:
+        """Score every candidate of one pool on the given rows"""
+        full_data = len(sample_idx) == len(self.embeddings)
+        data = self.embeddings_normalized if full_data else self.embeddings_normalized[sample_idx]
+        
+        if pool == 'kmeans':
+            # Fewer restarts on subsample rungs; finalists get the usual n_init=10
+            n_init = 10 if full_data else 3
+            blas_threads = _blas_threads_per_worker(self.n_jobs)
+            valid = [c['n_clusters'] < len(data) for c in candidates]
+            scores = iter(Parallel(n_jobs=self.n_jobs)(
+                delayed(_kmeans_selection_score)(
+                    data, c['n_clusters'], n_init, blas_threads, self.engine
+                )
+                for c, ok in zip(candidates, valid) if ok
+            ))
+            return [next(scores) if ok else -1.0 for ok in valid]
+        
+        if pool.startswith('hierarchical_'):
+            linkage_method = pool[len('hierarchical_'):]
+            linkage_matrix = (
+                self.get_linkage_matrix(linkage_method) if full_data
+                else compute_linkage_matrix(data, linkage_method)
+            )
+            return [
+                _selection_score(data, cut_tree_labels(linkage_matrix, c['n_clusters']), self.silhouette_metric)
+                for c in candidates
+            ]
+        
+        if pool == 'dbscan':
+            # min_samples is a density threshold, so scale it with the sampling fraction
+            fraction = len(data) / len(self.embeddings)
+            graph = self.build_dbscan_neighbors_graph(max(c['eps'] for c in candidates), data)
+            scores = []
+            for c in candidates:
+                min_samples = max(2, int(round(c['min_samples'] * fraction)))
+                clustering = DBSCAN(eps=c['eps'], min_samples=min_samples, metric='precomputed')
+                labels = clustering.fit_predict(_filter_radius_graph(graph, c['eps']))
+                scores.append(_dbscan_selection_score(data, labels, self.silhouette_metric))
+            return scores
+        
+        raise ValueError(f"Unknown candidate pool: {pool}")
+    
+    def successive_halving_search(self, algorithms: List[str] = None) -> Dict[str, Any]:
+        """Budgeted hyperparameter search across clustering algorithms
+        
+        Every candidate of a fine grid is first scored (silhouette) on a small stratified
+        subsample; the best 1/eta are promoted to an eta-times larger sample, and so on.
+        Only the final n_finalists per algorithm are fitted on the full data.
+        """
+        logger.info("Running successive-halving hyperparameter search...")
+        algorithms = algorithms or ['kmeans', 'hierarchical', 'dbscan']
+        search = config.HALVING_SEARCH
+        start_time = time.perf_counter()
+        n_rows = len(self.embeddings)
+        
+        # Coarse partition of the data so every subsample covers all regions of the space
+        n_strata = min(search['n_strata'], n_rows)
+        strata = KMeans(n_clusters=n_strata, random_state=42, n_init=1).fit_predict(self.embeddings_normalized)
+        
+        best_params = {}
+        best_scores = {}
+        rungs = []
+        n_evaluations = 0
+        
+        for pool, candidates in self.halving_candidates(algorithms).items():
+            rng = np.random.RandomState(42)
+            sample_size = search['min_sample_size']
+            
+            while len(candidates) > search['n_finalists'] and sample_size < n_rows:
+                sample_idx = _stratified_sample(strata, sample_size, rng)
+                scores = self._score_halving_candidates(pool, candidates, sample_idx)
+                n_evaluations += len(candidates)
+                rungs.append({
+                    'algorithm': pool,
+                    'sample_size': len(sample_idx),
+                    'candidates': candidates,
+                    'scores': scores
+                })
+                
+                n_keep = max(search['n_finalists'], math.ceil(len(candidates) / search['eta']))
+                order = np.argsort(scores)[::-1][:n_keep]
+                candidates = [candidates[i] for i in order]
+                sample_size *= search['eta']
+            
+            # Full-data fits for the finalists only
+            finalists = candidates[:search['n_finalists']]
+            scores = self._score_halving_candidates(pool, finalists, np.arange(n_rows))
+            n_evaluations += len(finalists)
+            rungs.append({'algorithm': pool, 'sample_size': n_rows, 'candidates': finalists, 'scores': scores})
+            
+            best_idx = int(np.argmax(scores))
+            best_params[pool] = finalists[best_idx]
+            best_scores[pool] = scores[best_idx]
+            logger.info(f"Halving search {pool}: best {finalists[best_idx]} (silhouette {scores[best_idx]:.3f})")
+        
+        elapsed = time.perf_counter() - start_time
+        logger.info(f"Successive-halving search finished: {n_evaluations} evaluations in {elapsed:.1f}s")
+        
+        return {
+            'best_params': best_params,
+            'best_scores': best_scores,
+            'rungs': rungs,
+            'n_evaluations': n_evaluations,
+            'elapsed_seconds': elapsed
+        }
+    
+    @property
+    def term_matrix(self) -> CorpusTermMatrix:
+        """Title/content term counts for all posts, tokenized once and cached on disk"""
+        if self._term_matrix is None:
+            self._term_matrix = CorpusTermMatrix.from_post_data(self.post_data, use_cache=self.fit_cache is not None)
+        return self._term_matrix
+    
+    @profiler.profiled('content_analysis', cat='analysis')
     def analyze_cluster_content(self, cluster_labels: np.ndarray, algorithm_name: str) -> Dict[str, Any]:
         """Analyze the content of each cluster"""
         logger.info(f"Analyzing cluster content for {algorithm_name}...")
@@ -334,6 +1031,12 @@ class ClusteringAnalyzer:
         if -1 in unique_clusters:
             unique_clusters = unique_clusters[unique_clusters != -1]
         
+        # Term statistics for every cluster at once (sparse row-sums, no re-tokenizing)
+        n_terms = config.TOP_WORDS_PER_CLUSTER
+        title_terms = self.term_matrix.top_terms(cluster_labels, 'title', n_terms)
+        content_terms = self.term_matrix.top_terms(cluster_labels, 'content', n_terms)
+        distinctive_terms = self.term_matrix.distinctive_terms(cluster_labels, 'content', n_terms)
+        
         for cluster_id in unique_clusters:
             cluster_mask = cluster_labels == cluster_id
             cluster_posts = self.post_data[cluster_mask]
@@ -352,19 +1055,10 @@ class ClusteringAnalyzer:
                 }
             }
             
-            # Extract common terms from titles and content
-            if self.stop_words:
-                # Analyze titles
-                titles_text = ' '.join(cluster_posts['title'].fillna('').astype(str))
-                title_words = self.extract_keywords(titles_text)
-                analysis['common_title_terms'] = title_words[:config.TOP_WORDS_PER_CLUSTER]
-                
-                # Analyze content (sample to avoid memory issues)
-                sample_size = min(50, len(cluster_posts))
-                content_sample = cluster_posts['extracted_text'].sample(n=sample_size).fillna('')
-                content_text = ' '.join(content_sample.astype(str)[:10000])  # Limit length
-                content_words = self.extract_keywords(content_text)
-                analysis['common_content_terms'] = content_words[:config.TOP_WORDS_PER_CLUSTER]
+            # Common and distinctive terms from the shared term matrix
+            analysis['common_title_terms'] = title_terms.get(int(cluster_id), [])
+            analysis['common_content_terms'] = content_terms.get(int(cluster_id), [])
+            analysis['distinctive_terms'] = distinctive_terms.get(int(cluster_id), [])
             
             # Sample post titles for manual inspection
             sample_titles = cluster_posts['title'].head(10).tolist()
@@ -376,28 +1070,17 @@ class ClusteringAnalyzer:
     
     def extract_keywords(self, text: str) -> List[Tuple[str, int]]:
         """Extract keywords from text"""
-        if not text or not nltk:
+        if not text:
             return []
         
-        # Clean and tokenize
-        text = re.sub(r'[^\w\s]', ' ', text.lower())
-        words = word_tokenize(text)
-        
-        # Filter words
-        keywords = [
-            word for word in words 
-            if len(word) > 2 
-            and word not in self.stop_words
-            and word.isalpha()
-        ]
-        
-        # Count and return most common
-        word_counts = Counter(keywords)
+        # Same tokenization and stopwords as the corpus term matrix
+        word_counts = Counter(tokenize(text))
         return word_counts.most_common()
 
 
-def load_embeddings_and_data(embeddings_file: str = None, data_dir: str = None) -> Tuple[np.ndarray, pd.DataFrame]:
-    """Load embeddings and corresponding post data"""
+def load_embeddings_and_data(embeddings_file: str = None, data_dir: str = None,
+                             mmap: bool = False) -> Tuple[np.ndarray, pd.DataFrame]:
+    """Load embeddings (optionally as a read-only memmap) and corresponding post data"""
     data_dir = Path(data_dir or config.OUTPUT_DIR)
     embeddings_file = embeddings_file or str(data_dir / "blog_embeddings.npy")
     
@@ -405,7 +1088,7 @@ def load_embeddings_and_data(embeddings_file: str = None, data_dir: str = None)
     if not os.path.exists(embeddings_file):
         raise FileNotFoundError(f"Embeddings file not found: {embeddings_file}")
     
-    embeddings = np.load(embeddings_file)
+    embeddings = np.load(embeddings_file, mmap_mode='r' if mmap else None)
     logger.info(f"Loaded embeddings: {embeddings.shape}")
     
     # Load post data
@@ -428,7 +1111,14 @@ def run_comprehensive_analysis(
     embeddings: np.ndarray, 
     post_data: pd.DataFrame,
     output_dir: str = None,
-    algorithms: List[str] = None
+    algorithms: List[str] = None,
+    n_jobs: int = None,
+    reduction: str = None,
+    reduction_dims: int = None,
+    engine: str = None,
+    tuner: str = 'grid',
+    use_cache: bool = None,
+    stability: bool = False
 ) -> Dict[str, Any]:
     """Run comprehensive clustering analysis"""
     output_dir = Path(output_dir or config.OUTPUT_DIR)
@@ -436,123 +1126,178 @@ def run_comprehensive_analysis(
     
     algorithms = algorithms or ['kmeans', 'hierarchical', 'dbscan']
     
-    analyzer = ClusteringAnalyzer(embeddings, post_data)
+    with profiler.span('preprocess'):
+        analyzer = ClusteringAnalyzer(
+            embeddings, post_data, n_jobs=n_jobs,
+            reduction=reduction, reduction_dims=reduction_dims, engine=engine,
+            use_cache=use_cache, output_dir=output_dir
+        )
     results = {}
     
+    # 0. Budgeted search replaces the fixed grids when requested
+    if tuner == 'halving':
+        with profiler.span('halving'):
+            halving_search = analyzer.successive_halving_search(algorithms)
+            results['halving_search'] = halving_search
+            tuned_params = halving_search['best_params']
+    else:
+        tuned_params = {}
+    
     # 1. K-means analysis
     if 'kmeans' in algorithms:
-        logger.info("Running K-means analysis...")
-        
-        # Find optimal clusters
-        kmeans_optimization = analyzer.find_optimal_clusters_kmeans()
-        results['kmeans_optimization'] = kmeans_optimization
-        
-        # Run with optimal cluster count (using silhouette score)
-        optimal_k = kmeans_optimization['optimal_clusters'].get('silhouette', 15)
-        kmeans_result = analyzer.perform_kmeans_clustering(optimal_k)
-        
-        # Analyze cluster content
-        kmeans_content = analyzer.analyze_cluster_content(kmeans_result['labels'], 'kmeans')
-        kmeans_result['cluster_analysis'] = kmeans_content
+        with profiler.span('kmeans'):
+            logger.info("Running K-means analysis...")
+            
+            if 'kmeans' in tuned_params:
+                optimal_k = tuned_params['kmeans']['n_clusters']
+            else:
+                # Find optimal clusters
+                kmeans_optimization = analyzer.find_optimal_clusters_kmeans()
+                results['kmeans_optimization'] = kmeans_optimization
+                
+                # Run with optimal cluster count (using silhouette score)
+                optimal_k = kmeans_optimization['optimal_clusters'].get('silhouette', 15)
+            kmeans_result = analyzer.perform_kmeans_clustering(optimal_k)
+            
+            # Analyze cluster content
+            kmeans_content = analyzer.analyze_cluster_content(kmeans_result['labels'], 'kmeans')
+            kmeans_result['cluster_analysis'] = kmeans_content
+            
+            results['kmeans'] = kmeans_result
         
-        results['kmeans'] = kmeans_result
+        # Bootstrap stability of the final K-means solution
+        if stability:
+            with profiler.span('stability'):
+                results['stability'] = analyzer.bootstrap_stability(kmeans_result)
     
     # 2. Hierarchical clustering
     if 'hierarchical' in algorithms:
-        logger.info("Running hierarchical clustering analysis...")
-        
-        hierarchical_results = {}
-        optimal_k = results.get('kmeans_optimization', {}).get('optimal_clusters', {}).get('silhouette', 15)
-        
-        for linkage_method in config.CLUSTERING_ALGORITHMS['hierarchical']['linkage_methods']:
-            hier_result = analyzer.perform_hierarchical_clustering(optimal_k, linkage_method)
-            hier_content = analyzer.analyze_cluster_content(hier_result['labels'], f'hierarchical_{linkage_method}')
-            hier_result['cluster_analysis'] = hier_content
-            hierarchical_results[linkage_method] = hier_result
-        
-        results['hierarchical'] = hierarchical_results
+        with profiler.span('hierarchical'):
+            logger.info("Running hierarchical clustering analysis...")
+            
+            hierarchical_results = {}
+            optimal_k = results.get('kmeans_optimization', {}).get('optimal_clusters', {}).get('silhouette', 15)
+            optimal_k = tuned_params.get('kmeans', {}).get('n_clusters', optimal_k)
+            
+            for linkage_method in config.CLUSTERING_ALGORITHMS['hierarchical']['linkage_methods']:
+                linkage_k = tuned_params.get(f'hierarchical_{linkage_method}', {}).get('n_clusters', optimal_k)
+                hier_result = analyzer.perform_hierarchical_clustering(linkage_k, linkage_method)
+                hier_content = analyzer.analyze_cluster_content(hier_result['labels'], f'hierarchical_{linkage_method}')
+                hier_result['cluster_analysis'] = hier_content
+                hierarchical_results[linkage_method] = hier_result
+            
+            results['hierarchical'] = hierarchical_results
+            
+            # Multi-resolution cluster tree: nested cuts of each stored linkage tree
+            cluster_tree_df = post_data[['post_id', 'title']].copy()
+            for linkage_method in hierarchical_results:
+                for n_clusters, tree_labels in analyzer.build_cluster_tree(linkage_method).items():
+                    cluster_tree_df[f'{linkage_method}_k{n_clusters}'] = tree_labels
+            cluster_tree_df.to_csv(output_dir / "hierarchical_cluster_tree.csv", index=False)
     
     # 3. DBSCAN analysis
     if 'dbscan' in algorithms:
-        logger.info("Running DBSCAN analysis...")
-        
-        # Optimize parameters
-        dbscan_optimization = analyzer.optimize_dbscan_parameters()
-        results['dbscan_optimization'] = dbscan_optimization
-        
-        # Run with best parameters
-        if dbscan_optimization['best_params']:
-            eps, min_samples = dbscan_optimization['best_params']
-            dbscan_result = analyzer.perform_dbscan_clustering(eps, min_samples)
+        with profiler.span('dbscan'):
+            logger.info("Running DBSCAN analysis...")
             
-            # Analyze cluster content
-            dbscan_content = analyzer.analyze_cluster_content(dbscan_result['labels'], 'dbscan')
-            dbscan_result['cluster_analysis'] = dbscan_content
+            if 'dbscan' in tuned_params:
+                best_params = (tuned_params['dbscan']['eps'], tuned_params['dbscan']['min_samples'])
+            else:
+                # Optimize parameters
+                dbscan_optimization = analyzer.optimize_dbscan_parameters()
+                results['dbscan_optimization'] = dbscan_optimization
+                best_params = dbscan_optimization['best_params']
             
-            results['dbscan'] = dbscan_result
-    
-    # Save results
-    logger.info("Saving clustering results...")
-    
-    # Create a serializable version of results (remove sklearn objects)
-    def make_serializable(obj):
-        """Recursively convert numpy types to Python types for JSON serialization"""
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
-        elif isinstance(obj, np.integer):
-            return int(obj)
-        elif isinstance(obj, np.floating):
-            return float(obj)
-        elif isinstance(obj, dict):
-            return {str(k): make_serializable(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [make_serializable(item) for item in obj]
-        else:
-            return obj
-    
-    results_serializable = {}
-    for algo_name, algo_results in results.items():
-        if isinstance(algo_results, dict):
-            results_serializable[algo_name] = {}
-            for key, value in algo_results.items():
-                if key == 'model':
-                    continue  # Skip sklearn models
-                else:
-                    results_serializable[algo_name][key] = make_serializable(value)
-    
-    # Save results
-    results_file = output_dir / "clustering_results.json"
-    with open(results_file, 'w') as f:
-        json.dump(results_serializable, f, indent=2, default=str)
-    
-    # Save cluster labels as CSV for each algorithm
-    cluster_labels_df = post_data[['post_id', 'title']].copy()
-    
-    if 'kmeans' in results:
-        cluster_labels_df['kmeans_cluster'] = results['kmeans']['labels']
-    
-    if 'hierarchical' in results:
-        for linkage_method, hier_result in results['hierarchical'].items():
-            cluster_labels_df[f'hierarchical_{linkage_method}_cluster'] = hier_result['labels']
-    
-    if 'dbscan' in results:
-        cluster_labels_df['dbscan_cluster'] = results['dbscan']['labels']
-    
-    cluster_labels_df.to_csv(output_dir / "cluster_labels.csv", index=False)
-    
-    # Save sklearn models separately
-    models_dir = output_dir / "models"
-    models_dir.mkdir(exist_ok=True)
+            # Run with best parameters
+            if best_params:
+                eps, min_samples = best_params
+                # Same key as the grid-search cell, so the fit is reused; otherwise built on a radius graph
+                dbscan_result = analyzer.perform_dbscan_clustering(
+                    eps, min_samples, neighbors_graph=lambda: analyzer.build_dbscan_neighbors_graph(eps)
+                )
+                
+                # Analyze cluster content
+                dbscan_content = analyzer.analyze_cluster_content(dbscan_result['labels'], 'dbscan')
+                dbscan_result['cluster_analysis'] = dbscan_content
+                
+                results['dbscan'] = dbscan_result
     
-    if 'kmeans' in results:
-        joblib.dump(results['kmeans']['model'], models_dir / "kmeans_model.pkl")
+    # 4. kNN-graph community detection
+    if 'graph' in algorithms:
+        with profiler.span('graph'):
+            logger.info("Running kNN-graph community clustering...")
+            
+            graph_optimization = analyzer.optimize_graph_resolution()
+            results['graph_optimization'] = graph_optimization
+            
+            if graph_optimization['best_resolution'] is not None:
+                graph_result = analyzer.perform_graph_clustering(graph_optimization['best_resolution'])
+                graph_result['cluster_analysis'] = analyzer.analyze_cluster_content(graph_result['labels'], 'graph')
+                results['graph'] = graph_result
     
-    if 'hierarchical' in results:
-        for linkage_method, hier_result in results['hierarchical'].items():
-            joblib.dump(hier_result['model'], models_dir / f"hierarchical_{linkage_method}_model.pkl")
+    # 5. Consensus of all label sets above (and the bootstrap runs)
+    if 'consensus' in algorithms:
+        with profiler.span('consensus'):
+            logger.info("Running consensus clustering...")
+            
+            consensus_result = analyzer.perform_consensus_clustering(results)
+            consensus_result['cluster_analysis'] = analyzer.analyze_cluster_content(
+                consensus_result['labels'], 'consensus'
+            )
+            results['consensus'] = consensus_result
     
-    if 'dbscan' in results:
-        joblib.dump(results['dbscan']['model'], models_dir / "dbscan_model.pkl")
+    # Save results
+    with profiler.span('save_results'):
+        logger.info("Saving clustering results...")
+        
+        # Small JSON summary of metrics plus label arrays/centroids in a binary archive
+        save_results(results, output_dir)
+        
+        # Save cluster labels as CSV for each algorithm
+        cluster_labels_df = post_data[['post_id', 'title']].copy()
+        
+        if 'kmeans' in results:
+            cluster_labels_df['kmeans_cluster'] = results['kmeans']['labels']
+            # Reference distances for assign_posts.py drift checks
+            cluster_labels_df['kmeans_distance'] = analyzer.centroid_distances(results['kmeans']['model'])
+        
+        if 'stability' in results:
+            cluster_labels_df['kmeans_confidence'] = results['stability']['confidence']
+        
+        if 'hierarchical' in results:
+            for linkage_method, hier_result in results['hierarchical'].items():
+                cluster_labels_df[f'hierarchical_{linkage_method}_cluster'] = hier_result['labels']
+        
+        if 'dbscan' in results:
+            cluster_labels_df['dbscan_cluster'] = results['dbscan']['labels']
+        
+        if 'graph' in results:
+            cluster_labels_df['graph_cluster'] = results['graph']['labels']
+        
+        if 'consensus' in results:
+            cluster_labels_df['consensus_cluster'] = results['consensus']['labels']
+            cluster_labels_df['consensus_confidence'] = results['consensus']['confidence']
+        
+        cluster_labels_df.to_csv(output_dir / "cluster_labels.csv", index=False)
+        
+        # Save sklearn models separately
+        models_dir = output_dir / "models"
+        models_dir.mkdir(exist_ok=True)
+        
+        if 'kmeans' in results:
+            joblib.dump(results['kmeans']['model'], models_dir / "kmeans_model.pkl")
+        
+        # Hierarchical models are the linkage trees already persisted as models/linkage_{method}.npz
+        
+        if 'dbscan' in results:
+            joblib.dump(results['dbscan']['model'], models_dir / "dbscan_model.pkl")
+        
+        # Save preprocessing so new embeddings can be mapped into the clustering space
+        joblib.dump(
+            {'scaler': analyzer.scaler, 'reducer': analyzer.reducer, 'reduction_method': analyzer.reduction_method,
+             'engine': analyzer.engine},
+            models_dir / "preprocessing.pkl"
+        )
     
     logger.info(f"Results saved to {output_dir}")
     
@@ -578,20 +1323,80 @@ def main():
     parser.add_argument(
         '--algorithms',
         nargs='+',
-        choices=['kmeans', 'hierarchical', 'dbscan'],
+        choices=['kmeans', 'hierarchical', 'dbscan', 'graph', 'consensus'],
         default=['kmeans', 'hierarchical', 'dbscan'],
-        help="Clustering algorithms to run"
+        help="Clustering algorithms to run (graph = Leiden/Louvain on a kNN graph, "
+             "consensus = co-association consensus of the others)"
+    )
+    parser.add_argument(
+        '--n-jobs',
+        type=int,
+        default=config.CLUSTERING_N_JOBS,
+        help="Worker processes for parameter sweeps (-1 = all cores, 1 = serial)"
+    )
+    parser.add_argument(
+        '--reduction',
+        choices=PRE_REDUCTION_METHODS,
+        default=config.PRE_REDUCTION_METHOD,
+        help="Reduce scaled embeddings before clustering (default: full width)"
+    )
+    parser.add_argument(
+        '--reduction-dims',
+        type=int,
+        default=config.PRE_REDUCTION_DIMENSIONS,
+        help="Target dimensions for --reduction"
+    )
+    parser.add_argument(
+        '--engine',
+        choices=KMEANS_ENGINES,
+        default=config.CLUSTERING_ENGINE,
+        help="K-means engine for the k-sweep and final fit (minibatch streams from a memmap, spherical clusters by cosine)"
+    )
+    parser.add_argument(
+        '--tuner',
+        choices=TUNERS,
+        default='grid',
+        help="Parameter search: fixed config grids or successive halving on subsamples"
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="Refit everything without reading or writing the fit cache"
+    )
+    parser.add_argument(
+        '--clear-cache',
+        action='store_true',
+        help="Delete all cached fits before running"
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help="Also run each top-level stage under cProfile and keep the stats of the slowest one"
+    )
+    parser.add_argument(
+        '--stability',
+        action='store_true',
+        help="Bootstrap the final K-means fit to score per-cluster stability and per-post confidence"
     )
     
     args = parser.parse_args()
     
+    if args.clear_cache:
+        removed = FitCache().clear()
+        logger.info(f"Cleared {removed} cached fits")
+    
+    # Timing spans are always recorded; --profile adds cProfile
+    profiler.reset(use_cprofile=args.profile)
+    
     try:
         # Load data
         logger.info("Loading embeddings and post data...")
-        embeddings, post_data = load_embeddings_and_data(
-            embeddings_file=args.embeddings_file,
-            data_dir=args.data_dir
-        )
+        with profiler.span('load_data'):
+            embeddings, post_data = load_embeddings_and_data(
+                embeddings_file=args.embeddings_file,
+                data_dir=args.data_dir,
+                mmap=args.engine == 'minibatch'
+            )
         
         # Run analysis
         logger.info("Starting comprehensive clustering analysis...")
@@ -599,7 +1404,14 @@ def main():
             embeddings,
             post_data,
             output_dir=args.output_dir,
-            algorithms=args.algorithms
+            algorithms=args.algorithms,
+            n_jobs=args.n_jobs,
+            reduction=args.reduction,
+            reduction_dims=args.reduction_dims,
+            engine=args.engine,
+            tuner=args.tuner,
+            use_cache=False if args.no_cache else None,
+            stability=args.stability
         )
         
         # Print summary
@@ -608,8 +1420,24 @@ def main():
         print("="*60)
         
         for algo_name, algo_results in results.items():
+            if algo_name == 'halving_search':
+                print(f"\nHALVING SEARCH: {algo_results['n_evaluations']} evaluations "
+                      f"in {algo_results['elapsed_seconds']:.1f}s")
+                for pool, params in algo_results['best_params'].items():
+                    print(f"  {pool}: {params}")
+                continue
+            
             if 'optimization' in algo_name:
                 continue
+            
+            if algo_name == 'stability':
+                print(f"\nSTABILITY ({algo_results['n_resamples']} resamples of "
+                      f"{algo_results['sample_fraction']:.0%}):")
+                print(f"  Mean cluster Jaccard: {algo_results['mean_jaccard']:.3f}")
+                print(f"  Stable clusters (>= {config.STABILITY_STABLE_JACCARD}): "
+                      f"{len(algo_results['stable_clusters'])}/{len(algo_results['cluster_jaccard'])}")
+                print(f"  Mean post confidence: {algo_results['mean_confidence']:.3f}")
+                continue
                 
             print(f"\n{algo_name.upper()}:")
             
@@ -623,6 +1451,22 @@ def main():
                     print(f"  Silhouette Score: {algo_results['silhouette_score']:.3f}")
                     if 'n_noise' in algo_results:
                         print(f"  Noise Points: {algo_results['n_noise']}")
+                    if 'modularity' in algo_results:
+                        print(f"  Modularity: {algo_results['modularity']:.3f} "
+                              f"(resolution {algo_results['resolution']})")
+                    if 'mean_confidence' in algo_results:
+                        print(f"  Mean Confidence: {algo_results['mean_confidence']:.3f} "
+                              f"({len(algo_results['label_sets'])} label sets)")
+        
+        # Per-stage timings: Chrome/Perfetto trace plus a flat summary table
+        profile_paths = profiler.export(args.output_dir)
+        print("\n" + "="*60)
+        print("STAGE TIMINGS")
+        print("="*60)
+        print(profiler.summary().head(15).to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+        print(f"\nTrace: {profile_paths['trace']} (open in https://ui.perfetto.dev)")
+        if 'cprofile' in profile_paths:
+            print(f"cProfile of slowest stage: {profile_paths['cprofile_report']}")
         
         logger.info("Clustering analysis completed successfully!")
         
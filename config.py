@@ -64,14 +64,70 @@ CLUSTERING_ALGORITHMS = {
     'hierarchical': {
         'min_clusters': 5,
         'max_clusters': 30,
-        'linkage_methods': ['ward', 'complete', 'average']
+        'linkage_methods': ['ward', 'complete', 'average'],
+        'tree_levels': [5, 10, 15, 20, 25, 30]  # Cuts saved in hierarchical_cluster_tree.csv
     },
     'dbscan': {
         'eps_range': [0.1, 0.2, 0.3, 0.4, 0.5],
         'min_samples_range': [3, 5, 10, 15]
+    },
+    'graph': {
+        'n_neighbors': 15,  # Edges per post in the kNN graph (memory is O(N * n_neighbors))
+        'resolutions': [0.5, 1.0, 1.5, 2.0],  # Higher resolution -> more, smaller communities
+        'backend': 'auto'  # 'leiden' (needs igraph + leidenalg), 'louvain' (bundled) or 'auto'
+    },
+    'consensus': {
+        'min_coassociation': 0.5,  # kNN edges co-assigned by fewer (weighted) label sets are dropped
+        'resolution': 1.0,  # Community resolution on the co-association graph
+        'bootstrap_weight': 1.0  # Combined vote of all --stability runs (each algorithm's label set counts 1)
     }
 }
 
+# Successive-halving hyperparameter search (clustering_analysis.py --tuner halving)
+HALVING_SEARCH = {
+    'min_sample_size': 100,  # Rows in the first (smallest) rung
+    'eta': 3,                # Keep the top 1/eta candidates and grow the sample eta-fold per rung
+    'n_finalists': 2,        # Candidates per algorithm that get a full-data fit
+    'n_strata': 10,          # Coarse K-means strata used for stratified subsampling
+    'k_step': 1,             # k resolution for K-means and hierarchical candidates
+    'eps_steps': 17          # eps values spread over the dbscan eps_range
+}
+
+# Dimensionality pre-reduction before clustering (fitted once, cached in models/)
+PRE_REDUCTION_METHOD = None  # 'pca', 'svd', 'random_projection' or None for full width
+PRE_REDUCTION_DIMENSIONS = 128  # Target dimensions, e.g. 64, 128 or 256
+
+# K-means engine ('kmeans' = full batch in memory, 'minibatch' = MiniBatchKMeans streamed from a memmap,
+# 'spherical' = cosine k-means on L2-normalized embeddings)
+CLUSTERING_ENGINE = 'kmeans'
+SPHERICAL_BATCH_SIZE = 8192  # Rows per centroid-similarity matrix product in spherical k-means
+MINIBATCH_SIZE = 4096  # Rows read from the embeddings memmap per batch
+MINIBATCH_EPOCHS = 5   # Passes over the data for partial_fit
+MINIBATCH_METRIC_SAMPLE_SIZE = 10000  # Rows sampled for silhouette/CH/DB in minibatch mode
+
+# Disk memoization of clustering fits (clear with: python fit_cache.py --clear)
+FIT_CACHE_ENABLED = True
+FIT_CACHE_DIR = f"{OUTPUT_DIR}/cache/fits"
+FIT_CACHE_MAX_MB = 1024  # Least recently used fits are evicted beyond this size
+
+# Incremental assignment of new posts (python assign_posts.py)
+ASSIGN_OUTLIER_QUANTILE = 0.95  # Per-cluster distance quantile of fitted posts; farther new posts are outliers
+ASSIGN_MAX_OUTLIER_FRACTION = 0.25  # Recluster when more than this share of assigned posts are outliers
+ASSIGN_MAX_NEW_FRACTION = 0.10  # Recluster when assigned posts exceed this share of the fitted corpus
+
+# Cluster quality metrics (silhouette, Calinski-Harabasz and Davies-Bouldin in one chunked pass)
+METRICS_WORKING_MEMORY_MB = 256  # Upper bound for each chunk of pairwise distances
+METRICS_EXACT_SILHOUETTE_MAX_ROWS = 20000  # Larger label sets get a sampled silhouette with a 95% CI
+METRICS_SILHOUETTE_SAMPLE_SIZE = 10000  # Rows evaluated (against all rows) for the sampled silhouette
+
+# Bootstrap stability settings (clustering_analysis.py --stability)
+STABILITY_RESAMPLES = 100  # Warm-started K-means refits on random subsamples
+STABILITY_SAMPLE_FRACTION = 0.8  # Share of posts in each subsample (drawn without replacement)
+STABILITY_STABLE_JACCARD = 0.75  # Mean best-match Jaccard at or above which a cluster counts as stable
+
+# Parallelism settings
+CLUSTERING_N_JOBS = -1  # Worker processes for parameter sweeps (-1 = all cores, 1 = serial)
+
 # Optimal cluster number detection
 ELBOW_METHOD = True
 SILHOUETTE_ANALYSIS = True
@@ -84,15 +140,31 @@ TSNE_N_ITER = 1000
 UMAP_N_NEIGHBORS = 15
 UMAP_MIN_DIST = 0.1
 PCA_N_COMPONENTS = 50  # For initial dimensionality reduction before t-SNE/UMAP
+TSNE_BACKEND = 'auto'  # 'opentsne' (FFT-accelerated, multithreaded; pip install openTSNE), 'sklearn' or 'auto'
+REDUCTION_N_JOBS = -1  # Threads for t-SNE / UMAP (-1 = all cores)
+REDUCTION_CACHE_DIR = f"{OUTPUT_DIR}/cache/reductions"  # Cached 2-D coordinates and PCA basis
 
 # Visualization settings
 FIGURE_SIZE = (12, 8)
 DPI = 300
 SAVE_PLOTS = True
 PLOT_FORMAT = 'png'
+PLOT_N_JOBS = -1  # Worker processes for static plot rendering (-1 = all cores, 1 = serial)
+SCATTER_RENDERER = 'auto'  # 'points' (one marker per post), 'density' (binned pixel grid) or 'auto'
+SCATTER_DENSITY_MIN_POINTS = 20000  # 'auto' switches static scatter plots to density rendering above this
+SCATTER_DENSITY_RESOLUTION = 1200  # Density grid pixels along the longer axis
+SCATTER_DENSITY_SPREAD = 1  # Pixels each point is widened by in density plots (0 = single pixel)
+WORDCLOUD_FIELD = 'title'  # Text the K-means word clouds are drawn from: 'title' or 'content'
+WORDCLOUD_MAX_WORDS = 50
+WORDCLOUD_SIZE = (800, 600)  # Pixels per cloud
+WORDCLOUD_TILES = False  # True writes one image per cluster (plots/wordclouds/) instead of a single grid figure
+WORDCLOUD_N_JOBS = -1  # Processes generating the clouds of the grid figure (-1 = all cores; 1 inside plot worker processes)
+DASHBOARD_INCLUDE_PLOTLYJS = True  # Embed plotly.js once in interactive_dashboard.html (True) or load it from 'cdn'
 
 # Analysis settings
 GENERATE_CLUSTER_SUMMARIES = True
 TOP_WORDS_PER_CLUSTER = 20
+TERM_MATRIX_CACHE_DIR = f"{OUTPUT_DIR}/cache/terms"  # Cached sparse document-term matrices
+EXTRA_STOP_WORDS = []  # Added to scikit-learn's bundled English stopword list
 MIN_CLUSTER_SIZE = 3  # Minimum posts per cluster for analysis
 TOPIC_MODELING = True  # Generate topic summaries for clusters
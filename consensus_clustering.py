@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Consensus Clustering
+====================
+
+Reconciles the label sets of every algorithm (and the bootstrap stability runs)
+into one partition. The co-association of two posts is the weighted share of
+label sets that put them in the same cluster; noise (-1) is never co-assigned.
+It is only evaluated on the edges of a sparse candidate graph (the kNN graph of
+the embeddings), so memory is O(N * k * label sets) and never N x N. Edges below
+a minimum co-association are dropped and the remaining graph is split into
+communities; each post's confidence is its mean co-association with the other
+members of its consensus cluster, computed exactly from per-label-set
+contingency counts.
+"""
+
+import logging
+from typing import Any, Dict, List
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+# Load configuration
+import config
+from cluster_stability import coassignment_confidence
+from graph_clustering import find_communities, modularity
+
+logger = logging.getLogger(__name__)
+
+
+def coassociation_graph(label_sets: np.ndarray, weights: np.ndarray, candidates: csr_matrix,
+                        min_coassociation: float = 0.0) -> csr_matrix:
+    """Weighted co-association of every candidate edge, keeping edges >= min_coassociation"""
+    candidates = candidates.tocoo()
+    rows, cols = candidates.row, candidates.col
+    weights = np.asarray(weights, dtype=np.float64)
+
+    coassociation = np.zeros(len(rows))
+    for labels, weight in zip(label_sets, weights):
+        coassociation += weight * ((labels[rows] == labels[cols]) & (labels[rows] >= 0))
+    coassociation /= weights.sum()
+
+    keep = (coassociation >= min_coassociation) & (coassociation > 0) & (rows != cols)
+    n_rows = label_sets.shape[1]
+    return csr_matrix((coassociation[keep], (rows[keep], cols[keep])), shape=(n_rows, n_rows))
+
+
+def consensus_clustering(label_sets: np.ndarray, weights: np.ndarray, candidates: csr_matrix,
+                         min_coassociation: float = None, resolution: float = None,
+                         backend: str = 'auto') -> Dict[str, Any]:
+    """One consensus label and a confidence score per post from stacked label sets (M x N)"""
+    consensus_config = config.CLUSTERING_ALGORITHMS['consensus']
+    min_coassociation = consensus_config['min_coassociation'] if min_coassociation is None else min_coassociation
+    resolution = consensus_config['resolution'] if resolution is None else resolution
+    label_sets = np.asarray(label_sets, dtype=np.int64)
+
+    graph = coassociation_graph(label_sets, weights, candidates, min_coassociation)
+    logger.info(f"Co-association graph: {graph.nnz} edges from {len(label_sets)} label sets")
+
+    labels = find_communities(graph, resolution, backend)
+    confidence = coassignment_confidence(labels, label_sets, weights)
+
+    return {
+        'labels': labels,
+        'confidence': confidence,
+        'n_clusters': int(labels.max()) + 1,
+        'n_singletons': int(np.sum(np.bincount(labels) == 1)),
+        'n_edges': int(graph.nnz),
+        'min_coassociation': min_coassociation,
+        'resolution': resolution,
+        'modularity': modularity(graph, labels, resolution) if graph.nnz else 0.0,
+        'mean_confidence': float(confidence.mean())
+    }
+
+
+def collect_label_sets(results: Dict[str, Any], bootstrap_weight: float = None) -> Dict[str, Any]:
+    """Stack every final label set in a results dict; the bootstrap runs share bootstrap_weight votes"""
+    if bootstrap_weight is None:
+        bootstrap_weight = config.CLUSTERING_ALGORITHMS['consensus']['bootstrap_weight']
+
+    names: List[str] = []
+    label_sets = []
+    for name in ('kmeans', 'dbscan', 'graph'):
+        if name in results:
+            names.append(name)
+            label_sets.append(results[name]['labels'])
+    for linkage_method, hier_result in results.get('hierarchical', {}).items():
+        names.append(f'hierarchical/{linkage_method}')
+        label_sets.append(hier_result['labels'])
+    weights = [1.0] * len(label_sets)
+
+    bootstrap = results.get('stability', {}).get('bootstrap_labels')
+    if bootstrap is not None and bootstrap_weight > 0:
+        names.append(f'stability/bootstrap_labels ({len(bootstrap)} runs)')
+        label_sets.extend(bootstrap)
+        weights.extend([bootstrap_weight / len(bootstrap)] * len(bootstrap))
+
+    return {'names': names, 'label_sets': np.vstack(label_sets), 'weights': np.asarray(weights)}
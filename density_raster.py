@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Density Rasterization
+=====================
+
+Aggregation-based rendering of very large 2-D scatter plots, in the spirit of
+datashader. Points are binned into a fixed pixel grid with numpy; each pixel
+is coloured by the mean colour of the clusters of its points and made more
+opaque the more points it holds (log scale). Drawing the result is a single
+image, so plot rendering time and file size no longer grow with the number
+of points.
+"""
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+Extent = Tuple[float, float, float, float]
+
+NOISE_RGB = (0.55, 0.55, 0.55)
+
+
+def data_extent(coords: np.ndarray, padding: float = 0.02) -> Extent:
+    """(xmin, xmax, ymin, ymax) of the points with a small margin"""
+    low, high = coords.min(axis=0), coords.max(axis=0)
+    margin = np.maximum(high - low, 1e-9) * padding
+    return float(low[0] - margin[0]), float(high[0] + margin[0]), float(low[1] - margin[1]), float(high[1] + margin[1])
+
+
+def grid_shape(extent: Extent, resolution: int) -> Tuple[int, int]:
+    """(height, width) in pixels with `resolution` pixels along the longer axis"""
+    x_span, y_span = extent[1] - extent[0], extent[3] - extent[2]
+    if x_span >= y_span:
+        return max(1, int(round(resolution * y_span / x_span))), resolution
+    return resolution, max(1, int(round(resolution * x_span / y_span)))
+
+
+def spread_grid(grid: np.ndarray, radius: int) -> np.ndarray:
+    """Sum every pixel's (2 radius + 1)^2 neighbourhood, so isolated points stay visible"""
+    if radius <= 0:
+        return grid
+    height, width = grid.shape[:2]
+    padded = np.pad(grid, [(radius, radius), (radius, radius)] + [(0, 0)] * (grid.ndim - 2))
+    spread = np.zeros_like(grid)
+    for dy in range(2 * radius + 1):
+        for dx in range(2 * radius + 1):
+            spread += padded[dy:dy + height, dx:dx + width]
+    return spread
+
+
+def rasterize_clusters(coords: np.ndarray, labels: np.ndarray, cluster_colors: Sequence,
+                       resolution: int = 800, extent: Extent = None, spread: int = 0,
+                       min_alpha: float = 0.5) -> Tuple[np.ndarray, Extent]:
+    """RGBA image (height x width x 4, origin lower-left) of points coloured by cluster
+
+    cluster_colors[i] is the RGB(A) colour of the i-th sorted non-noise label; noise
+    (-1) is grey. Every point covers a square of 2 spread + 1 pixels. Returns the
+    image and the data extent it covers.
+    """
+    coords = np.asarray(coords, dtype=np.float64)
+    labels = np.asarray(labels)
+    extent = extent or data_extent(coords)
+    height, width = grid_shape(extent, resolution)
+
+    # Pixel of every point
+    ix = ((coords[:, 0] - extent[0]) / (extent[1] - extent[0]) * width).astype(np.int64)
+    iy = ((coords[:, 1] - extent[2]) / (extent[3] - extent[2]) * height).astype(np.int64)
+    pixel = np.clip(iy, 0, height - 1) * width + np.clip(ix, 0, width - 1)
+
+    # Palette row of every point (noise gets the extra last row)
+    clusters = np.unique(labels[labels >= 0])
+    palette = np.vstack([np.asarray(cluster_colors, dtype=np.float64)[:len(clusters), :3], NOISE_RGB])
+    codes = np.where(labels >= 0, np.searchsorted(clusters, labels), len(clusters))
+
+    # Point count and summed point colour per pixel; everything after this is O(pixels)
+    n_pixels = height * width
+    grid = np.empty((height, width, 4))
+    grid[..., 3] = np.bincount(pixel, minlength=n_pixels).reshape(height, width)
+    for channel in range(3):
+        grid[..., channel] = np.bincount(pixel, weights=palette[codes, channel],
+                                         minlength=n_pixels).reshape(height, width)
+    grid = spread_grid(grid, spread).reshape(n_pixels, 4)
+
+    counts = grid[:, 3]
+    occupied = counts > 0
+    image = np.zeros((n_pixels, 4))
+    image[occupied, :3] = grid[occupied, :3] / counts[occupied, None]
+
+    # Opacity grows with the log of the point count
+    density = np.log1p(counts[occupied]) / np.log1p(counts.max())
+    image[occupied, 3] = min_alpha + (1 - min_alpha) * density
+
+    return image.reshape(height, width, 4), extent
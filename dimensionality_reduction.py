@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Dimensionality Reduction Engines
+================================
+
+2-D projections used by visualize_clusters.py. t-SNE runs on openTSNE's
+FFT-accelerated, multithreaded gradient (FIt-SNE) when openTSNE is installed
+and falls back to scikit-learn's Barnes-Hut t-SNE otherwise; UMAP runs on the
+PCA-reduced matrix rather than the full embedding width. Every engine takes an
+explicit thread count. Fitted UMAP models and openTSNE embeddings can place new
+posts into an existing map without refitting it.
+"""
+
+import inspect
+import logging
+from typing import Any, Dict, Tuple
+
+import numpy as np
+import sklearn
+from sklearn.decomposition import PCA
+from sklearn.manifold import TSNE
+from sklearn.neighbors import NearestNeighbors
+from threadpoolctl import threadpool_limits
+from joblib import effective_n_jobs
+
+# Optional backends
+try:
+    import openTSNE
+except ImportError:
+    openTSNE = None
+
+try:
+    import umap
+except ImportError:
+    umap = None
+
+logger = logging.getLogger(__name__)
+
+TSNE_BACKENDS = ['auto', 'opentsne', 'sklearn']
+
+# scikit-learn renamed TSNE(n_iter=...) to max_iter in 1.5 and removed n_iter in 1.7
+_SKLEARN_TSNE_ITER_PARAM = 'max_iter' if 'max_iter' in inspect.signature(TSNE).parameters else 'n_iter'
+
+
+def resolve_tsne_backend(backend: str = 'auto') -> str:
+    """Concrete t-SNE backend for a requested one"""
+    if backend not in TSNE_BACKENDS:
+        raise ValueError(f"Unknown t-SNE backend: {backend} (choose from {TSNE_BACKENDS})")
+    if backend == 'opentsne' and openTSNE is None:
+        raise ImportError("The opentsne backend requires openTSNE (pip install openTSNE)")
+    if backend == 'auto':
+        return 'opentsne' if openTSNE is not None else 'sklearn'
+    return backend
+
+
+def backend_version(backend: str) -> str:
+    """Library version behind a reduction backend (part of the reduction cache key)"""
+    if backend == 'opentsne':
+        return openTSNE.__version__
+    if backend == 'umap':
+        return umap.__version__
+    return sklearn.__version__
+
+
+def run_pca(data: np.ndarray, n_components: int, random_state: int = 42) -> Dict[str, np.ndarray]:
+    """PCA coordinates plus the basis needed to project new rows"""
+    n_components = min(n_components, *data.shape)
+    pca = PCA(n_components=n_components, random_state=random_state)
+    return {
+        'coords': pca.fit_transform(data),
+        'components': pca.components_,
+        'mean': pca.mean_,
+        'explained_variance_ratio': pca.explained_variance_ratio_
+    }
+
+
+def fit_tsne(data: np.ndarray, perplexity: float, n_iter: int, n_jobs: int = -1,
+             backend: str = 'auto', random_state: int = 42) -> Tuple[np.ndarray, Any]:
+    """2-D t-SNE coordinates plus, for openTSNE, the embedding that can place new points"""
+    backend = resolve_tsne_backend(backend)
+    perplexity = min(perplexity, len(data) - 1)
+    n_threads = effective_n_jobs(n_jobs)
+
+    if backend == 'opentsne':
+        tsne = openTSNE.TSNE(
+            n_components=2, perplexity=perplexity, n_iter=n_iter, initialization='pca',
+            negative_gradient_method='fft', n_jobs=n_threads, random_state=random_state
+        )
+        embedding = tsne.fit(data)
+        return np.asarray(embedding), embedding
+
+    tsne = TSNE(
+        n_components=2, perplexity=perplexity, init='pca', random_state=random_state,
+        n_jobs=n_threads, **{_SKLEARN_TSNE_ITER_PARAM: n_iter}
+    )
+    # The Barnes-Hut gradient uses OpenMP threads
+    with threadpool_limits(limits=n_threads):
+        return tsne.fit_transform(data), None
+
+
+def run_tsne(data: np.ndarray, perplexity: float, n_iter: int, n_jobs: int = -1,
+             backend: str = 'auto', random_state: int = 42) -> np.ndarray:
+    """2-D t-SNE coordinates (FFT-accelerated openTSNE or Barnes-Hut scikit-learn)"""
+    return fit_tsne(data, perplexity, n_iter, n_jobs, backend, random_state)[0]
+
+
+def fit_umap(data: np.ndarray, n_neighbors: int, min_dist: float, n_jobs: int = -1,
+             random_state: int = 42) -> Tuple[np.ndarray, Any]:
+    """2-D UMAP coordinates and the fitted model
+
+    umap-learn runs single-threaded when seeded; random_state=None trades
+    reproducibility for n_jobs threads.
+    """
+    if umap is None:
+        raise ImportError("UMAP requires umap-learn (pip install umap-learn)")
+    reducer = umap.UMAP(
+        n_components=2, n_neighbors=min(n_neighbors, len(data) - 1), min_dist=min_dist,
+        random_state=random_state, n_jobs=effective_n_jobs(n_jobs)
+    )
+    return reducer.fit_transform(data), reducer
+
+
+def run_umap(data: np.ndarray, n_neighbors: int, min_dist: float, n_jobs: int = -1,
+             random_state: int = 42) -> np.ndarray:
+    """2-D UMAP coordinates"""
+    return fit_umap(data, n_neighbors, min_dist, n_jobs, random_state)[0]
+
+
+def project_pca(basis: Dict[str, np.ndarray], data: np.ndarray) -> np.ndarray:
+    """New rows in a stored PCA basis"""
+    return (data - basis['mean']) @ basis['components'].T
+
+
+def interpolate_coords(fitted_data: np.ndarray, fitted_coords: np.ndarray, new_data: np.ndarray,
+                       n_neighbors: int = 10) -> np.ndarray:
+    """Place new rows at the distance-weighted mean map position of their nearest fitted rows"""
+    n_neighbors = min(n_neighbors, len(fitted_data))
+    distances, indices = NearestNeighbors(n_neighbors=n_neighbors).fit(fitted_data).kneighbors(new_data)
+    weights = 1.0 / np.maximum(distances, 1e-12)
+    weights /= weights.sum(axis=1, keepdims=True)
+    return np.einsum('ij,ijk->ik', weights, fitted_coords[indices])
+
+
+def transform_coords(model: Any, fitted_data: np.ndarray, fitted_coords: np.ndarray,
+                     new_data: np.ndarray) -> np.ndarray:
+    """Project new rows into an existing map without refitting it
+
+    Uses the model's own transform (UMAP, openTSNE) when there is one, otherwise
+    (scikit-learn t-SNE) interpolates from the nearest fitted rows.
+    """
+    if model is None:
+        return interpolate_coords(fitted_data, fitted_coords, new_data)
+    return np.asarray(model.transform(new_data))
+
+
+def neighborhood_preservation(high: np.ndarray, low: np.ndarray, n_neighbors: int = 10,
+                              sample_size: int = 2000, random_state: int = 42) -> float:
+    """Mean share of each point's k nearest high-dimensional neighbours kept among its k nearest in 2-D
+
+    Evaluated for a random sample of query points against all points, so it stays O(N k).
+    """
+    rng = np.random.RandomState(random_state)
+    queries = rng.choice(len(high), min(sample_size, len(high)), replace=False)
+
+    def neighbours(data):
+        index = NearestNeighbors(n_neighbors=n_neighbors + 1).fit(data)
+        return index.kneighbors(data[queries], return_distance=False)[:, 1:]
+
+    high_neighbours, low_neighbours = neighbours(high), neighbours(low)
+    overlap = [len(np.intersect1d(h, l, assume_unique=True)) for h, l in zip(high_neighbours, low_neighbours)]
+    return float(np.mean(overlap) / n_neighbors)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Clustering Fit Cache
+====================
+
+Disk memoization for clustering fits. Entries are keyed by the embedding matrix
+fingerprint, the preprocessing settings and the algorithm parameters, so re-running
+clustering_analysis.py after a reporting-only change reloads labels, centroids and
+metrics instead of refitting. The cache is capped in size (least recently used
+entries are evicted first).
+
+Usage:
+    python fit_cache.py [--clear] [--info]
+"""
+
+import argparse
+import logging
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+import joblib
+
+# Load configuration
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class FitCache:
+    """Size-capped on-disk store of clustering results"""
+
+    def __init__(self, cache_dir: str = None, max_mb: float = None):
+        self.cache_dir = Path(cache_dir or config.FIT_CACHE_DIR)
+        self.max_bytes = int((max_mb if max_mb is not None else config.FIT_CACHE_MAX_MB) * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss"""
+        path = self._path(key)
+        if not path.exists():
+            self.misses += 1
+            return None
+
+        try:
+            value = joblib.load(path)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        # Mark as recently used for LRU eviction
+        os.utime(path)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store value under key and evict old entries beyond the size cap"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path(key).with_suffix('.tmp')
+        joblib.dump(value, tmp_path)
+        tmp_path.replace(self._path(key))
+        self._evict()
+
+    def _entries(self):
+        return sorted(self.cache_dir.glob("*.pkl"), key=lambda p: p.stat().st_mtime) if self.cache_dir.exists() else []
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        total = sum(p.stat().st_size for p in entries)
+        while entries and total > self.max_bytes:
+            oldest = entries.pop(0)
+            total -= oldest.stat().st_size
+            oldest.unlink(missing_ok=True)
+            logger.debug(f"Evicted cache entry {oldest.name}")
+
+    def size_bytes(self) -> int:
+        return sum(p.stat().st_size for p in self._entries())
+
+    def clear(self) -> int:
+        """Delete every entry and return how many were removed"""
+        entries = self._entries()
+        for path in entries:
+            path.unlink(missing_ok=True)
+        return len(entries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or clear the clustering fit cache")
+    parser.add_argument('--cache-dir', default=config.FIT_CACHE_DIR, help="Cache directory")
+    parser.add_argument('--clear', action='store_true', help="Delete all cached fits")
+    parser.add_argument('--info', action='store_true', help="Show cache size and entry count")
+    args = parser.parse_args()
+
+    cache = FitCache(args.cache_dir)
+    if args.clear:
+        print(f"Removed {cache.clear()} cached fits from {cache.cache_dir}")
+    if args.info or not args.clear:
+        print(f"{cache.cache_dir}: {len(cache._entries())} entries, "
+              f"{cache.size_bytes() / 1024 / 1024:.1f} MB (cap {cache.max_bytes / 1024 / 1024:.0f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Hierarchical Linkage Trees
+==========================
+
+Computes one full scipy linkage matrix per linkage method, persists it next to the
+other clustering models, and derives flat labels for any number of clusters by
+cutting the stored tree (no refitting). Cluster-level trees are built from
+size-weighted centroids, so they cost O(K^3) for K clusters whatever the corpus size.
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+from scipy.cluster.hierarchy import fcluster, linkage
+from scipy.spatial.distance import pdist, squareform
+
+# Load configuration
+import config
+from cache_utils import array_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Distance used by each linkage method (ward is only defined for euclidean)
+LINKAGE_METRICS = {
+    'ward': 'euclidean',
+    'complete': 'cosine',
+    'average': 'cosine',
+    'single': 'cosine'
+}
+
+
+def linkage_path(method: str, models_dir: str = None) -> Path:
+    """Location of the persisted linkage matrix for a method"""
+    models_dir = Path(models_dir or Path(config.OUTPUT_DIR) / "models")
+    return models_dir / f"linkage_{method}.npz"
+
+
+def compute_linkage_matrix(data: np.ndarray, method: str) -> np.ndarray:
+    """Compute the full linkage matrix for all rows of data"""
+    if method not in LINKAGE_METRICS:
+        raise ValueError(f"Unknown linkage method: {method} (choose from {list(LINKAGE_METRICS)})")
+
+    if method == 'ward':
+        return linkage(data, method='ward')
+    return linkage(pdist(data, metric=LINKAGE_METRICS[method]), method=method)
+
+
+def load_linkage_matrix(method: str, models_dir: str = None, fingerprint: str = None) -> Optional[np.ndarray]:
+    """Load a stored linkage matrix, optionally requiring it to match a data fingerprint"""
+    path = linkage_path(method, models_dir)
+    if not path.exists():
+        return None
+
+    with np.load(path) as stored:
+        if fingerprint is not None and str(stored['fingerprint']) != fingerprint:
+            return None
+        return stored['linkage']
+
+
+def load_or_compute_linkage(data: np.ndarray, method: str, models_dir: str = None) -> np.ndarray:
+    """Return the linkage matrix for data, computing and persisting it only on a cache miss"""
+    fingerprint = array_fingerprint(data)
+    linkage_matrix = load_linkage_matrix(method, models_dir, fingerprint)
+    if linkage_matrix is not None:
+        logger.info(f"Loaded stored {method} linkage tree")
+        return linkage_matrix
+
+    logger.info(f"Computing full {method} linkage tree for {len(data)} points...")
+    linkage_matrix = compute_linkage_matrix(data, method)
+
+    path = linkage_path(method, models_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(path, linkage=linkage_matrix, fingerprint=fingerprint)
+    return linkage_matrix
+
+
+def cut_tree_labels(linkage_matrix: np.ndarray, n_clusters: int) -> np.ndarray:
+    """Flat 0-based labels for n_clusters obtained by cutting the tree"""
+    return fcluster(linkage_matrix, t=n_clusters, criterion='maxclust') - 1
+
+
+def build_cluster_tree(linkage_matrix: np.ndarray, levels: Iterable[int]) -> Dict[int, np.ndarray]:
+    """Nested labelings of the same tree at several resolutions"""
+    return {n_clusters: cut_tree_labels(linkage_matrix, n_clusters) for n_clusters in levels}
+
+
+def weighted_centroid_linkage(centroids: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+    """Ward linkage over cluster centroids, each weighted by its cluster size
+
+    Two clusters a and b start at Ward distance sqrt(2 n_a n_b / (n_a + n_b)) * |c_a - c_b|,
+    the cost of merging every post of a with every post of b, and merges are updated with
+    the Lance-Williams recurrence. The count column holds clusters (scipy leaves), not posts.
+    Deterministic (ties go to the lowest pair of indices).
+    """
+    sizes = np.asarray(sizes, dtype=np.float64)
+    n = len(sizes)
+    linkage_matrix = np.empty((max(n - 1, 0), 4))
+
+    dist = 2 * np.outer(sizes, sizes) / np.add.outer(sizes, sizes) * squareform(pdist(centroids, 'sqeuclidean'))
+    np.fill_diagonal(dist, np.inf)
+    node_ids = np.arange(n)
+    node_sizes = sizes.copy()
+    node_leaves = np.ones(n)
+
+    for step in range(n - 1):
+        i, j = np.unravel_index(np.argmin(dist), dist.shape)
+        i, j = min(i, j), max(i, j)
+        linkage_matrix[step] = [
+            min(node_ids[i], node_ids[j]), max(node_ids[i], node_ids[j]),
+            np.sqrt(dist[i, j]), node_leaves[i] + node_leaves[j]
+        ]
+
+        # Merged node replaces i; j is retired
+        merged = ((node_sizes[i] + node_sizes) * dist[i] + (node_sizes[j] + node_sizes) * dist[j]
+                  - node_sizes * dist[i, j]) / (node_sizes[i] + node_sizes[j] + node_sizes)
+        dist[i, :] = dist[:, i] = merged
+        dist[j, :] = dist[:, j] = np.inf
+        dist[i, i] = np.inf
+        node_sizes[i] += node_sizes[j]
+        node_leaves[i] += node_leaves[j]
+        node_ids[i] = n + step
+
+    return linkage_matrix
@@ -153,6 +153,7 @@ def create_project_summary():
         "data_files": [
             "processed_data/blog_embeddings.npy",
             "processed_data/clustering_results.json",
+            "processed_data/clustering_arrays.npz",
             "processed_data/cluster_labels.csv"
         ],
         "documentation": [
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Plot Manifest
+=============
+
+Dependency tracking for the artifacts written by visualize_clusters.py. Every
+plot declares its inputs (label sets, 2-D coordinates, metrics, config values);
+one fingerprint per input is stored in plots/plot_inputs.json next to the
+outputs, so a run rebuilds only the plots whose inputs changed or whose file
+is missing.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from cache_utils import array_fingerprint, params_fingerprint
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "plot_inputs.json"
+
+
+def _jsonable(value: Any) -> Any:
+    """Nested value with arrays and frames replaced by their fingerprints"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        columns = list(value.columns) if isinstance(value, pd.DataFrame) else [value.name]
+        rows = pd.util.hash_pandas_object(value, index=False).to_numpy()
+        return {'columns': [str(column) for column in columns], 'rows': array_fingerprint(rows)}
+    if isinstance(value, np.ndarray):
+        return array_fingerprint(value)
+    if isinstance(value, dict):
+        return {str(key): _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def input_fingerprint(value: Any) -> str:
+    """Stable hash of one plot input (array, DataFrame, nested dict/list or scalar)"""
+    return params_fingerprint(value=_jsonable(value))
+
+
+class PlotManifest:
+    """Input fingerprints of every plot in a plots directory, keyed by output file name"""
+
+    def __init__(self, plots_dir: Path):
+        self.path = Path(plots_dir) / MANIFEST_NAME
+        self.entries: Dict[str, Dict[str, str]] = {}
+        if self.path.exists():
+            try:
+                self.entries = json.loads(self.path.read_text())
+            except ValueError as e:
+                logger.warning(f"Ignoring unreadable plot manifest {self.path.name}: {e}")
+
+    @staticmethod
+    def fingerprints(inputs: Dict[str, Any]) -> Dict[str, str]:
+        return {name: input_fingerprint(value) for name, value in inputs.items()}
+
+    def changed_inputs(self, output: Path, fingerprints: Dict[str, str]) -> List[str]:
+        """Inputs whose fingerprint differs from the one the output was built from"""
+        recorded = self.entries.get(output.name, {})
+        return sorted(name for name in set(recorded) | set(fingerprints) if recorded.get(name) != fingerprints.get(name))
+
+    def is_current(self, output: Path, fingerprints: Dict[str, str]) -> bool:
+        return output.exists() and self.entries.get(output.name) == fingerprints
+
+    def record(self, output: Path, fingerprints: Dict[str, str]) -> None:
+        self.entries[output.name] = fingerprints
+
+    def forget(self, output: Path) -> None:
+        """Mark an output as rebuilt outside dependency tracking"""
+        self.entries.pop(output.name, None)
+
+    def save(self) -> None:
+        self.path.write_text(json.dumps(self.entries, indent=2, sort_keys=True))
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Stage Profiling
+===============
+
+Lightweight timing spans for the clustering pipeline. Each span records wall
+time and the peak resident memory (RSS) of the process while it was open; spans
+nest, and work done in joblib workers can be timed there and reported back.
+Spans are exported as a Chrome trace (open in chrome://tracing or
+https://ui.perfetto.dev) and as a flat per-stage summary table. Optionally each
+top-level stage runs under cProfile and the stats of the slowest one are kept.
+
+Usage:
+    from profiling import profiler
+    with profiler.span('kmeans_sweep', k=10):
+        ...
+"""
+
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+RSS_SAMPLE_INTERVAL = 0.05  # Seconds between RSS samples while spans are open
+
+
+def current_rss() -> int:
+    """Resident set size of this process in bytes"""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def timed_call(func: Callable, *args, name: str = None, **span_args) -> Tuple[Any, Dict[str, Any]]:
+    """Run func in a worker and return (result, span record) for StageProfiler.add_span"""
+    start = time.time()
+    result = func(*args)
+    end = time.time()
+    span = {
+        'name': name or func.__name__, 'cat': 'worker', 'start': start, 'end': end,
+        'pid': os.getpid(), 'tid': os.getpid(), 'peak_rss': current_rss(), 'depth': 1, 'args': span_args
+    }
+    return result, span
+
+
+class StageProfiler:
+    """Collects nested timing spans with per-span peak RSS"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sampler: Optional[threading.Thread] = None
+        self.reset()
+
+    def reset(self, use_cprofile: bool = False) -> None:
+        """Drop recorded spans and choose whether top-level stages run under cProfile"""
+        with self._lock:
+            self.spans: List[Dict[str, Any]] = []
+            self.use_cprofile = use_cprofile
+            self.stage_profiles: Dict[int, cProfile.Profile] = {}
+            self._open: List[Dict[str, Any]] = []
+
+    def _sample_rss(self) -> None:
+        while True:
+            time.sleep(RSS_SAMPLE_INTERVAL)
+            with self._lock:
+                if not self._open:
+                    continue
+                rss = current_rss()
+                for span in self._open:
+                    span['peak_rss'] = max(span['peak_rss'], rss)
+
+    def _start_sampler(self) -> None:
+        if self._sampler is None:
+            self._sampler = threading.Thread(target=self._sample_rss, daemon=True)
+            self._sampler.start()
+
+    @contextmanager
+    def span(self, name: str, cat: str = 'stage', **args):
+        """Time a block; top-level spans are also run under cProfile when enabled"""
+        rss = current_rss()
+        record = {
+            'name': name, 'cat': cat, 'start': time.time(), 'pid': os.getpid(),
+            'tid': threading.get_ident(), 'peak_rss': rss, 'depth': len(self._open), 'args': args
+        }
+        with self._lock:
+            self._open.append(record)
+        self._start_sampler()
+
+        profile = None
+        if self.use_cprofile and record['depth'] == 0:
+            profile = cProfile.Profile()
+            profile.enable()
+        try:
+            yield record
+        finally:
+            if profile is not None:
+                profile.disable()
+            record['end'] = time.time()
+            record['peak_rss'] = max(record['peak_rss'], current_rss())
+            with self._lock:
+                self._open.remove(record)
+                # A parent's peak is at least its children's peak
+                for parent in self._open:
+                    parent['peak_rss'] = max(parent['peak_rss'], record['peak_rss'])
+            self.spans.append(record)
+            if profile is not None:
+                self.stage_profiles[id(record)] = profile
+
+    def profiled(self, name: str = None, cat: str = 'stage') -> Callable:
+        """Decorator form of span()"""
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name or func.__name__, cat):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def add_span(self, span: Dict[str, Any]) -> None:
+        """Add a span recorded elsewhere (e.g. by timed_call in a worker process)"""
+        span = dict(span, depth=len(self._open))
+        self.spans.append(span)
+
+    def summary(self) -> pd.DataFrame:
+        """One row per span name: calls, total/mean/max seconds and peak RSS"""
+        if not self.spans:
+            return pd.DataFrame(columns=['stage', 'category', 'calls', 'total_s', 'mean_s', 'max_s', 'peak_rss_mb'])
+
+        frame = pd.DataFrame([
+            {'stage': s['name'], 'category': s['cat'], 'seconds': s['end'] - s['start'],
+             'peak_rss_mb': s['peak_rss'] / 1024 / 1024}
+            for s in self.spans
+        ])
+        table = frame.groupby(['stage', 'category'], sort=False).agg(
+            calls=('seconds', 'size'),
+            total_s=('seconds', 'sum'),
+            mean_s=('seconds', 'mean'),
+            max_s=('seconds', 'max'),
+            peak_rss_mb=('peak_rss_mb', 'max')
+        ).reset_index()
+        return table.sort_values('total_s', ascending=False).reset_index(drop=True)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Spans as Chrome trace 'complete' events (microsecond timestamps)"""
+        origin = min((s['start'] for s in self.spans), default=0.0)
+        events = []
+        for s in self.spans:
+            events.append({
+                'name': s['name'], 'cat': s['cat'], 'ph': 'X',
+                'ts': (s['start'] - origin) * 1e6, 'dur': (s['end'] - s['start']) * 1e6,
+                'pid': s['pid'], 'tid': s['tid'],
+                'args': {**{k: str(v) for k, v in s['args'].items()}, 'peak_rss_mb': round(s['peak_rss'] / 1024 / 1024, 1)}
+            })
+            events.append({
+                'name': 'peak_rss_mb', 'ph': 'C', 'ts': (s['end'] - origin) * 1e6, 'pid': s['pid'],
+                'args': {'peak_rss_mb': round(s['peak_rss'] / 1024 / 1024, 1)}
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def hottest_stage_stats(self, limit: int = 30) -> Optional[Tuple[str, pstats.Stats, str]]:
+        """(stage name, stats, text report) of the slowest cProfiled top-level stage"""
+        profiled = [s for s in self.spans if id(s) in self.stage_profiles]
+        if not profiled:
+            return None
+
+        hottest = max(profiled, key=lambda s: s['end'] - s['start'])
+        stream = io.StringIO()
+        stats = pstats.Stats(self.stage_profiles[id(hottest)], stream=stream)
+        stats.sort_stats('cumulative').print_stats(limit)
+        return hottest['name'], stats, stream.getvalue()
+
+    def export(self, output_dir: str) -> Dict[str, Path]:
+        """Write trace.json, stage_summary.csv and (with cProfile) the hottest stage's stats"""
+        profile_dir = Path(output_dir) / "profile"
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        paths = {'trace': profile_dir / "trace.json", 'summary': profile_dir / "stage_summary.csv"}
+
+        with open(paths['trace'], 'w') as f:
+            json.dump(self.chrome_trace(), f)
+        self.summary().to_csv(paths['summary'], index=False)
+
+        hottest = self.hottest_stage_stats()
+        if hottest is not None:
+            name, stats, report = hottest
+            paths['cprofile'] = profile_dir / f"hottest_stage_{name}.prof"
+            stats.dump_stats(paths['cprofile'])
+            paths['cprofile_report'] = profile_dir / f"hottest_stage_{name}.txt"
+            paths['cprofile_report'].write_text(report)
+
+        return paths
+
+
+# Shared profiler used by the pipeline scripts
+profiler = StageProfiler()
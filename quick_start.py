@@ -64,6 +64,7 @@ def check_results_exist():
     required_files = [
         "processed_data/cluster_labels.csv",
         "processed_data/clustering_results.json",
+        "processed_data/clustering_arrays.npz",
         "processed_data/blog_embeddings.npy"
     ]
     
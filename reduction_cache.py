@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Reduction Cache
+===============
+
+On-disk cache of the 2-D projections (and the PCA basis) computed by
+visualize_clusters.py. Each entry is keyed by a fingerprint of the embedding
+matrix plus the reduction method's parameters and library version, so
+styling-only re-runs reload coordinates instead of re-running PCA, t-SNE
+and UMAP, while any change to the data or to TSNE_PERPLEXITY, UMAP_N_NEIGHBORS,
+etc. misses the cache and recomputes. Fitted UMAP models and openTSNE embeddings
+are stored next to their coordinates so new posts can be projected into the
+same layout.
+
+Usage:
+    python reduction_cache.py [--clear] [--info]
+"""
+
+import argparse
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import joblib
+import numpy as np
+
+# Load configuration
+import config
+from cache_utils import array_fingerprint, params_fingerprint
+
+logger = logging.getLogger(__name__)
+
+
+class ReductionCache:
+    """npz files of reduction outputs for one embedding matrix"""
+
+    def __init__(self, embeddings: np.ndarray = None, cache_dir: str = None):
+        self.cache_dir = Path(cache_dir or config.REDUCTION_CACHE_DIR)
+        self.data_fingerprint = array_fingerprint(embeddings) if embeddings is not None else None
+
+    def key(self, method: str, params: Dict[str, Any]) -> str:
+        return params_fingerprint(data=self.data_fingerprint, method=method, params=params)
+
+    def _path(self, method: str, params: Dict[str, Any]) -> Path:
+        return self.cache_dir / f"{method}_{self.key(method, params)}.npz"
+
+    def get(self, method: str, params: Dict[str, Any]) -> Optional[Dict[str, np.ndarray]]:
+        """Stored arrays for method/params, or None on a miss"""
+        path = self._path(method, params)
+        if not path.exists():
+            return None
+
+        try:
+            with np.load(path, allow_pickle=False) as stored:
+                return {name: stored[name] for name in stored.files}
+        except Exception as e:
+            logger.warning(f"Discarding unreadable reduction cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def put(self, method: str, params: Dict[str, Any], **arrays: np.ndarray) -> Path:
+        """Store the arrays produced by method/params"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(method, params)
+        np.savez(path, **arrays)
+        return path
+
+    def get_model(self, method: str, params: Dict[str, Any]) -> Optional[Any]:
+        """Fitted reducer stored next to the coordinates, or None"""
+        path = self._path(method, params).with_suffix('.model.pkl')
+        if not path.exists():
+            return None
+
+        try:
+            return joblib.load(path)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable reducer model {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def put_model(self, method: str, params: Dict[str, Any], model: Any) -> Path:
+        """Store a fitted reducer (UMAP model, openTSNE embedding) for out-of-sample projection"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(method, params).with_suffix('.model.pkl')
+        joblib.dump(model, path)
+        return path
+
+    def _entries(self):
+        return [path for pattern in ("*.npz", "*.model.pkl") for path in self.cache_dir.glob(pattern)]
+
+    def clear(self) -> int:
+        """Remove every cached reduction and model; returns the number of files deleted"""
+        removed = 0
+        for path in self._entries():
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+    def size_bytes(self) -> int:
+        return sum(path.stat().st_size for path in self._entries())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or clear the visualization reduction cache")
+    parser.add_argument('--clear', action='store_true', help="Delete all cached reductions")
+    parser.add_argument('--info', action='store_true', help="Show cache size and entry count")
+    args = parser.parse_args()
+
+    cache = ReductionCache()
+    if args.clear:
+        print(f"Removed {cache.clear()} cached reductions from {cache.cache_dir}")
+    else:
+        n_entries = len(cache._entries())
+        print(f"{cache.cache_dir}: {n_entries} entries, {cache.size_bytes() / 1024 / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
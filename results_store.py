@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Clustering Result Store
+=======================
+
+Splits clustering results into a small JSON summary of parameters and metrics
+(clustering_results.json), a compact binary archive of label arrays and
+centroids (clustering_arrays.npz) and the per-cluster content reports (top
+terms, sample titles; cluster_content.json). Label sets are addressed by name,
+e.g. 'kmeans', 'hierarchical/ward', 'dbscan' or 'dbscan_optimization/all_results/3',
+and are only read from disk when requested.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+import numpy as np
+
+# Load configuration
+import config
+
+SUMMARY_FILENAME = "clustering_results.json"
+ARRAYS_FILENAME = "clustering_arrays.npz"
+CONTENT_FILENAME = "cluster_content.json"
+
+# Result keys stored in the binary archive instead of the JSON summary
+ARRAY_KEYS = ('labels', 'centroids', 'confidence', 'bootstrap_labels')
+
+# Per-cluster reports stored in the content file, keyed by label set name
+CONTENT_KEYS = ('cluster_analysis',)
+
+# Entries never persisted (fitted sklearn objects are saved separately under models/)
+SKIPPED_KEYS = ('model',)
+
+
+def make_serializable(obj):
+    """Recursively convert numpy types to Python types for JSON serialization"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    elif isinstance(obj, np.integer):
+        return int(obj)
+    elif isinstance(obj, np.floating):
+        return float(obj)
+    elif isinstance(obj, dict):
+        return {str(k): make_serializable(v) for k, v in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [make_serializable(item) for item in obj]
+    else:
+        return obj
+
+
+def _split_arrays(obj: Any, path: str, arrays: Dict[str, np.ndarray], content: Dict[str, Any]) -> Any:
+    """Move label/centroid arrays into `arrays` and per-cluster reports into `content`;
+    return the remaining JSON-ready structure"""
+    if isinstance(obj, dict):
+        summary = {}
+        for key, value in obj.items():
+            key = str(key)
+            if key in SKIPPED_KEYS:
+                continue
+            if key in ARRAY_KEYS and value is not None:
+                value = np.asarray(value)
+                arrays[f"{path}/{key}"] = value.astype(np.int32) if key.endswith('labels') else value
+                continue
+            if key in CONTENT_KEYS:
+                content[path] = make_serializable(value)
+                continue
+            summary[key] = _split_arrays(value, f"{path}/{key}", arrays, content)
+        return summary
+    if isinstance(obj, (list, tuple)) and any(isinstance(item, dict) for item in obj):
+        return [_split_arrays(item, f"{path}/{i}", arrays, content) for i, item in enumerate(obj)]
+    return make_serializable(obj)
+
+
+def save_results(results: Dict[str, Any], output_dir: str = None) -> Dict[str, Path]:
+    """Write the JSON summary, the binary array archive and the cluster content reports; returns the paths"""
+    output_dir = Path(output_dir or config.OUTPUT_DIR)
+    output_dir.mkdir(exist_ok=True)
+
+    arrays: Dict[str, np.ndarray] = {}
+    content: Dict[str, Any] = {}
+    summary = {
+        name: _split_arrays(value, name, arrays, content)
+        for name, value in results.items()
+        if isinstance(value, dict)
+    }
+
+    summary_file = output_dir / SUMMARY_FILENAME
+    with open(summary_file, 'w') as f:
+        json.dump(summary, f, indent=2, default=str)
+
+    arrays_file = output_dir / ARRAYS_FILENAME
+    np.savez_compressed(arrays_file, **arrays)
+
+    content_file = output_dir / CONTENT_FILENAME
+    with open(content_file, 'w') as f:
+        json.dump(content, f, indent=2, default=str)
+
+    return {'summary': summary_file, 'arrays': arrays_file, 'content': content_file}
+
+
+class ClusteringResultStore:
+    """Read access to saved clustering results with lazily loaded label arrays"""
+
+    def __init__(self, output_dir: str = None, summary_file: str = None):
+        output_dir = Path(output_dir or config.OUTPUT_DIR)
+        self.summary_file = Path(summary_file) if summary_file else output_dir / SUMMARY_FILENAME
+        self.arrays_file = self.summary_file.parent / ARRAYS_FILENAME
+        self.content_file = self.summary_file.parent / CONTENT_FILENAME
+
+        if not self.summary_file.exists():
+            raise FileNotFoundError(f"Clustering results not found: {self.summary_file}")
+
+        with open(self.summary_file, 'r') as f:
+            self.summary = json.load(f)
+
+        self._arrays = None
+
+    @property
+    def arrays(self):
+        """The npz archive; members are decompressed individually on access"""
+        if self._arrays is None:
+            if not self.arrays_file.exists():
+                raise FileNotFoundError(f"Clustering arrays not found: {self.arrays_file}")
+            self._arrays = np.load(self.arrays_file)
+        return self._arrays
+
+    def label_sets(self) -> List[str]:
+        """Names of every stored label set"""
+        return [key[:-len('/labels')] for key in self.arrays.files if key.endswith('/labels')]
+
+    def primary_label_sets(self) -> List[str]:
+        """Final label sets (excluding parameter-search runs)"""
+        return [
+            name for name in self.label_sets()
+            if not name.split('/')[0].endswith('_optimization') and not name.startswith('halving_search')
+        ]
+
+    def labels(self, name: str) -> np.ndarray:
+        return self.arrays[f"{name}/labels"]
+
+    def centroids(self, name: str) -> np.ndarray:
+        return self.arrays[f"{name}/centroids"]
+
+    def cluster_content(self, name: str) -> Dict[str, Any]:
+        """Per-cluster content report (top terms, sample titles) of a label set, e.g. 'hierarchical/ward'"""
+        if not self.content_file.exists():
+            return {}
+        with open(self.content_file, 'r') as f:
+            return json.load(f).get(name, {})
+
+    def results(self, label_sets: Iterable[str] = None) -> Dict[str, Any]:
+        """Summary dict with arrays attached for the requested label sets (default: primary ones)"""
+        results = json.loads(json.dumps(self.summary))
+        label_sets = self.primary_label_sets() if label_sets is None else list(label_sets)
+
+        for name in label_sets:
+            node = results
+            for part in name.split('/'):
+                node = node[int(part)] if isinstance(node, list) else node[part]
+            node['labels'] = self.labels(name)
+            if f"{name}/centroids" in self.arrays.files:
+                node['centroids'] = self.centroids(name)
+
+        return results
+
+    def close(self) -> None:
+        if self._arrays is not None:
+            self._arrays.close()
+            self._arrays = None
@@ -197,6 +197,8 @@ def print_results_summary():
         ("blog_embeddings.npy", "Embedding vectors"),
         ("embedding_metadata.csv", "Embedding metadata"),
         ("clustering_results.json", "Clustering results"),
+        ("clustering_arrays.npz", "Cluster label arrays"),
+        ("cluster_content.json", "Per-cluster terms and sample titles"),
         ("cluster_labels.csv", "Cluster assignments"),
         ("plots/", "Visualization plots")
     ]
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Pre-Reduction Benchmark
+=======================
+
+Compares clustering on full-width scaled embeddings against clustering after a
+PCA / randomized SVD / Gaussian random projection pre-reduction stage. For every
+algorithm it reports the fit time speedup and the cluster agreement (adjusted
+Rand index) with the full-dimensional labels.
+
+Usage:
+    python scripts/analysis/benchmark_pre_reduction.py [--dims 64 128 256] [--n-clusters 45]
+"""
+
+import argparse
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import adjusted_rand_score
+
+# Load configuration
+import config
+from clustering_analysis import ClusteringAnalyzer, PRE_REDUCTION_METHODS, load_embeddings_and_data
+
+
+def time_algorithms(analyzer: ClusteringAnalyzer, n_clusters: int) -> Dict[str, Dict]:
+    """Run each algorithm once and return its labels and wall time"""
+    runs: Dict[str, Callable[[], Dict]] = {
+        'kmeans': lambda: analyzer.perform_kmeans_clustering(n_clusters),
+        'hierarchical_ward': lambda: analyzer.perform_hierarchical_clustering(n_clusters, 'ward'),
+        'hierarchical_average': lambda: analyzer.perform_hierarchical_clustering(n_clusters, 'average'),
+        'dbscan': lambda: analyzer.perform_dbscan_clustering(0.3, 5),
+    }
+
+    timings = {}
+    for name, run in runs.items():
+        start = time.perf_counter()
+        result = run()
+        timings[name] = {'labels': result['labels'], 'seconds': time.perf_counter() - start}
+    return timings
+
+
+def run_benchmark(embeddings: np.ndarray, post_data: pd.DataFrame,
+                  methods: List[str], dims: List[int], n_clusters: int) -> pd.DataFrame:
+    """Benchmark every (method, dims) pair against the full-width baseline
+
+    Linkage trees and reducers are written to a throwaway directory, so the
+    benchmark never replaces the models of a real run in config.OUTPUT_DIR.
+    """
+    with tempfile.TemporaryDirectory(prefix="pre_reduction_benchmark_") as output_dir:
+        # Fit cache off: every timing must be a real fit, not a load of an earlier run's result
+        baseline = time_algorithms(
+            ClusteringAnalyzer(embeddings, post_data, reduction='', use_cache=False, output_dir=output_dir),
+            n_clusters
+        )
+
+        rows = []
+        for method in methods:
+            for n_dims in dims:
+                start = time.perf_counter()
+                analyzer = ClusteringAnalyzer(embeddings, post_data, reduction=method, reduction_dims=n_dims,
+                                              use_cache=False, output_dir=output_dir)
+                reduce_seconds = time.perf_counter() - start
+
+                reduced = time_algorithms(analyzer, n_clusters)
+                for algorithm, run in reduced.items():
+                    full = baseline[algorithm]
+                    rows.append({
+                        'method': method,
+                        'dims': analyzer.embeddings_normalized.shape[1],
+                        'algorithm': algorithm,
+                        'full_seconds': full['seconds'],
+                        'reduced_seconds': run['seconds'],
+                        'speedup': full['seconds'] / max(run['seconds'], 1e-9),
+                        'ari_vs_full': adjusted_rand_score(full['labels'], run['labels']),
+                        'reduction_seconds': reduce_seconds
+                    })
+
+    return pd.DataFrame(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pre-reduction ahead of clustering")
+    parser.add_argument('--embeddings-file', help="Path to embeddings numpy file")
+    parser.add_argument('--data-dir', default=config.OUTPUT_DIR, help="Directory containing data files")
+    parser.add_argument('--methods', nargs='+', choices=PRE_REDUCTION_METHODS, default=PRE_REDUCTION_METHODS)
+    parser.add_argument('--dims', nargs='+', type=int, default=[64, 128, 256])
+    parser.add_argument('--n-clusters', type=int, default=45)
+    args = parser.parse_args()
+
+    embeddings, post_data = load_embeddings_and_data(args.embeddings_file, args.data_dir)
+    report = run_benchmark(embeddings, post_data, args.methods, args.dims, args.n_clusters)
+
+    print("\n" + "=" * 60)
+    print("PRE-REDUCTION BENCHMARK (ARI vs full-dim, speedup per algorithm)")
+    print("=" * 60)
+    print(report.to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Dimensionality Reduction Benchmark
+==================================
+
+Times the visualization reductions (PCA, t-SNE on every available backend and
+UMAP on the PCA-reduced input) at several corpus sizes and scores each 2-D map
+by neighbourhood preservation: the share of every point's k nearest neighbours
+in the embedding space that stay among its k nearest neighbours in the map.
+When a size exceeds the corpus, the extra rows are resampled embeddings with
+small Gaussian jitter.
+
+Usage:
+    python scripts/analysis/benchmark_reductions.py [--sizes 1000 10000 50000] [--n-jobs -1]
+"""
+
+import argparse
+import time
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+# Load configuration
+import config
+from clustering_analysis import load_embeddings_and_data
+from dimensionality_reduction import (
+    neighborhood_preservation, openTSNE, run_pca, run_tsne, run_umap, umap
+)
+
+
+def resize_embeddings(embeddings: np.ndarray, n_rows: int, random_state: int = 42) -> np.ndarray:
+    """n_rows embeddings: a subsample, or the corpus plus jittered resampled copies"""
+    rng = np.random.RandomState(random_state)
+    if n_rows <= len(embeddings):
+        return embeddings[np.sort(rng.choice(len(embeddings), n_rows, replace=False))]
+
+    extra = embeddings[rng.choice(len(embeddings), n_rows - len(embeddings))]
+    jitter = rng.normal(scale=0.05 * embeddings.std(axis=0), size=extra.shape)
+    return np.vstack([embeddings, extra + jitter]).astype(embeddings.dtype)
+
+
+def run_benchmark(embeddings: np.ndarray, sizes: List[int], n_jobs: int, n_neighbors: int) -> pd.DataFrame:
+    """Time every reduction at every size and score its neighbourhood preservation"""
+    tsne_backends = ['sklearn'] + (['opentsne'] if openTSNE is not None else [])
+
+    rows = []
+    for size in sizes:
+        data = resize_embeddings(embeddings, size)
+
+        start = time.perf_counter()
+        pca_coords = run_pca(data, config.PCA_N_COMPONENTS)['coords']
+        pca_seconds = time.perf_counter() - start
+
+        runs = {'pca': lambda: pca_coords[:, :2]}
+        for backend in tsne_backends:
+            runs[f'tsne_{backend}'] = lambda backend=backend: run_tsne(
+                pca_coords, config.TSNE_PERPLEXITY, config.TSNE_N_ITER, n_jobs, backend
+            )
+        if umap is not None:
+            runs['umap'] = lambda: run_umap(pca_coords, config.UMAP_N_NEIGHBORS, config.UMAP_MIN_DIST, n_jobs)
+
+        for method, run in runs.items():
+            start = time.perf_counter()
+            coords = run()
+            # Every map includes the PCA step that feeds it
+            seconds = time.perf_counter() - start + pca_seconds
+            rows.append({
+                'n_points': size,
+                'method': method,
+                'seconds': seconds,
+                f'knn{n_neighbors}_preservation': neighborhood_preservation(data, coords, n_neighbors)
+            })
+            print(f"  {size:>6} points  {method:<14} {seconds:8.1f}s")
+
+    return pd.DataFrame(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark t-SNE/UMAP backends: time vs neighbourhood preservation")
+    parser.add_argument('--embeddings-file', help="Path to embeddings numpy file")
+    parser.add_argument('--data-dir', default=config.OUTPUT_DIR, help="Directory containing data files")
+    parser.add_argument('--sizes', nargs='+', type=int, default=[1000, 10000, 50000])
+    parser.add_argument('--n-jobs', type=int, default=config.REDUCTION_N_JOBS, help="Threads per reduction")
+    parser.add_argument('--n-neighbors', type=int, default=10, help="k for neighbourhood preservation")
+    args = parser.parse_args()
+
+    embeddings, _ = load_embeddings_and_data(args.embeddings_file, args.data_dir)
+    report = run_benchmark(embeddings, args.sizes, args.n_jobs, args.n_neighbors)
+
+    print("\n" + "=" * 60)
+    print("REDUCTION BENCHMARK (wall time incl. PCA, kNN preservation in 2-D)")
+    print("=" * 60)
+    print(report.to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+
+
+if __name__ == "__main__":
+    main()
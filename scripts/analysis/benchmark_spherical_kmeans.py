@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Spherical K-Means Benchmark
+===========================
+
+Compares the default K-means path (StandardScaler + euclidean KMeans) with the
+spherical engine (L2-normalized float32 rows + cosine k-means) for a range of k.
+Both label sets are scored with the cosine silhouette on the raw embeddings, so
+the quality column is comparable across engines.
+
+Usage:
+    python scripts/analysis/benchmark_spherical_kmeans.py [--k 10 25 45] [--sample-size 10000]
+"""
+
+import argparse
+import time
+from typing import List
+
+import numpy as np
+import pandas as pd
+from sklearn.cluster import KMeans
+from sklearn.metrics import adjusted_rand_score, silhouette_score
+from sklearn.preprocessing import StandardScaler
+
+# Load configuration
+import config
+from clustering_analysis import load_embeddings_and_data
+from spherical_kmeans import SphericalKMeans, l2_normalize
+
+
+def run_benchmark(embeddings: np.ndarray, k_values: List[int], sample_size: int) -> pd.DataFrame:
+    """Fit both engines for every k and report wall time and cosine silhouette"""
+    start = time.perf_counter()
+    scaled = StandardScaler().fit_transform(embeddings)
+    scale_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    normalized = l2_normalize(embeddings)
+    normalize_seconds = time.perf_counter() - start
+
+    rows = []
+    for k in k_values:
+        start = time.perf_counter()
+        euclidean_labels = KMeans(n_clusters=k, random_state=42, n_init=10).fit_predict(scaled)
+        euclidean_seconds = time.perf_counter() - start + scale_seconds
+
+        start = time.perf_counter()
+        spherical_labels = SphericalKMeans(n_clusters=k, random_state=42, n_init=10).fit_predict(normalized)
+        spherical_seconds = time.perf_counter() - start + normalize_seconds
+
+        rows.append({
+            'k': k,
+            'kmeans_seconds': euclidean_seconds,
+            'spherical_seconds': spherical_seconds,
+            'speedup': euclidean_seconds / max(spherical_seconds, 1e-9),
+            'kmeans_cos_silhouette': silhouette_score(
+                normalized, euclidean_labels, metric='cosine', sample_size=sample_size, random_state=42
+            ),
+            'spherical_cos_silhouette': silhouette_score(
+                normalized, spherical_labels, metric='cosine', sample_size=sample_size, random_state=42
+            ),
+            'ari_between_engines': adjusted_rand_score(euclidean_labels, spherical_labels)
+        })
+
+    return pd.DataFrame(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark spherical k-means against the default K-means path")
+    parser.add_argument('--embeddings-file', help="Path to embeddings numpy file")
+    parser.add_argument('--data-dir', default=config.OUTPUT_DIR, help="Directory containing data files")
+    parser.add_argument('--k', nargs='+', type=int, default=[10, 25, 45])
+    parser.add_argument('--sample-size', type=int, default=10000, help="Rows sampled for the silhouette")
+    args = parser.parse_args()
+
+    embeddings, _ = load_embeddings_and_data(args.embeddings_file, args.data_dir)
+    sample_size = min(args.sample_size, len(embeddings))
+    report = run_benchmark(embeddings, args.k, sample_size)
+
+    print("\n" + "=" * 60)
+    print("SPHERICAL K-MEANS BENCHMARK (wall time incl. preprocessing, cosine silhouette)")
+    print("=" * 60)
+    print(report.to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -171,6 +171,8 @@ def show_file_summary():
         "blog_embeddings.npy",
         "embedding_metadata.csv", 
         "clustering_results.json",
+        "clustering_arrays.npz",
+        "cluster_content.json",
         "cluster_labels.csv"
     ]
     
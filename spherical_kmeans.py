@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Spherical K-Means
+=================
+
+K-means under cosine similarity for embedding vectors. Rows are L2-normalized
+once (float32); assignments are batched matrix products against unit-length
+centroids, and each centroid is the renormalized sum of its members. Inertia is
+reported as the sum of cosine distances (1 - similarity) to the assigned centroid.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.utils import check_random_state
+
+# Load configuration
+import config
+
+
+def l2_normalize(data: np.ndarray) -> np.ndarray:
+    """float32 copy of data with unit-length rows (zero rows stay zero)"""
+    data = np.asarray(data, dtype=np.float32)
+    norms = np.linalg.norm(data, axis=1, keepdims=True)
+    return data / np.maximum(norms, np.finfo(np.float32).tiny)
+
+
+class SphericalKMeans:
+    """K-means with cosine similarity on L2-normalized rows"""
+
+    def __init__(self, n_clusters: int, n_init: int = 10, max_iter: int = 300, tol: float = 1e-4,
+                 random_state: Optional[int] = None, batch_size: int = None, init: Optional[np.ndarray] = None):
+        self.n_clusters = n_clusters
+        self.n_init = n_init
+        self.init = init
+        self.max_iter = max_iter
+        self.tol = tol
+        self.random_state = random_state
+        self.batch_size = batch_size or config.SPHERICAL_BATCH_SIZE
+
+    def _assign(self, data: np.ndarray, centers: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Nearest centroid and its cosine similarity for every row, in row batches"""
+        labels = np.empty(len(data), dtype=np.int32)
+        similarities = np.empty(len(data), dtype=np.float32)
+        for start in range(0, len(data), self.batch_size):
+            scores = data[start:start + self.batch_size] @ centers.T
+            labels[start:start + len(scores)] = scores.argmax(axis=1)
+            similarities[start:start + len(scores)] = scores[np.arange(len(scores)), labels[start:start + len(scores)]]
+        return labels, similarities
+
+    def _update_centers(self, data: np.ndarray, labels: np.ndarray, similarities: np.ndarray) -> np.ndarray:
+        """Renormalized member sums; empty clusters take the worst-fitting rows"""
+        indicator = csr_matrix(
+            (np.ones(len(data), dtype=np.float32), (labels, np.arange(len(data)))),
+            shape=(self.n_clusters, len(data))
+        )
+        centers = np.asarray(indicator @ data, dtype=np.float32)
+
+        empty = np.flatnonzero(np.bincount(labels, minlength=self.n_clusters) == 0)
+        if len(empty):
+            centers[empty] = data[np.argsort(similarities)[:len(empty)]]
+        return l2_normalize(centers)
+
+    def _init_centers(self, data: np.ndarray, random_state) -> np.ndarray:
+        """Greedy k-means++ seeding; on unit vectors squared distance is 2 - 2 cos"""
+        n_rows = len(data)
+        n_trials = 2 + int(np.log(self.n_clusters))
+        centers = np.empty((self.n_clusters, data.shape[1]), dtype=np.float32)
+
+        first = random_state.randint(n_rows)
+        centers[0] = data[first]
+        closest = np.maximum(2.0 - 2.0 * (data @ data[first]), 0.0)
+        potential = closest.sum()
+
+        for c in range(1, self.n_clusters):
+            draws = random_state.uniform(size=n_trials) * potential
+            candidates = np.minimum(np.searchsorted(np.cumsum(closest), draws), n_rows - 1)
+
+            distances = np.maximum(2.0 - 2.0 * (data[candidates] @ data.T), 0.0)
+            np.minimum(closest, distances, out=distances)
+            potentials = distances.sum(axis=1)
+
+            best = np.argmin(potentials)
+            closest, potential = distances[best], potentials[best]
+            centers[c] = data[candidates[best]]
+
+        return centers
+
+    def _single_run(self, data: np.ndarray, random_state) -> Tuple[np.ndarray, np.ndarray, float, int]:
+        if self.init is not None:
+            centers = l2_normalize(self.init)
+        else:
+            centers = self._init_centers(data, random_state)
+
+        labels, similarities = self._assign(data, centers)
+        inertia = float(np.sum(1.0 - similarities))
+        for n_iter in range(1, self.max_iter + 1):
+            centers = self._update_centers(data, labels, similarities)
+            new_labels, similarities = self._assign(data, centers)
+            new_inertia = float(np.sum(1.0 - similarities))
+
+            converged = np.array_equal(new_labels, labels) or inertia - new_inertia <= self.tol * inertia
+            labels, inertia = new_labels, new_inertia
+            if converged:
+                break
+
+        return centers, labels, inertia, n_iter
+
+    def fit(self, data: np.ndarray) -> 'SphericalKMeans':
+        """Best of n_init runs (lowest total cosine distance); a single run from init if given"""
+        data = l2_normalize(data)
+        if len(data) < self.n_clusters:
+            raise ValueError(f"n_samples={len(data)} should be >= n_clusters={self.n_clusters}")
+
+        random_state = check_random_state(self.random_state)
+        best = None
+        for _ in range(1 if self.init is not None else self.n_init):
+            run = self._single_run(data, random_state)
+            if best is None or run[2] < best[2]:
+                best = run
+
+        self.cluster_centers_, self.labels_, self.inertia_, self.n_iter_ = best
+        return self
+
+    def fit_predict(self, data: np.ndarray) -> np.ndarray:
+        return self.fit(data).labels_
+
+    def predict(self, data: np.ndarray) -> np.ndarray:
+        return self._assign(l2_normalize(data), self.cluster_centers_)[0]
+
+    def transform(self, data: np.ndarray) -> np.ndarray:
+        """Cosine distance from every row to every centroid"""
+        return 1.0 - l2_normalize(data) @ self.cluster_centers_.T
+
+    def score(self, data: np.ndarray) -> float:
+        """Negative total cosine distance to the nearest centroid (sklearn convention)"""
+        return -float(np.sum(1.0 - self._assign(l2_normalize(data), self.cluster_centers_)[1]))
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Corpus Term Matrix
+==================
+
+Tokenizes every post title and body once into sparse document-term count matrices
+(shared vocabulary) and caches them on disk. Per-cluster term counts and class-based
+TF-IDF (c-TF-IDF) scores for any label set are then sparse row-sums over these
+matrices, so keyword extraction never re-tokenizes text and works fully offline
+(the stopword list ships with scikit-learn). Per-cluster counts are cached too,
+keyed by the label set, for the word clouds in visualize_clusters.py.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS, CountVectorizer
+
+# Load configuration
+import config
+from cache_utils import array_fingerprint, params_fingerprint, texts_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Alphabetic tokens of three or more characters
+TOKEN_PATTERN = r"(?u)\b[^\W\d_]{3,}\b"
+STOP_WORDS = frozenset(ENGLISH_STOP_WORDS) | frozenset(config.EXTRA_STOP_WORDS)
+
+FIELDS = ('title', 'content')
+
+
+def build_vectorizer() -> CountVectorizer:
+    """CountVectorizer with the project's tokenization rules"""
+    return CountVectorizer(
+        lowercase=True,
+        token_pattern=TOKEN_PATTERN,
+        stop_words=sorted(STOP_WORDS),
+        dtype=np.int32
+    )
+
+
+def tokenize(text: str) -> List[str]:
+    """Tokens of a single text under the same rules as the corpus matrix"""
+    return build_vectorizer().build_analyzer()(text or '')
+
+
+def _top_row_terms(matrix: sparse.csr_matrix, vocabulary: np.ndarray, n_terms: int,
+                   as_int: bool) -> List[List[Tuple[str, float]]]:
+    """Highest-valued (term, value) pairs of each sparse row"""
+    top_terms = []
+    for row in range(matrix.shape[0]):
+        start, end = matrix.indptr[row], matrix.indptr[row + 1]
+        values, columns = matrix.data[start:end], matrix.indices[start:end]
+        if len(values) > n_terms:
+            keep = np.argpartition(-values, n_terms - 1)[:n_terms]
+            values, columns = values[keep], columns[keep]
+        # Sort by value, then alphabetically for ties
+        order = np.lexsort((vocabulary[columns], -values))
+        top_terms.append([
+            (str(vocabulary[columns[i]]), int(values[i]) if as_int else float(values[i]))
+            for i in order
+        ])
+    return top_terms
+
+
+class CorpusTermMatrix:
+    """Sparse title/content term counts for a fixed, ordered set of posts"""
+
+    def __init__(self, titles: Sequence[str], contents: Sequence[str],
+                 cache_dir: str = None, use_cache: bool = True):
+        titles = [str(t) for t in titles]
+        contents = [str(c) for c in contents]
+        if len(titles) != len(contents):
+            raise ValueError("titles and contents must have the same length")
+
+        self.n_docs = len(titles)
+        self.cache_dir = Path(cache_dir or config.TERM_MATRIX_CACHE_DIR)
+        self.use_cache = use_cache
+        self.fingerprint = params_fingerprint(
+            titles=texts_fingerprint(titles),
+            contents=texts_fingerprint(contents),
+            token_pattern=TOKEN_PATTERN,
+            stop_words=texts_fingerprint(sorted(STOP_WORDS))
+        )
+
+        if not (use_cache and self._load()):
+            self._build(titles, contents)
+            if use_cache:
+                self._save()
+
+    @classmethod
+    def from_post_data(cls, post_data: pd.DataFrame, **kwargs) -> 'CorpusTermMatrix':
+        """Build from the extracted posts table (rows in embedding order)"""
+        return cls(
+            post_data['title'].fillna('').astype(str).tolist(),
+            post_data['extracted_text'].fillna('').astype(str).tolist(),
+            **kwargs
+        )
+
+    def _paths(self) -> Dict[str, Path]:
+        prefix = self.cache_dir / f"terms_{self.fingerprint}"
+        paths = {field: prefix.with_name(f"{prefix.name}_{field}.npz") for field in FIELDS}
+        paths['vocabulary'] = prefix.with_name(f"{prefix.name}_vocabulary.json")
+        return paths
+
+    def _build(self, titles: List[str], contents: List[str]) -> None:
+        logger.info(f"Tokenizing {self.n_docs} posts into a sparse term matrix...")
+        vectorizer = build_vectorizer()
+        vectorizer.fit(titles + contents)
+        self.vocabulary = vectorizer.get_feature_names_out()
+        self.counts = {
+            'title': vectorizer.transform(titles).tocsr(),
+            'content': vectorizer.transform(contents).tocsr()
+        }
+        logger.info(f"Term matrix: {len(self.vocabulary)} terms, "
+                    f"{self.counts['content'].nnz + self.counts['title'].nnz} non-zeros")
+
+    def _load(self) -> bool:
+        paths = self._paths()
+        if not all(path.exists() for path in paths.values()):
+            return False
+
+        with open(paths['vocabulary'], 'r') as f:
+            self.vocabulary = np.array(json.load(f), dtype=object)
+        self.counts = {field: sparse.load_npz(paths[field]).tocsr() for field in FIELDS}
+        logger.info(f"Loaded cached term matrix ({len(self.vocabulary)} terms)")
+        return True
+
+    def _save(self) -> None:
+        paths = self._paths()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for field in FIELDS:
+            sparse.save_npz(paths[field], self.counts[field])
+        with open(paths['vocabulary'], 'w') as f:
+            json.dump(self.vocabulary.tolist(), f)
+
+    def cluster_term_counts(self, labels: np.ndarray, field: str = 'content') -> Tuple[np.ndarray, sparse.csr_matrix]:
+        """Cluster ids (noise excluded) and their summed term counts, one row per cluster"""
+        labels = np.asarray(labels)
+        if len(labels) != self.n_docs:
+            raise ValueError(f"Expected {self.n_docs} labels, got {len(labels)}")
+
+        cluster_ids, rows = np.unique(labels, return_inverse=True)
+        member = labels != -1
+        indicator = sparse.csr_matrix(
+            (np.ones(member.sum(), dtype=np.int32), (rows[member], np.flatnonzero(member))),
+            shape=(len(cluster_ids), self.n_docs)
+        )
+        counts = (indicator @ self.counts[field]).tocsr()
+
+        keep = cluster_ids != -1
+        return cluster_ids[keep], counts[np.flatnonzero(keep)]
+
+    def cached_cluster_term_counts(self, labels: np.ndarray, field: str = 'content') -> Tuple[np.ndarray, sparse.csr_matrix]:
+        """cluster_term_counts, stored in the term cache and keyed by the label set"""
+        key = params_fingerprint(
+            matrix=self.fingerprint, labels=array_fingerprint(np.asarray(labels, dtype=np.int64)), field=field
+        )
+        path = self.cache_dir / f"clusterterms_{key}.npz"
+        if self.use_cache and path.exists():
+            with np.load(path) as stored:
+                counts = sparse.csr_matrix(
+                    (stored['data'], stored['indices'], stored['indptr']), shape=tuple(stored['shape'])
+                )
+                return stored['cluster_ids'], counts
+
+        cluster_ids, counts = self.cluster_term_counts(labels, field)
+        if self.use_cache:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            np.savez(path, cluster_ids=cluster_ids, data=counts.data, indices=counts.indices,
+                     indptr=counts.indptr, shape=np.array(counts.shape))
+        return cluster_ids, counts
+
+    def cluster_frequencies(self, labels: np.ndarray, field: str = 'content',
+                            n_terms: int = None) -> Dict[int, Dict[str, int]]:
+        """{term: count} of the most frequent terms of each cluster (word cloud input)"""
+        n_terms = n_terms or config.TOP_WORDS_PER_CLUSTER
+        cluster_ids, counts = self.cached_cluster_term_counts(labels, field)
+        top = _top_row_terms(counts, self.vocabulary, n_terms, as_int=True)
+        return {int(cluster_id): dict(terms) for cluster_id, terms in zip(cluster_ids, top)}
+
+    def top_terms(self, labels: np.ndarray, field: str = 'content',
+                  n_terms: int = None) -> Dict[int, List[Tuple[str, int]]]:
+        """Most frequent terms of each cluster"""
+        n_terms = n_terms or config.TOP_WORDS_PER_CLUSTER
+        cluster_ids, counts = self.cluster_term_counts(labels, field)
+        top = _top_row_terms(counts, self.vocabulary, n_terms, as_int=True)
+        return {int(cluster_id): terms for cluster_id, terms in zip(cluster_ids, top)}
+
+    def ctfidf_scores(self, labels: np.ndarray, field: str = 'content') -> Tuple[np.ndarray, sparse.csr_matrix]:
+        """Class-based TF-IDF: per-cluster term frequency weighted by log(1 + A / f_t)"""
+        cluster_ids, counts = self.cluster_term_counts(labels, field)
+        counts = counts.astype(np.float64)
+
+        cluster_totals = np.asarray(counts.sum(axis=1)).ravel()
+        term_totals = np.asarray(counts.sum(axis=0)).ravel()
+        avg_words_per_cluster = cluster_totals.mean() if len(cluster_totals) else 0.0
+
+        with np.errstate(divide='ignore'):
+            idf = np.log1p(avg_words_per_cluster / np.where(term_totals > 0, term_totals, np.inf))
+        tf = sparse.diags(1.0 / np.maximum(cluster_totals, 1)) @ counts
+        return cluster_ids, (tf @ sparse.diags(idf)).tocsr()
+
+    def distinctive_terms(self, labels: np.ndarray, field: str = 'content',
+                          n_terms: int = None) -> Dict[int, List[Tuple[str, float]]]:
+        """Highest c-TF-IDF terms of each cluster"""
+        n_terms = n_terms or config.TOP_WORDS_PER_CLUSTER
+        cluster_ids, scores = self.ctfidf_scores(labels, field)
+        top = _top_row_terms(scores, self.vocabulary, n_terms, as_int=False)
+        return {int(cluster_id): terms for cluster_id, terms in zip(cluster_ids, top)}
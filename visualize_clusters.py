@@ -19,30 +19,47 @@ import numpy as np
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional, Any
 import json
+import base64
 import logging
 from datetime import datetime
+import time
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 warnings.filterwarnings('ignore')
 
-# Dimensionality reduction imports
-from sklearn.manifold import TSNE
-from sklearn.decomposition import PCA
-try:
-    import umap
-except ImportError:
+from joblib import Parallel, delayed, effective_n_jobs
+
+# Dimensionality reduction engines
+from dimensionality_reduction import (
+    umap, TSNE_BACKENDS, backend_version, fit_tsne, fit_umap, project_pca, resolve_tsne_backend, run_pca,
+    transform_coords
+)
+if umap is None:
     print("Warning: UMAP not available. Install with: pip install umap-learn")
-    umap = None
 
-# Visualization imports
+# Visualization imports (file output only, also in plot worker processes)
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+# Optional word clouds
+try:
+    from wordcloud import WordCloud
+except ImportError:
+    WordCloud = None
+
 # Hierarchical clustering visualization
-from scipy.cluster.hierarchy import dendrogram, linkage
-from scipy.spatial.distance import pdist
+from scipy.cluster.hierarchy import dendrogram
+from linkage_trees import load_linkage_matrix, weighted_centroid_linkage
+from results_store import ClusteringResultStore
+from reduction_cache import ReductionCache
+from density_raster import rasterize_clusters
+from plot_manifest import PlotManifest
+from term_matrix import CorpusTermMatrix
 
 from tqdm import tqdm
 
@@ -65,14 +82,190 @@ plt.style.use('default')
 sns.set_palette("husl")
 
 
+# Client-side switching of map and label set in the interactive dashboard
+DASHBOARD_SCRIPT = """
+var gd = document.getElementById('{plot_id}');
+var DATA = __DATA__;
+var state = __INITIAL__;
+
+function decode(b64, ArrayType) {
+    var binary = atob(b64), bytes = new Uint8Array(binary.length);
+    for (var i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+    return new ArrayType(bytes.buffer);
+}
+
+var maps = {}, labels = {};
+Object.keys(DATA.maps).forEach(function (name) {
+    var m = DATA.maps[name];
+    maps[name] = {
+        x: decode(m.x, Float32Array), y: decode(m.y, Float32Array),
+        newX: m.new_x ? decode(m.new_x, Float32Array) : null, newY: m.new_y ? decode(m.new_y, Float32Array) : null
+    };
+});
+Object.keys(DATA.labels).forEach(function (name) { labels[name] = decode(DATA.labels[name].values, Int32Array); });
+
+function redraw() {
+    var m = maps[state.map], l = DATA.labels[state.labels];
+    Plotly.restyle(gd, {
+        x: [m.x], y: [m.y], 'marker.color': [labels[state.labels]],
+        'marker.colorscale': [l.colorscale], 'marker.cmin': [l.cmin], 'marker.cmax': [l.cmax]
+    }, [0]);
+    if (m.newX && gd.data.length > 1) Plotly.restyle(gd, {x: [m.newX], y: [m.newY]}, [1]);
+    Plotly.relayout(gd, {
+        'xaxis.title.text': state.map.toUpperCase() + ' Component 1',
+        'yaxis.title.text': state.map.toUpperCase() + ' Component 2',
+        'xaxis.autorange': true, 'yaxis.autorange': true
+    });
+}
+
+gd.on('plotly_buttonclicked', function (event) {
+    state[event.menu.name] = event.button.args[0];
+    redraw();
+});
+"""
+
+
+# Expandable full-corpus cluster tree; children are built on first expand
+CLUSTER_TREE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Cluster Tree</title>
+<style>
+body { font-family: sans-serif; font-size: 13px; }
+ul { list-style: none; padding-left: 1.2em; margin: 0; }
+li > span { cursor: default; }
+li.node > span { cursor: pointer; }
+li.node > span::before { content: "\\25BE  "; }
+li.node.closed > span::before { content: "\\25B8  "; }
+li.node.closed > ul { display: none; }
+.meta { color: #888; }
+</style>
+</head>
+<body>
+<h2>Cluster Tree (Ward linkage over all posts)</h2>
+<p class="meta">Click a node to expand it. Larger branches are listed first.</p>
+<ul id="tree"></ul>
+<script>
+var DATA = __DATA__;
+var n = DATA.titles.length;
+
+function size(id) { return id < n ? 1 : DATA.counts[id - n]; }
+
+function children(id) {
+    var k = id - n, pair = [DATA.left[k], DATA.right[k]];
+    return size(pair[0]) >= size(pair[1]) ? pair : [pair[1], pair[0]];
+}
+
+function node(id) {
+    var li = document.createElement('li'), span = document.createElement('span');
+    if (id < n) {
+        span.textContent = DATA.titles[id] || '(untitled)';
+        if (DATA.clusters) span.textContent += '  [cluster ' + DATA.clusters[id] + ']';
+        li.appendChild(span);
+        return li;
+    }
+    span.textContent = size(id) + ' posts \\u00b7 distance ' + DATA.heights[id - n].toFixed(3);
+    li.className = 'node closed';
+    li.appendChild(span);
+    span.onclick = function () {
+        if (!li.querySelector('ul')) {
+            var ul = document.createElement('ul');
+            children(id).forEach(function (child) { ul.appendChild(node(child)); });
+            li.appendChild(ul);
+        }
+        li.classList.toggle('closed');
+    };
+    return li;
+}
+
+var root = document.getElementById('tree');
+if (n === 1) {
+    root.appendChild(node(0));
+} else {
+    root.appendChild(node(2 * n - 2));
+    root.firstChild.firstChild.onclick();
+}
+</script>
+</body>
+</html>
+"""
+
+
+def _b64_array(values: np.ndarray, dtype) -> str:
+    """Little-endian typed-array bytes of values, base64-encoded for the dashboard"""
+    return base64.b64encode(np.ascontiguousarray(values, dtype=np.dtype(dtype).newbyteorder('<')).tobytes()).decode('ascii')
+
+
+def _discrete_color_axis(labels: np.ndarray) -> Dict[str, Any]:
+    """Colorscale with one flat band per cluster id (noise = -1 in grey)"""
+    labels = np.asarray(labels)
+    cmin, cmax = min(int(labels.min()), 0) - 0.5, int(labels.max()) + 0.5
+    palette = px.colors.qualitative.Dark24 + px.colors.qualitative.Light24
+    bands = np.arange(cmin + 0.5, cmax)
+    
+    colorscale = []
+    for i, label in enumerate(bands):
+        color = '#bbbbbb' if label < 0 else palette[int(label) % len(palette)]
+        colorscale += [[i / len(bands), color], [(i + 1) / len(bands), color]]
+    return {'colorscale': colorscale, 'cmin': cmin, 'cmax': cmax}
+
+
+def _word_cloud_image(frequencies: Dict[str, int]) -> np.ndarray:
+    """RGB word cloud of one cluster's term frequencies (fixed seed, so the layout is stable)"""
+    width, height = config.WORDCLOUD_SIZE
+    wordcloud = WordCloud(
+        width=width,
+        height=height,
+        background_color='white',
+        colormap='viridis',
+        max_words=config.WORDCLOUD_MAX_WORDS,
+        random_state=42
+    )
+    return wordcloud.generate_from_frequencies(frequencies).to_array()
+
+
+# Static plot job: (ClusteringVisualizer method name, keyword arguments)
+PlotJob = Tuple[str, Dict[str, Any]]
+
+# Visualizer shared by the jobs of one plot worker process
+_worker_visualizer = None
+
+
+def _init_plot_worker(visualizer: 'ClusteringVisualizer') -> None:
+    global _worker_visualizer
+    _worker_visualizer = visualizer
+
+
+def _run_plot_job(visualizer: 'ClusteringVisualizer', job: PlotJob) -> Tuple[str, float]:
+    """Render one plot; returns (method name, seconds)"""
+    method, kwargs = job
+    start = time.time()
+    getattr(visualizer, method)(**kwargs)
+    return method, time.time() - start
+
+
+def _render_plot_job(job: PlotJob) -> Tuple[str, float]:
+    return _run_plot_job(_worker_visualizer, job)
+
+
 class ClusteringVisualizer:
     """Comprehensive visualization for clustering results"""
     
-    def __init__(self, embeddings: np.ndarray, post_data: pd.DataFrame, clustering_results: Dict):
-        """Initialize visualizer with data and results"""
+    def __init__(self, embeddings: np.ndarray, post_data: pd.DataFrame, clustering_results: Dict,
+                 use_cache: bool = True, data_dir: str = None):
+        """Initialize visualizer with data and results (use_cache=False recomputes all reductions)
+        
+        Stored linkage trees are read from data_dir/models (default config.OUTPUT_DIR).
+        """
         self.embeddings = embeddings
+        self.models_dir = Path(data_dir or config.OUTPUT_DIR) / "models"
         self.post_data = post_data
         self.clustering_results = clustering_results
+        self.reduction_cache = ReductionCache(embeddings) if use_cache else None
+        self._map_params = {}
+        self._map_models = {}
+        self._word_frequencies = None
         
         # Create output directory for plots
         self.plots_dir = Path(config.OUTPUT_DIR) / "plots"
@@ -80,66 +273,120 @@ class ClusteringVisualizer:
         
         logger.info(f"Initialized visualizer for {len(embeddings)} posts")
     
-    def perform_dimensionality_reduction(self, methods: List[str] = None) -> Dict[str, np.ndarray]:
-        """Perform dimensionality reduction using specified methods"""
+    def _cached_reduction(self, method: str, params: Dict[str, Any], compute) -> Dict[str, np.ndarray]:
+        """Reduction outputs from the on-disk cache, running compute() only on a miss"""
+        self._map_params[method] = params
+        if self.reduction_cache is not None:
+            cached = self.reduction_cache.get(method, params)
+            if cached is not None:
+                logger.info(f"Loaded cached {method.upper()} coordinates")
+                return cached
+        
+        arrays = compute()
+        model = arrays.pop('model', None)
+        if model is not None:
+            self._map_models[method] = model
+        if self.reduction_cache is not None:
+            self.reduction_cache.put(method, params, **arrays)
+            if model is not None:
+                self.reduction_cache.put_model(method, params, model)
+        return arrays
+    
+    def perform_dimensionality_reduction(self, methods: List[str] = None, n_jobs: int = None,
+                                         tsne_backend: str = None) -> Dict[str, np.ndarray]:
+        """Perform dimensionality reduction using specified methods
+        
+        PCA (config.PCA_N_COMPONENTS) runs first and feeds both t-SNE and UMAP. t-SNE uses
+        the FFT-accelerated openTSNE engine when installed (config.TSNE_BACKEND). n_jobs
+        sets the thread count of every engine.
+        
+        Coordinates (and the PCA basis) are cached on disk, keyed by the embeddings and
+        each method's parameters, so re-runs with unchanged inputs skip the reductions.
+        """
         methods = methods or config.REDUCTION_METHODS
+        n_jobs = n_jobs if n_jobs is not None else config.REDUCTION_N_JOBS
         reduced_embeddings = {}
         
         logger.info("Performing dimensionality reduction...")
         
         # PCA (for preprocessing and standalone visualization)
-        if 'pca' in methods:
+        n_components = min(config.PCA_N_COMPONENTS, *self.embeddings.shape)
+        
+        def compute_pca():
             logger.info("Running PCA...")
-            pca = PCA(n_components=config.PCA_N_COMPONENTS, random_state=42)
-            pca_embeddings = pca.fit_transform(self.embeddings)
-            
+            return run_pca(self.embeddings, n_components)
+        
+        pca_result = self._cached_reduction(
+            'pca', {'n_components': n_components, 'random_state': 42, 'sklearn': backend_version('sklearn')},
+            compute_pca
+        )
+        
+        # Store full PCA (and its basis) as the input of t-SNE and UMAP
+        self.pca_embeddings = pca_result['coords']
+        self.pca_basis = {name: pca_result[name] for name in ('components', 'mean', 'explained_variance_ratio')}
+        
+        if 'pca' in methods:
             # Take first 2 components for visualization
-            reduced_embeddings['pca'] = pca_embeddings[:, :2]
-            
-            # Store full PCA for preprocessing other methods
-            self.pca_embeddings = pca_embeddings
-            
-            logger.info(f"PCA explained variance ratio: {pca.explained_variance_ratio_[:2]}")
+            reduced_embeddings['pca'] = pca_result['coords'][:, :2]
+            logger.info(f"PCA explained variance ratio: {pca_result['explained_variance_ratio'][:2]}")
         
         # t-SNE
         if 'tsne' in methods:
-            logger.info("Running t-SNE...")
+            backend = resolve_tsne_backend(tsne_backend or config.TSNE_BACKEND)
+            perplexity = min(config.TSNE_PERPLEXITY, len(self.embeddings) - 1)
             
-            # Use PCA preprocessing if available for large datasets
-            input_data = self.pca_embeddings if hasattr(self, 'pca_embeddings') else self.embeddings
-            
-            tsne = TSNE(
-                n_components=2,
-                perplexity=min(config.TSNE_PERPLEXITY, len(self.embeddings) - 1),
-                n_iter=config.TSNE_N_ITER,
-                random_state=42,
-                init='pca'
-            )
+            def compute_tsne():
+                logger.info(f"Running t-SNE ({backend}, {effective_n_jobs(n_jobs)} threads)...")
+                coords, model = fit_tsne(self.pca_embeddings, perplexity, config.TSNE_N_ITER, n_jobs, backend)
+                return {'coords': coords, 'model': model}
             
-            tsne_embeddings = tsne.fit_transform(input_data)
-            reduced_embeddings['tsne'] = tsne_embeddings
+            tsne_params = {
+                'perplexity': perplexity, 'n_iter': config.TSNE_N_ITER, 'init': 'pca', 'random_state': 42,
+                'input': f'pca{n_components}', 'backend': backend, 'version': backend_version(backend)
+            }
+            reduced_embeddings['tsne'] = self._cached_reduction('tsne', tsne_params, compute_tsne)['coords']
         
         # UMAP
         if 'umap' in methods and umap:
-            logger.info("Running UMAP...")
+            n_neighbors = min(config.UMAP_N_NEIGHBORS, len(self.embeddings) - 1)
             
-            reducer = umap.UMAP(
-                n_components=2,
-                n_neighbors=min(config.UMAP_N_NEIGHBORS, len(self.embeddings) - 1),
-                min_dist=config.UMAP_MIN_DIST,
-                random_state=42
-            )
+            def compute_umap():
+                logger.info("Running UMAP...")
+                coords, model = fit_umap(self.pca_embeddings, n_neighbors, config.UMAP_MIN_DIST, n_jobs)
+                return {'coords': coords, 'model': model}
             
-            umap_embeddings = reducer.fit_transform(self.embeddings)
-            reduced_embeddings['umap'] = umap_embeddings
+            umap_params = {
+                'n_neighbors': n_neighbors, 'min_dist': config.UMAP_MIN_DIST, 'random_state': 42,
+                'input': f'pca{n_components}', 'version': backend_version('umap')
+            }
+            reduced_embeddings['umap'] = self._cached_reduction('umap', umap_params, compute_umap)['coords']
         
+        self.reduced_embeddings = reduced_embeddings
         return reduced_embeddings
     
-    def create_cluster_scatter_plots(self, reduced_embeddings: Dict[str, np.ndarray]) -> None:
-        """Create scatter plots for each clustering algorithm and reduction method"""
-        logger.info("Creating cluster scatter plots...")
-        
-        # Prepare cluster labels
+    def _map_model(self, method: str) -> Any:
+        """Fitted reducer of a map (None for PCA and scikit-learn t-SNE)"""
+        if method not in self._map_models and self.reduction_cache is not None:
+            self._map_models[method] = self.reduction_cache.get_model(method, self._map_params[method])
+        return self._map_models.get(method)
+    
+    def project_embeddings(self, new_embeddings: np.ndarray) -> Dict[str, np.ndarray]:
+        """Place new posts in the existing 2-D maps without refitting them
+        
+        Uses the stored PCA basis, then the persisted UMAP model / openTSNE embedding;
+        maps without a transform (scikit-learn t-SNE) interpolate from the nearest posts.
+        """
+        new_pca = project_pca(self.pca_basis, new_embeddings)
+        projected = {}
+        for method, coords in self.reduced_embeddings.items():
+            if method == 'pca':
+                projected[method] = new_pca[:, :2]
+            else:
+                projected[method] = transform_coords(self._map_model(method), self.pca_embeddings, coords, new_pca)
+        return projected
+    
+    def _scatter_label_sets(self) -> Dict[str, np.ndarray]:
+        """Label sets drawn in the static scatter plots, by display name"""
         cluster_data = {}
         
         if 'kmeans' in self.clustering_results:
@@ -152,31 +399,40 @@ class ClusteringVisualizer:
         if 'dbscan' in self.clustering_results:
             cluster_data['DBSCAN'] = self.clustering_results['dbscan']['labels']
         
-        # Create plots for each combination
-        for reduction_method, coords in reduced_embeddings.items():
-            for cluster_method, labels in cluster_data.items():
-                self._create_single_scatter_plot(
-                    coords, labels, reduction_method, cluster_method
-                )
+        return cluster_data
     
-    def _create_single_scatter_plot(self, coords: np.ndarray, labels: np.ndarray, 
-                                  reduction_method: str, cluster_method: str) -> None:
+    def create_cluster_scatter_plots(self, reduced_embeddings: Dict[str, np.ndarray]) -> None:
+        """Create scatter plots for each clustering algorithm and reduction method"""
+        logger.info("Creating cluster scatter plots...")
+        
+        self.reduced_embeddings = reduced_embeddings
+        for reduction_method in reduced_embeddings:
+            for cluster_method in self._scatter_label_sets():
+                self._create_single_scatter_plot(reduction_method, cluster_method)
+    
+    def _create_single_scatter_plot(self, reduction_method: str, cluster_method: str) -> None:
         """Create a single scatter plot"""
+        coords = self.reduced_embeddings[reduction_method]
+        labels = self._scatter_label_sets()[cluster_method]
+        
         plt.figure(figsize=config.FIGURE_SIZE)
         
         # Handle noise points in DBSCAN
         unique_labels = np.unique(labels)
         colors = plt.cm.Set3(np.linspace(0, 1, len(unique_labels)))
         
-        for label, color in zip(unique_labels, colors):
-            if label == -1:  # Noise points in DBSCAN
-                mask = labels == label
-                plt.scatter(coords[mask, 0], coords[mask, 1], 
-                          c='black', marker='x', s=20, alpha=0.6, label='Noise')
-            else:
-                mask = labels == label
-                plt.scatter(coords[mask, 0], coords[mask, 1], 
-                          c=[color], s=50, alpha=0.7, label=f'Cluster {label}')
+        if self._use_density_renderer(len(coords)):
+            self._draw_density_scatter(coords, labels, unique_labels, colors)
+        else:
+            for label, color in zip(unique_labels, colors):
+                if label == -1:  # Noise points in DBSCAN
+                    mask = labels == label
+                    plt.scatter(coords[mask, 0], coords[mask, 1], 
+                              c='black', marker='x', s=20, alpha=0.6, label='Noise')
+                else:
+                    mask = labels == label
+                    plt.scatter(coords[mask, 0], coords[mask, 1], 
+                              c=[color], s=50, alpha=0.7, label=f'Cluster {label}')
         
         plt.title(f'{cluster_method} Clustering - {reduction_method.upper()} Visualization')
         plt.xlabel(f'{reduction_method.upper()} Component 1')
@@ -188,60 +444,316 @@ class ClusteringVisualizer:
         
         plt.tight_layout()
         
-        filename = f"cluster_scatter_{reduction_method}_{cluster_method.lower().replace(' ', '_').replace('(', '').replace(')', '')}.{config.PLOT_FORMAT}"
-        filepath = self.plots_dir / filename
+        filepath = self.plots_dir / self._scatter_filename(reduction_method, cluster_method)
         plt.savefig(filepath, dpi=config.DPI, bbox_inches='tight')
         plt.close()
         
         logger.debug(f"Saved plot: {filepath}")
     
-    def create_interactive_plots(self, reduced_embeddings: Dict[str, np.ndarray]) -> None:
-        """Create interactive Plotly visualizations"""
-        logger.info("Creating interactive plots...")
+    @staticmethod
+    def _scatter_filename(reduction_method: str, cluster_method: str) -> str:
+        return f"cluster_scatter_{reduction_method}_{cluster_method.lower().replace(' ', '_').replace('(', '').replace(')', '')}.{config.PLOT_FORMAT}"
+    
+    @staticmethod
+    def _use_density_renderer(n_points: int) -> bool:
+        """Whether static scatter plots of n_points are binned into a pixel grid"""
+        if config.SCATTER_RENDERER == 'auto':
+            return n_points > config.SCATTER_DENSITY_MIN_POINTS
+        return config.SCATTER_RENDERER == 'density'
+    
+    def _draw_density_scatter(self, coords: np.ndarray, labels: np.ndarray,
+                              unique_labels: np.ndarray, colors: np.ndarray) -> None:
+        """Draw all points as one cluster-coloured density image on the current figure"""
+        cluster_colors = colors[unique_labels >= 0]
+        image, extent = rasterize_clusters(coords, labels, cluster_colors,
+                                           resolution=config.SCATTER_DENSITY_RESOLUTION,
+                                           spread=config.SCATTER_DENSITY_SPREAD)
+        plt.imshow(image, extent=extent, origin='lower', aspect='auto', interpolation='nearest')
+        
+        # Legend proxies, matching the point renderer
+        for label, color in zip(unique_labels, colors):
+            if label == -1:
+                plt.scatter([], [], c='grey', marker='s', label='Noise')
+            else:
+                plt.scatter([], [], c=[color], marker='s', label=f'Cluster {label}')
+    
+    def static_plot_jobs(self, reduced_embeddings: Dict[str, np.ndarray]) -> List[PlotJob]:
+        """Every static plot as a small picklable (method name, keyword arguments) spec"""
+        self.reduced_embeddings = reduced_embeddings
+        
+        jobs = [
+            ('_create_single_scatter_plot', {'reduction_method': reduction_method, 'cluster_method': cluster_method})
+            for reduction_method in reduced_embeddings
+            for cluster_method in self._scatter_label_sets()
+        ]
+        jobs += [
+            ('create_cluster_size_plots', {}),
+            ('create_evaluation_metrics_plot', {}),
+            ('create_dendrogram', {})
+        ]
+        jobs += self._word_cloud_jobs()
+        if 'kmeans_optimization' in self.clustering_results:
+            jobs.append(('_plot_kmeans_optimization', {}))
+        if 'dbscan_optimization' in self.clustering_results:
+            jobs.append(('_plot_dbscan_optimization', {}))
+        return jobs
+    
+    def plot_dependencies(self, job: PlotJob) -> Tuple[Path, Dict[str, Any]]:
+        """Output file of a plot job and the inputs it is drawn from (fingerprinted by PlotManifest)"""
+        method, kwargs = job
+        results = self.clustering_results
+        style = {'dpi': config.DPI, 'format': config.PLOT_FORMAT}
+        
+        def section(key: str, fields: List[str]) -> Any:
+            return {field: results[key].get(field) for field in fields} if key in results else None
+        
+        def per_algorithm(fields: List[str]) -> Dict[str, Any]:
+            return {
+                'kmeans': section('kmeans', fields),
+                'dbscan': section('dbscan', fields),
+                'hierarchical': {
+                    linkage_method: {field: result.get(field) for field in fields}
+                    for linkage_method, result in results.get('hierarchical', {}).items()
+                }
+            }
         
-        # Prepare data for plotting
-        plot_data = self.post_data.copy()
+        if method == '_create_single_scatter_plot':
+            reduction_method, cluster_method = kwargs['reduction_method'], kwargs['cluster_method']
+            return self.plots_dir / self._scatter_filename(reduction_method, cluster_method), {
+                'coords': self.reduced_embeddings[reduction_method],
+                'labels': self._scatter_label_sets()[cluster_method],
+                'style': {**style, 'figure_size': config.FIGURE_SIZE, 'renderer': config.SCATTER_RENDERER,
+                          'density': [config.SCATTER_DENSITY_MIN_POINTS, config.SCATTER_DENSITY_RESOLUTION,
+                                      config.SCATTER_DENSITY_SPREAD]}
+            }
+        if method == 'create_cluster_size_plots':
+            return self.plots_dir / f"cluster_sizes_comparison.{config.PLOT_FORMAT}", {
+                'cluster_sizes': per_algorithm(['cluster_sizes']), 'style': style
+            }
+        if method == 'create_evaluation_metrics_plot':
+            return self.plots_dir / f"evaluation_metrics_comparison.{config.PLOT_FORMAT}", {
+                'metrics': per_algorithm(['silhouette_score', 'calinski_harabasz_score', 'davies_bouldin_score']),
+                'style': style
+            }
+        if method == 'create_dendrogram':
+            return self.plots_dir / f"hierarchical_dendrogram.{config.PLOT_FORMAT}", {
+                'centroids': self._kmeans_centroids(), 'style': style
+            }
+        if method == 'create_cluster_word_clouds':
+            return self.plots_dir / f"cluster_wordclouds_kmeans.{config.PLOT_FORMAT}", {
+                'frequencies': self._cluster_word_frequencies(),
+                'sizes': np.bincount(np.asarray(results['kmeans']['labels'])),
+                'wordcloud': [config.WORDCLOUD_SIZE, config.WORDCLOUD_MAX_WORDS],
+                'style': style
+            }
+        if method == '_create_word_cloud_tile':
+            return self._word_cloud_tile_path(kwargs['cluster_id']), {
+                'frequencies': self._cluster_word_frequencies()[kwargs['cluster_id']],
+                'wordcloud': [config.WORDCLOUD_SIZE, config.WORDCLOUD_MAX_WORDS],
+                'format': config.PLOT_FORMAT
+            }
+        if method == '_plot_kmeans_optimization':
+            return self.plots_dir / f"kmeans_optimization.{config.PLOT_FORMAT}", {
+                'optimization': results['kmeans_optimization'], 'style': style
+            }
+        if method == '_plot_dbscan_optimization':
+            return self.plots_dir / f"dbscan_optimization.{config.PLOT_FORMAT}", {
+                'optimization': results['dbscan_optimization'], 'style': style
+            }
+        if method == 'create_interactive_plots':
+            return self.plots_dir / "interactive_dashboard.html", {
+                'coords': kwargs['reduced_embeddings'],
+                'labels': self._dashboard_label_sets(),
+                'hover': self.post_data.reindex(columns=['title', 'word_count', 'publication_date']),
+                'include_plotlyjs': config.DASHBOARD_INCLUDE_PLOTLYJS
+            }
+        if method == 'create_cluster_tree_view':
+            return self.plots_dir / "cluster_tree.html", {
+                'linkage': load_linkage_matrix('ward', self.models_dir),
+                'titles': self.post_data['title'],
+                'labels': section('kmeans', ['labels'])
+            }
+        raise ValueError(f"No dependencies declared for plot job: {method}")
+    
+    def _stale_jobs(self, jobs: List[PlotJob], manifest: PlotManifest,
+                    force: bool = False) -> List[Tuple[PlotJob, Path, Dict[str, str]]]:
+        """Jobs whose output is missing or whose inputs changed since it was built"""
+        stale = []
+        for job in jobs:
+            output, inputs = self.plot_dependencies(job)
+            fingerprints = manifest.fingerprints(inputs)
+            if force or not manifest.is_current(output, fingerprints):
+                reason = 'missing' if not output.exists() else ', '.join(manifest.changed_inputs(output, fingerprints)) or 'forced'
+                logger.debug(f"Rebuilding {output.name} ({reason})")
+                stale.append((job, output, fingerprints))
+        return stale
+    
+    @staticmethod
+    def _output_mtimes(stale: List[Tuple[PlotJob, Path, Dict[str, str]]]) -> Dict[Path, Optional[int]]:
+        return {output: output.stat().st_mtime_ns if output.exists() else None for _, output, _ in stale}
+    
+    @staticmethod
+    def _record_built(manifest: PlotManifest, stale: List[Tuple[PlotJob, Path, Dict[str, str]]],
+                      mtimes_before: Dict[Path, Optional[int]]) -> int:
+        """Store the input fingerprints of every output the jobs (re)wrote; returns how many"""
+        n_written = 0
+        for _, output, fingerprints in stale:
+            if output.exists() and output.stat().st_mtime_ns != mtimes_before[output]:
+                manifest.record(output, fingerprints)
+                n_written += 1
+        manifest.save()
+        return n_written
+    
+    def render_static_plots(self, reduced_embeddings: Dict[str, np.ndarray], n_jobs: int = None,
+                            force: bool = False) -> Dict[str, Any]:
+        """Render the static plots whose inputs changed in a process pool (Agg backend, one figure per job)
+        
+        The visualizer is sent to each worker once; jobs are (method, kwargs) specs, so
+        wall time scales with the number of cores up to the number of plots. Plots whose
+        recorded input fingerprints still match are skipped unless force is set.
+        """
+        jobs = self.static_plot_jobs(reduced_embeddings)
+        manifest = PlotManifest(self.plots_dir)
+        stale = self._stale_jobs(jobs, manifest, force)
+        stale_jobs = [job for job, _, _ in stale]
+        n_skipped = len(jobs) - len(stale_jobs)
+        
+        n_jobs = n_jobs if n_jobs is not None else config.PLOT_N_JOBS
+        n_workers = min(effective_n_jobs(n_jobs), len(stale_jobs))
+        logger.info(f"Rendering {len(stale_jobs)} static plots with {n_workers} worker processes "
+                    f"({n_skipped} unchanged, skipped)...")
+        
+        mtimes_before = self._output_mtimes(stale)
+        start = time.time()
+        if n_workers <= 1:
+            timings = [_run_plot_job(self, job) for job in stale_jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_plot_worker,
+                                     initargs=(self,)) as pool:
+                timings = list(pool.map(_render_plot_job, stale_jobs))
+        elapsed = time.time() - start
+        n_written = self._record_built(manifest, stale, mtimes_before)
+        
+        busy = sum(seconds for _, seconds in timings)
+        logger.info(f"Rendered {n_written} plots in {elapsed:.1f}s ({busy:.1f}s of rendering work)")
+        return {'n_plots': n_written, 'n_skipped': n_skipped, 'n_workers': n_workers,
+                'elapsed_seconds': elapsed, 'render_seconds': busy}
+    
+    def render_interactive_plots(self, reduced_embeddings: Dict[str, np.ndarray], force: bool = False) -> Dict[str, Any]:
+        """Write the dashboard and the cluster tree view if their inputs changed"""
+        jobs = [
+            ('create_interactive_plots', {'reduced_embeddings': reduced_embeddings}),
+            ('create_cluster_tree_view', {})
+        ]
+        manifest = PlotManifest(self.plots_dir)
+        stale = self._stale_jobs(jobs, manifest, force)
+        
+        mtimes_before = self._output_mtimes(stale)
+        for job, _, _ in stale:
+            _run_plot_job(self, job)
+        n_written = self._record_built(manifest, stale, mtimes_before)
+        return {'n_plots': n_written, 'n_skipped': len(jobs) - len(stale)}
+    
+    def _dashboard_label_sets(self) -> Dict[str, np.ndarray]:
+        """Label sets offered in the interactive dashboard, by display name"""
+        cluster_data = self._scatter_label_sets()
+        for key, name in (('graph', 'Graph communities'), ('consensus', 'Consensus')):
+            if key in self.clustering_results:
+                cluster_data[name] = self.clustering_results[key]['labels']
+        return cluster_data
+    
+    def create_interactive_plots(self, reduced_embeddings: Dict[str, np.ndarray], new_posts: pd.DataFrame = None,
+                                 new_coords: Dict[str, np.ndarray] = None) -> Path:
+        """Create the interactive dashboard: one HTML file with a WebGL scatter of all posts
+        
+        Every map and label set is embedded once as base64 typed arrays; dropdowns switch
+        them client-side, so there is a single copy of plotly.js and no per-view file.
+        new_posts (title, kmeans_cluster) placed at new_coords are drawn on top of the
+        existing layout as a separate trace.
+        """
+        logger.info("Creating interactive dashboard...")
+        
+        label_sets = self._dashboard_label_sets()
+        if not reduced_embeddings or not label_sets:
+            logger.warning("No maps or label sets available for the interactive dashboard")
+            return None
+        
+        maps = list(reduced_embeddings)
+        initial_map, initial_labels = maps[0], next(iter(label_sets))
+        
+        # Hover text: title, word count and date
+        hover = self.post_data.reindex(columns=['title', 'word_count', 'publication_date']).fillna('').astype(str)
+        
+        data = {
+            'maps': {
+                method: {
+                    'x': _b64_array(coords[:, 0], np.float32),
+                    'y': _b64_array(coords[:, 1], np.float32),
+                    'new_x': _b64_array(new_coords[method][:, 0], np.float32) if new_coords else None,
+                    'new_y': _b64_array(new_coords[method][:, 1], np.float32) if new_coords else None
+                }
+                for method, coords in reduced_embeddings.items()
+            },
+            'labels': {
+                name: {'values': _b64_array(labels, np.int32), **_discrete_color_axis(labels)}
+                for name, labels in label_sets.items()
+            }
+        }
+        
+        fig = go.Figure(go.Scattergl(
+            x=reduced_embeddings[initial_map][:, 0].astype(np.float32),
+            y=reduced_embeddings[initial_map][:, 1].astype(np.float32),
+            mode='markers',
+            name=f'Posts ({len(hover)})',
+            customdata=hover.to_numpy(),
+            hovertemplate='%{customdata[0]}<br>Cluster %{marker.color}<br>'
+                          '%{customdata[1]} words, %{customdata[2]}<extra></extra>',
+            marker=dict(
+                size=5 if len(hover) > 10000 else 8,
+                opacity=0.8,
+                color=np.asarray(label_sets[initial_labels], dtype=np.int32),
+                showscale=False,
+                **_discrete_color_axis(label_sets[initial_labels])
+            )
+        ))
+        
+        if new_posts is not None and len(new_posts):
+            fig.add_trace(go.Scattergl(
+                x=new_coords[initial_map][:, 0],
+                y=new_coords[initial_map][:, 1],
+                mode='markers',
+                marker=dict(symbol='star', size=12, color='black'),
+                name=f'New posts ({len(new_posts)})',
+                text=new_posts['title'],
+                customdata=new_posts['kmeans_cluster'],
+                hovertemplate='%{text}<br>Cluster %{customdata} (assigned)<extra></extra>'
+            ))
+        
+        def dropdown(name: str, options: List[str], x: float) -> Dict[str, Any]:
+            return dict(
+                name=name, type='dropdown', x=x, y=1.12, xanchor='left', yanchor='top', showactive=True,
+                buttons=[dict(label=option.upper() if name == 'map' else option, method='skip', args=[option])
+                         for option in options]
+            )
         
-        # Add cluster labels
-        if 'kmeans' in self.clustering_results:
-            plot_data['kmeans_cluster'] = self.clustering_results['kmeans']['labels']
+        fig.update_layout(
+            title=f'Blog Posts Clustering ({len(hover)} posts)',
+            width=1100,
+            height=750,
+            showlegend=True,
+            xaxis_title=f'{initial_map.upper()} Component 1',
+            yaxis_title=f'{initial_map.upper()} Component 2',
+            updatemenus=[dropdown('map', maps, 0.0), dropdown('labels', list(label_sets), 0.15)]
+        )
         
-        if 'dbscan' in self.clustering_results:
-            plot_data['dbscan_cluster'] = self.clustering_results['dbscan']['labels']
+        script = DASHBOARD_SCRIPT.replace('__DATA__', json.dumps(data)).replace(
+            '__INITIAL__', json.dumps({'map': initial_map, 'labels': initial_labels})
+        )
+        filepath = self.plots_dir / "interactive_dashboard.html"
+        fig.write_html(str(filepath), include_plotlyjs=config.DASHBOARD_INCLUDE_PLOTLYJS, post_script=script)
         
-        # Create interactive plots for each reduction method
-        for reduction_method, coords in reduced_embeddings.items():
-            plot_data[f'{reduction_method}_x'] = coords[:, 0]
-            plot_data[f'{reduction_method}_y'] = coords[:, 1]
-            
-            # Create plotly figure
-            if 'kmeans_cluster' in plot_data.columns:
-                fig = px.scatter(
-                    plot_data,
-                    x=f'{reduction_method}_x',
-                    y=f'{reduction_method}_y',
-                    color='kmeans_cluster',
-                    hover_data=['title', 'word_count', 'publication_date'],
-                    title=f'Blog Posts Clustering - {reduction_method.upper()} Visualization (K-means)',
-                    labels={
-                        f'{reduction_method}_x': f'{reduction_method.upper()} Component 1',
-                        f'{reduction_method}_y': f'{reduction_method.upper()} Component 2',
-                        'kmeans_cluster': 'Cluster'
-                    }
-                )
-                
-                fig.update_layout(
-                    width=1000,
-                    height=700,
-                    showlegend=True
-                )
-                
-                # Save interactive plot
-                filename = f"interactive_clusters_{reduction_method}_kmeans.html"
-                filepath = self.plots_dir / filename
-                fig.write_html(str(filepath))
-                
-                logger.debug(f"Saved interactive plot: {filepath}")
+        logger.info(f"Saved interactive dashboard ({len(maps)} maps x {len(label_sets)} label sets): {filepath}")
+        return filepath
     
     def create_cluster_size_plots(self) -> None:
         """Create bar plots showing cluster sizes for different algorithms"""
@@ -398,35 +910,44 @@ class ClusteringVisualizer:
         
         logger.debug(f"Saved evaluation metrics plot: {filepath}")
     
-    def create_dendrogram(self, max_samples: int = 100) -> None:
-        """Create hierarchical clustering dendrogram"""
-        if len(self.embeddings) > max_samples:
-            logger.info(f"Creating dendrogram with {max_samples} samples (subset of {len(self.embeddings)})")
-            # Sample posts for dendrogram
-            indices = np.random.choice(len(self.embeddings), max_samples, replace=False)
-            sample_embeddings = self.embeddings[indices]
-            sample_titles = self.post_data.iloc[indices]['title'].tolist()
-        else:
-            logger.info("Creating dendrogram with all samples")
-            sample_embeddings = self.embeddings
-            sample_titles = self.post_data['title'].tolist()
+    def _kmeans_centroids(self) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """(cluster ids, sizes, centroids) of the K-means clusters in embedding space"""
+        if 'kmeans' not in self.clustering_results:
+            return None
+        labels = np.asarray(self.clustering_results['kmeans']['labels'])
+        clusters, sizes = np.unique(labels, return_counts=True)
+        centroids = np.vstack([self.embeddings[labels == cluster].mean(axis=0) for cluster in clusters])
+        return clusters, sizes, centroids
+    
+    def create_dendrogram(self) -> None:
+        """Create the cluster-level dendrogram: Ward tree over K-means centroids weighted by size
+        
+        Built from the K centroids rather than a sample of posts, so it is deterministic and
+        renders in the same time at any corpus size. The full post-level tree is in
+        cluster_tree.html (create_cluster_tree_view).
+        """
+        kmeans_clusters = self._kmeans_centroids()
+        if kmeans_clusters is None or len(kmeans_clusters[0]) < 2:
+            logger.info("Fewer than two K-means clusters, skipping dendrogram")
+            return
+        clusters, sizes, centroids = kmeans_clusters
         
-        # Calculate linkage
-        linkage_matrix = linkage(sample_embeddings, method='ward')
+        logger.info(f"Creating centroid dendrogram ({len(clusters)} clusters, {sizes.sum()} posts)")
+        linkage_matrix = weighted_centroid_linkage(centroids, sizes)
         
-        # Create dendrogram
-        plt.figure(figsize=(15, 8))
+        # Create dendrogram (one row per cluster)
+        plt.figure(figsize=(12, max(6, 0.3 * len(clusters))))
         
         dendrogram(
             linkage_matrix,
-            labels=sample_titles,
-            leaf_rotation=90,
+            labels=[f'Cluster {cluster} (n={size})' for cluster, size in zip(clusters, sizes)],
+            orientation='left',
             leaf_font_size=8
         )
         
-        plt.title('Hierarchical Clustering Dendrogram')
-        plt.xlabel('Blog Posts')
-        plt.ylabel('Distance')
+        plt.title('Cluster Dendrogram (Ward over K-means centroids, weighted by cluster size)')
+        plt.xlabel('Ward distance')
+        plt.ylabel('K-means clusters')
         plt.tight_layout()
         
         filename = f"hierarchical_dendrogram.{config.PLOT_FORMAT}"
@@ -436,79 +957,106 @@ class ClusteringVisualizer:
         
         logger.debug(f"Saved dendrogram: {filepath}")
     
-    def create_cluster_word_clouds(self) -> None:
-        """Create word clouds for each cluster (if wordcloud is available)"""
-        try:
-            from wordcloud import WordCloud
-        except ImportError:
+    def create_cluster_tree_view(self) -> Optional[Path]:
+        """Write cluster_tree.html: the stored full-corpus Ward tree as an expandable outline
+        
+        Nodes are rendered in the browser only when expanded, so the page opens instantly
+        for any number of posts. Requires the tree stored by clustering_analysis.py.
+        """
+        linkage_matrix = load_linkage_matrix('ward', self.models_dir)
+        if linkage_matrix is None or len(linkage_matrix) != len(self.embeddings) - 1:
+            logger.info("No stored Ward linkage tree for these posts, skipping cluster tree view")
+            return None
+        
+        data = {
+            'left': linkage_matrix[:, 0].astype(int).tolist(),
+            'right': linkage_matrix[:, 1].astype(int).tolist(),
+            'heights': np.round(linkage_matrix[:, 2], 4).tolist(),
+            'counts': linkage_matrix[:, 3].astype(int).tolist(),
+            'titles': self.post_data['title'].fillna('').astype(str).tolist(),
+            'clusters': (np.asarray(self.clustering_results['kmeans']['labels']).tolist()
+                         if 'kmeans' in self.clustering_results else None)
+        }
+        html = CLUSTER_TREE_TEMPLATE.replace('__DATA__', json.dumps(data).replace('</', '<\\/'))
+        
+        filepath = self.plots_dir / "cluster_tree.html"
+        filepath.write_text(html, encoding='utf-8')
+        logger.info(f"Saved cluster tree view ({len(self.embeddings)} posts): {filepath}")
+        return filepath
+    
+    def _cluster_word_frequencies(self) -> Dict[int, Dict[str, int]]:
+        """Top terms and counts of each K-means cluster, from the shared cached term matrix"""
+        if self._word_frequencies is None:
+            term_matrix = CorpusTermMatrix.from_post_data(self.post_data, use_cache=self.reduction_cache is not None)
+            self._word_frequencies = term_matrix.cluster_frequencies(
+                self.clustering_results['kmeans']['labels'], config.WORDCLOUD_FIELD, config.WORDCLOUD_MAX_WORDS
+            )
+        return self._word_frequencies
+    
+    def _word_cloud_tile_path(self, cluster_id: int) -> Path:
+        return self.plots_dir / "wordclouds" / f"wordcloud_kmeans_cluster_{cluster_id}.{config.PLOT_FORMAT}"
+    
+    def _word_cloud_jobs(self) -> List[PlotJob]:
+        """One grid job, or one job per cluster with WORDCLOUD_TILES (rendered in parallel by the plot pool)"""
+        if WordCloud is None:
+            logger.warning("WordCloud not available, skipping word cloud generation")
+            return []
+        if 'kmeans' not in self.clustering_results:
+            return []
+        
+        if config.WORDCLOUD_TILES:
+            return [
+                ('_create_word_cloud_tile', {'cluster_id': cluster_id})
+                for cluster_id, frequencies in self._cluster_word_frequencies().items() if frequencies
+            ]
+        return [('create_cluster_word_clouds', {})]
+    
+    def _create_word_cloud_tile(self, cluster_id: int) -> None:
+        """Save the word cloud of one K-means cluster as its own image"""
+        filepath = self._word_cloud_tile_path(cluster_id)
+        filepath.parent.mkdir(exist_ok=True)
+        plt.imsave(filepath, _word_cloud_image(self._cluster_word_frequencies()[cluster_id]))
+        
+        logger.debug(f"Saved word cloud: {filepath}")
+    
+    def create_cluster_word_clouds(self, n_jobs: int = None) -> None:
+        """Create one figure with the word cloud of every K-means cluster
+        
+        Clouds are drawn from cached per-cluster term frequencies and generated in
+        parallel processes; the figure only arranges the finished images. Inside a
+        plot worker the clouds are generated serially, so pools are never nested.
+        """
+        if WordCloud is None:
             logger.warning("WordCloud not available, skipping word cloud generation")
             return
         
         logger.info("Creating cluster word clouds...")
         
-        # Only create word clouds for K-means for now
-        if 'kmeans' not in self.clustering_results:
+        frequencies = {cluster_id: terms for cluster_id, terms in self._cluster_word_frequencies().items() if terms}
+        if not frequencies:
             return
+        sizes = np.bincount(np.asarray(self.clustering_results['kmeans']['labels']))
         
-        labels = self.clustering_results['kmeans']['labels']
-        cluster_analysis = self.clustering_results['kmeans'].get('cluster_analysis', {})
+        if _worker_visualizer is not None:
+            n_jobs = 1
+        elif n_jobs is None:
+            n_jobs = config.WORDCLOUD_N_JOBS
+        images = Parallel(n_jobs=n_jobs)(delayed(_word_cloud_image)(terms) for terms in frequencies.values())
         
-        unique_clusters = np.unique(labels)
-        
-        # Create subplot grid
-        n_clusters = len(unique_clusters)
-        cols = min(3, n_clusters)
+        # Near-square grid of clouds, each at its native pixel size
+        n_clusters = len(images)
+        cols = int(np.ceil(np.sqrt(n_clusters)))
         rows = (n_clusters + cols - 1) // cols
+        width, height = config.WORDCLOUD_SIZE
         
-        fig, axes = plt.subplots(rows, cols, figsize=(5*cols, 4*rows))
-        if n_clusters == 1:
-            axes = [axes]
-        elif rows == 1:
-            axes = axes.reshape(1, -1)
+        fig, axes = plt.subplots(rows, cols, figsize=(cols * width / config.DPI, rows * (height / config.DPI + 0.3)),
+                                 squeeze=False)
+        for ax in axes.flat:
+            ax.axis('off')
         
-        for i, cluster_id in enumerate(unique_clusters):
-            row = i // cols
-            col = i % cols
-            
-            # Get cluster posts
-            cluster_mask = labels == cluster_id
-            cluster_posts = self.post_data[cluster_mask]
-            
-            # Combine titles and extract sample content
-            text_data = ' '.join(cluster_posts['title'].fillna('').astype(str))
-            
-            if text_data.strip():
-                # Create word cloud
-                wordcloud = WordCloud(
-                    width=400, 
-                    height=300, 
-                    background_color='white',
-                    colormap='viridis',
-                    max_words=50
-                ).generate(text_data)
-                
-                if rows > 1:
-                    ax = axes[row, col]
-                else:
-                    ax = axes[col]
-                
-                ax.imshow(wordcloud, interpolation='bilinear')
-                ax.set_title(f'Cluster {cluster_id} ({len(cluster_posts)} posts)')
-                ax.axis('off')
-            else:
-                if rows > 1:
-                    axes[row, col].set_visible(False)
-                else:
-                    axes[col].set_visible(False)
-        
-        # Hide unused subplots
-        for i in range(n_clusters, rows * cols):
-            row = i // cols
-            col = i % cols
-            if rows > 1:
-                axes[row, col].set_visible(False)
-            else:
-                axes[col].set_visible(False)
+        for ax, cluster_id, image in zip(axes.flat, frequencies, images):
+            ax.imshow(image, interpolation='bilinear')
+            ax.set_title(f'Cluster {cluster_id} ({sizes[cluster_id]} posts)', fontsize=8)
         
         plt.tight_layout()
         
@@ -663,13 +1211,9 @@ def load_data_and_results(
     post_data = pd.read_csv(posts_file)
     post_data = post_data[post_data['extraction_success'] == True].copy()
     
-    # Load clustering results
-    results_file = results_file or str(data_dir / "clustering_results.json")
-    if not os.path.exists(results_file):
-        raise FileNotFoundError(f"Clustering results not found: {results_file}")
-    
-    with open(results_file, 'r') as f:
-        clustering_results = json.load(f)
+    # Load clustering results (metrics summary + lazily loaded label arrays)
+    store = ClusteringResultStore(data_dir, summary_file=results_file)
+    clustering_results = store.results()
     
     logger.info(f"Loaded data: {len(embeddings)} embeddings, {len(post_data)} posts")
     
@@ -680,29 +1224,82 @@ def create_all_visualizations(
     embeddings: np.ndarray,
     post_data: pd.DataFrame,
     clustering_results: Dict,
-    methods: List[str] = None
-) -> None:
-    """Create all visualizations"""
+    methods: List[str] = None,
+    use_cache: bool = True,
+    n_jobs: int = None,
+    tsne_backend: str = None,
+    force: bool = False,
+    data_dir: str = None
+) -> Dict[str, int]:
+    """Create all visualizations whose inputs changed (force=True rebuilds everything)
+    
+    Returns the number of plots rebuilt and skipped.
+    """
     methods = methods or config.REDUCTION_METHODS
     
-    visualizer = ClusteringVisualizer(embeddings, post_data, clustering_results)
+    visualizer = ClusteringVisualizer(embeddings, post_data, clustering_results, use_cache=use_cache,
+                                      data_dir=data_dir)
     
     # Perform dimensionality reduction
     logger.info("Performing dimensionality reduction...")
-    reduced_embeddings = visualizer.perform_dimensionality_reduction(methods)
+    reduced_embeddings = visualizer.perform_dimensionality_reduction(methods, n_jobs=n_jobs, tsne_backend=tsne_backend)
     
     # Create all visualizations
     logger.info("Creating visualizations...")
     
-    visualizer.create_cluster_scatter_plots(reduced_embeddings)
-    visualizer.create_interactive_plots(reduced_embeddings)
-    visualizer.create_cluster_size_plots()
-    visualizer.create_evaluation_metrics_plot()
-    visualizer.create_dendrogram()
-    visualizer.create_cluster_word_clouds()
-    visualizer.create_optimization_plots()
+    static = visualizer.render_static_plots(reduced_embeddings, n_jobs=n_jobs, force=force)
+    interactive = visualizer.render_interactive_plots(reduced_embeddings, force=force)
     
     logger.info(f"All visualizations saved to: {visualizer.plots_dir}")
+    return {
+        'n_rebuilt': static['n_plots'] + interactive['n_plots'],
+        'n_skipped': static['n_skipped'] + interactive['n_skipped']
+    }
+
+
+def update_maps_with_new_posts(data_dir: str = None, methods: List[str] = None, tsne_backend: str = None) -> Dict[str, Any]:
+    """Project posts added by assign_posts.py into the existing maps and rewrite the interactive plots
+    
+    The fitted layout comes from the reduction cache (no refit); only the new posts are projected.
+    """
+    from assign_posts import load_assigned_embeddings
+    
+    data_dir = Path(data_dir or config.OUTPUT_DIR)
+    embeddings, post_data, clustering_results = load_data_and_results(data_dir=data_dir)
+    
+    cluster_labels = pd.read_csv(data_dir / "cluster_labels.csv")
+    if 'assigned_at' not in cluster_labels.columns:
+        cluster_labels['assigned_at'] = np.nan
+    assigned_mask = cluster_labels['assigned_at'].notna()
+    new_posts = cluster_labels[assigned_mask].copy()
+    
+    # Posts the maps were fitted on, in embedding order
+    fitted_ids = set(cluster_labels.loc[~assigned_mask, 'post_id'].astype(str))
+    post_data = post_data[post_data['post_id'].astype(str).isin(fitted_ids)]
+    
+    visualizer = ClusteringVisualizer(embeddings, post_data, clustering_results, data_dir=data_dir)
+    reduced_embeddings = visualizer.perform_dimensionality_reduction(methods, tsne_backend=tsne_backend)
+    if new_posts.empty:
+        logger.info("No assigned posts to project")
+        return {'n_new': 0, 'methods': list(reduced_embeddings)}
+    
+    stored = load_assigned_embeddings(data_dir)
+    new_posts = new_posts[new_posts['post_id'].astype(str).isin(stored)]
+    new_embeddings = np.vstack([stored[post_id] for post_id in new_posts['post_id'].astype(str)])
+    
+    start = time.time()
+    new_coords = visualizer.project_embeddings(new_embeddings)
+    projection_seconds = time.time() - start
+    logger.info(f"Projected {len(new_posts)} new posts into {len(new_coords)} maps in {projection_seconds * 1000:.0f} ms")
+    
+    dashboard = visualizer.create_interactive_plots(reduced_embeddings, new_posts=new_posts, new_coords=new_coords)
+    
+    # The dashboard now differs from what its tracked inputs produce; the next full run rebuilds it
+    if dashboard is not None:
+        manifest = PlotManifest(visualizer.plots_dir)
+        manifest.forget(dashboard)
+        manifest.save()
+    return {'n_new': len(new_posts), 'methods': list(new_coords), 'projection_seconds': projection_seconds}
 
 
 def main():
@@ -713,7 +1310,7 @@ def main():
     )
     parser.add_argument(
         '--results-file',
-        help="Path to clustering results JSON file"
+        help="Path to clustering results JSON summary (arrays are read from the npz next to it)"
     )
     parser.add_argument(
         '--data-dir',
@@ -727,9 +1324,47 @@ def main():
         default=['pca', 'tsne', 'umap'],
         help="Dimensionality reduction methods to use"
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="Recompute PCA/t-SNE/UMAP instead of reusing cached coordinates"
+    )
+    parser.add_argument(
+        '--n-jobs',
+        type=int,
+        default=config.PLOT_N_JOBS,
+        help="Worker processes for static plot rendering and threads for t-SNE/UMAP (-1 = all cores)"
+    )
+    parser.add_argument(
+        '--tsne-backend',
+        choices=TSNE_BACKENDS,
+        default=config.TSNE_BACKEND,
+        help="t-SNE engine (opentsne = FFT-accelerated and multithreaded, needs openTSNE)"
+    )
+    
+    parser.add_argument(
+        '--rebuild-all',
+        action='store_true',
+        help="Rebuild every plot, even those whose inputs are unchanged since the last run"
+    )
+    
+    parser.add_argument(
+        '--update-new-posts',
+        action='store_true',
+        help="Only project posts added by assign_posts.py into the existing maps and update the interactive plots"
+    )
     
     args = parser.parse_args()
     
+    if args.update_new_posts:
+        try:
+            update = update_maps_with_new_posts(args.data_dir, args.methods, args.tsne_backend)
+        except Exception as e:
+            logger.error(f"Map update failed: {e}")
+            sys.exit(1)
+        print(f"Projected {update['n_new']} new posts into the {', '.join(update['methods'])} maps")
+        return
+    
     try:
         # Load data
         logger.info("Loading data and results...")
@@ -741,23 +1376,29 @@ def main():
         
         # Create visualizations
         logger.info("Creating all visualizations...")
-        create_all_visualizations(
+        build = create_all_visualizations(
             embeddings,
             post_data,
             clustering_results,
-            methods=args.methods
+            methods=args.methods,
+            use_cache=not args.no_cache,
+            n_jobs=args.n_jobs,
+            tsne_backend=args.tsne_backend,
+            force=args.rebuild_all,
+            data_dir=args.data_dir
         )
         
         print("\n" + "="*60)
         print("VISUALIZATION GENERATION COMPLETED")
         print("="*60)
         print(f"All plots saved to: {Path(config.OUTPUT_DIR) / 'plots'}")
+        print(f"Rebuilt {build['n_rebuilt']} plots, skipped {build['n_skipped']} with unchanged inputs")
         print("\nGenerated visualizations:")
         print("- Cluster scatter plots (static)")
-        print("- Interactive cluster plots (HTML)")
+        print("- Interactive dashboard (HTML, all maps and label sets)")
         print("- Cluster size comparisons")
         print("- Evaluation metrics comparison")
-        print("- Hierarchical clustering dendrogram")
+        print("- Cluster dendrogram (K-means centroids) and expandable full tree (HTML)")
         print("- Cluster word clouds")
         print("- Algorithm optimization plots")
         